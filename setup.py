@@ -32,6 +32,10 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={
+        # Faster fuzzy keyword matching; fuzzywuzzy is used when absent
+        "fast": ["rapidfuzz>=2.0.0"],
+    },
     entry_points={
         "console_scripts": [
             "yeodam=travel_recommender:main",
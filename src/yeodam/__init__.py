@@ -7,7 +7,10 @@ AI 기반 여행지 추천 및 맛집 검색 패키지
 __version__ = "1.0.0"
 __author__ = "Yeodam Team"
 
-from .config import Config, CATEGORY_MAPPINGS
+from typing import TYPE_CHECKING
+from ._lazy import lazy_exports
+
+from .config import Config, CATEGORY_MAPPINGS, KOREAN_LOCATIONS
 from .exceptions import (
     YeodamError, 
     APIError, 
@@ -16,13 +19,53 @@ from .exceptions import (
     TranslationError,
     KeywordProcessingError
 )
-from .services import GeocodingService, PlacesService, TranslationService
-from .processors import KeywordProcessor
-from .utils import DisplayService
+
+# Everything beyond configuration and exceptions is imported on first access
+# (PEP 562), so ``import yeodam`` stays fast for short-lived processes
+_LAZY_ATTRS = {
+    "Place": ".models",
+    "PlaceBatch": ".models",
+    "BatchRunner": ".batch",
+    "BatchQuery": ".batch",
+    "RecommendationApp": ".server",
+    "GeocodingService": ".services",
+    "PlacesService": ".services",
+    "TranslationService": ".services",
+    "HttpClient": ".services",
+    "AsyncGeocodingService": ".services",
+    "AsyncPlacesService": ".services",
+    "AsyncTranslationService": ".services",
+    "KeywordProcessor": ".processors",
+    "AsyncKeywordProcessor": ".processors",
+    "DisplayService": ".utils"
+}
+
+if TYPE_CHECKING:
+    from .models import Place, PlaceBatch
+    from .batch import BatchRunner, BatchQuery
+    from .server import RecommendationApp
+    from .services import (
+        GeocodingService,
+        PlacesService,
+        TranslationService,
+        HttpClient,
+        AsyncGeocodingService,
+        AsyncPlacesService,
+        AsyncTranslationService
+    )
+    from .processors import KeywordProcessor, AsyncKeywordProcessor
+    from .utils import DisplayService
+
 
 __all__ = [
     "Config",
     "CATEGORY_MAPPINGS", 
+    "KOREAN_LOCATIONS",
+    "Place",
+    "PlaceBatch",
+    "BatchRunner",
+    "BatchQuery",
+    "RecommendationApp",
     "YeodamError",
     "APIError",
     "ConfigurationError",
@@ -32,6 +75,13 @@ __all__ = [
     "GeocodingService",
     "PlacesService",
     "TranslationService",
+    "HttpClient",
+    "AsyncGeocodingService",
+    "AsyncPlacesService",
+    "AsyncTranslationService",
     "KeywordProcessor",
+    "AsyncKeywordProcessor",
     "DisplayService"
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_ATTRS, __all__)
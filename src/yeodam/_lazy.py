@@ -0,0 +1,35 @@
+"""Lazy package exports (PEP 562)."""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+def lazy_exports(package: str, lazy_attrs: Dict[str, str],
+                 exported: Sequence[str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` for a package.
+
+    Each name in ``lazy_attrs`` is imported from its (relative) submodule on
+    first access and then stored on the package, so later lookups are plain
+    attribute reads.
+
+    Args:
+        package: The package's ``__name__``
+        lazy_attrs: Mapping of exported name to relative submodule
+        exported: The package's ``__all__``
+
+    Returns:
+        Tuple of (__getattr__, __dir__) functions
+    """
+    def __getattr__(name: str) -> Any:
+        module = lazy_attrs.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exported))
+
+    return __getattr__, __dir__
@@ -0,0 +1,435 @@
+"""Batch recommendation runs over files of queries."""
+
+import csv
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from .config import Config
+from .exceptions import ConfigurationError
+
+@dataclass(frozen=True)
+class BatchQuery:
+    """One recommendation request of a batch."""
+
+    query_id: str
+    location: str
+    preferences: Tuple[str, ...]
+    radius: Optional[int] = None
+    max_results: Optional[int] = None
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any], line_number: Optional[int] = None) -> "BatchQuery":
+        """
+        Build a query from a CSV row or JSON object.
+
+        ``preferences`` may be a list or a comma-separated string; ``radius``
+        and ``max_results`` are optional. Without an ``id`` the query is
+        identified by its contents, so resumed runs recognize it again.
+
+        Args:
+            record: Mapping with location, preferences and optional id, radius, max_results
+            line_number: Line of the record in its file, if any, for error messages
+
+        Returns:
+            BatchQuery instance
+
+        Raises:
+            ValueError: If the location or preferences are missing or invalid
+        """
+        location = str(record.get("location") or "").strip()
+        preferences = record.get("preferences") or []
+        if isinstance(preferences, str):
+            preferences = preferences.split(",")
+        preferences = tuple(p.strip() for p in preferences if isinstance(p, str) and p.strip())
+        if not location or not preferences:
+            raise ValueError(f"{_line_prefix(line_number)}지역과 선호 키워드가 필요합니다.")
+
+        radius = _optional_int(record.get("radius"), "radius", line_number)
+        max_results = _optional_int(record.get("max_results"), "max_results", line_number)
+        query_id = str(record.get("id") or "").strip() or "|".join(
+            [location, ",".join(preferences), str(radius or ""), str(max_results or "")]
+        )
+        return cls(query_id, location, preferences, radius, max_results)
+
+def _line_prefix(line_number: Optional[int]) -> str:
+    """Error message prefix naming the input line, if known."""
+    return f"{line_number}번째 줄: " if line_number is not None else ""
+
+def _optional_int(value: Any, field: str, line_number: Optional[int]) -> Optional[int]:
+    """Parse an optional positive integer field."""
+    if value is None or value == "":
+        return None
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        number = 0
+    if number <= 0:
+        raise ValueError(f"{_line_prefix(line_number)}{field} 값이 올바르지 않습니다: {value!r}")
+    return number
+
+@dataclass(frozen=True)
+class InvalidQuery:
+    """A malformed input record, reported instead of aborting the batch."""
+
+    line_number: int
+    message: str
+
+def read_queries(path: str, strict: bool = True) -> Iterator[Union[BatchQuery, InvalidQuery]]:
+    """
+    Read queries lazily from a CSV or JSON Lines file.
+
+    CSV files need a header row with at least ``location`` and
+    ``preferences`` columns; any other extension is read as JSON Lines.
+
+    Args:
+        path: Input file path
+        strict: Raise on the first malformed record; if False, malformed
+            records are yielded as InvalidQuery and reading continues
+
+    Yields:
+        Queries (and, unless strict, invalid records) in file order
+
+    Raises:
+        ValueError: If a record is malformed and strict is True
+    """
+    for line_number, record in _read_records(path):
+        try:
+            if isinstance(record, ValueError):
+                raise record
+            yield BatchQuery.from_record(record, line_number)
+        except ValueError as e:
+            if strict:
+                raise
+            yield InvalidQuery(line_number, str(e))
+
+def _read_records(path: str) -> Iterator[Tuple[int, Union[Dict[str, Any], ValueError]]]:
+    """Yield (line number, record) pairs; unparsable lines yield a ValueError instead."""
+    if path.lower().endswith(".csv"):
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            yield from enumerate(csv.DictReader(f), start=2)
+        return
+
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, ValueError(f"{line_number}번째 줄: JSON 형식이 올바르지 않습니다: {str(e)}")
+                continue
+            if not isinstance(record, dict):
+                yield line_number, ValueError(f"{line_number}번째 줄: JSON 객체가 필요합니다.")
+                continue
+            yield line_number, record
+
+class ResultWriter(ABC):
+    """
+    Interface for batch output sinks.
+
+    ``write`` and ``close`` return the query IDs whose results have become
+    durable, i.e. safe to record in the checkpoint.
+    """
+
+    @abstractmethod
+    def write(self, record: Dict[str, Any]) -> List[str]:
+        """Write one result record."""
+
+    def close(self) -> List[str]:
+        """Flush buffered records and release the output."""
+        return []
+
+class JSONLResultWriter(ResultWriter):
+    """Append one JSON object per result line, durable as soon as it is written."""
+
+    def __init__(self, path: str, append: bool = True):
+        self.path = path
+        self._file = open(path, "a" if append else "w", encoding="utf-8")
+
+    def write(self, record: Dict[str, Any]) -> List[str]:
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return [record["query_id"]]
+
+    def close(self) -> List[str]:
+        self._file.close()
+        return []
+
+class ParquetResultWriter(ResultWriter):
+    """
+    Parquet dataset directory with one part file per ``rows_per_file`` results.
+
+    A Parquet file is only readable once its footer is written, so results
+    are buffered and become durable when their part file is complete. Part
+    files are written under a temporary name and renamed into place.
+    Requires pyarrow.
+    """
+
+    def __init__(self, path: str, rows_per_file: Optional[int] = None, append: bool = True):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ConfigurationError("Parquet 출력에는 pyarrow 패키지가 필요합니다.")
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self._schema = _parquet_schema(pyarrow)
+
+        self.path = path
+        self.rows_per_file = rows_per_file or Config.BATCH_CHECKPOINT_EVERY
+        os.makedirs(path, exist_ok=True)
+        if not append:
+            for name in os.listdir(path):
+                if name.startswith("part-") and name.endswith(".parquet"):
+                    os.remove(os.path.join(path, name))
+
+        self._prefix = f"part-{time.strftime('%Y%m%d%H%M%S')}-{os.getpid()}"
+        self._parts = 0
+        self._rows: List[Dict[str, Any]] = []
+
+    def write(self, record: Dict[str, Any]) -> List[str]:
+        self._rows.append(record)
+        if len(self._rows) >= self.rows_per_file:
+            return self._flush()
+        return []
+
+    def close(self) -> List[str]:
+        return self._flush()
+
+    def _flush(self) -> List[str]:
+        """Write the buffered rows as one complete part file."""
+        if not self._rows:
+            return []
+        final_path = os.path.join(self.path, f"{self._prefix}-{self._parts:05d}.parquet")
+        temp_path = final_path + ".tmp"
+        self._pq.write_table(self._pa.Table.from_pylist(self._rows, schema=self._schema), temp_path)
+        os.replace(temp_path, final_path)
+
+        self._parts += 1
+        written = [row["query_id"] for row in self._rows]
+        self._rows = []
+        return written
+
+def _parquet_schema(pa: Any) -> Any:
+    """
+    Fixed schema of result records (see ``BatchRunner._run_query``).
+
+    Every part file uses it, so parts whose optional fields happen to be all
+    null or empty still match the rest of the dataset.
+    """
+    place = pa.struct([
+        ("place_id", pa.string()),
+        ("name", pa.string()),
+        ("rating", pa.float64()),
+        ("user_ratings_total", pa.int64()),
+        ("formatted_address", pa.string()),
+        ("url", pa.string()),
+        ("lat", pa.float64()),
+        ("lng", pa.float64()),
+        ("types", pa.list_(pa.string()))
+    ])
+    return pa.schema([
+        ("query_id", pa.string()),
+        ("location", pa.string()),
+        ("preferences", pa.list_(pa.string())),
+        ("radius", pa.int64()),
+        ("max_results", pa.int64()),
+        ("coordinates", pa.string()),
+        ("keywords", pa.list_(pa.string())),
+        ("categories", pa.list_(pa.string())),
+        ("places", pa.list_(place)),
+        ("restaurants", pa.list_(place))
+    ])
+
+def create_result_writer(path: str, output_format: Optional[str] = None, append: bool = True,
+                         rows_per_file: Optional[int] = None) -> ResultWriter:
+    """
+    Create a result writer by format name.
+
+    Args:
+        path: Output file (JSONL) or directory (Parquet)
+        output_format: "jsonl" or "parquet" (default: inferred from the path)
+        append: Keep existing output instead of starting over
+        rows_per_file: Results per Parquet part file
+
+    Returns:
+        ResultWriter instance
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    output_format = output_format or ("parquet" if path.lower().endswith(".parquet") else "jsonl")
+    if output_format == "jsonl":
+        return JSONLResultWriter(path, append=append)
+    if output_format == "parquet":
+        return ParquetResultWriter(path, rows_per_file=rows_per_file, append=append)
+    raise ValueError(f"알 수 없는 출력 형식입니다: '{output_format}' (사용 가능: jsonl, parquet)")
+
+class BatchCheckpoint:
+    """Append-only file of completed query IDs, one per line."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> Set[str]:
+        """Return the IDs recorded so far (none if the file does not exist)."""
+        if not os.path.exists(self.path):
+            return set()
+        with open(self.path, encoding="utf-8") as f:
+            return {line.rstrip("\n") for line in f if line.strip()}
+
+    def mark(self, query_ids: Iterable[str]) -> None:
+        """Record IDs as completed."""
+        query_ids = list(query_ids)
+        if not query_ids:
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.writelines(f"{query_id}\n" for query_id in query_ids)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def clear(self) -> None:
+        """Forget all recorded IDs."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+class BatchRunner:
+    """
+    Run many recommendations with shared clients and caches.
+
+    Queries are read lazily and processed by a pool of worker threads that
+    all call ``recommender.recommend``, so geocoding, keyword expansion,
+    details and translation caches (and the HTTP client with its rate
+    limiter) are shared across the whole batch. The rate limiter applies to
+    Google API calls only; OpenAI and translation calls are not throttled.
+    Results are written in completion order and checkpointed once durable;
+    a resumed run skips every checkpointed query. Malformed input records
+    and failed queries are counted and reported without stopping the batch.
+    A crash between writing a JSONL line and checkpointing it can repeat
+    that one query on resume.
+    """
+
+    def __init__(self, recommender: Any, max_workers: Optional[int] = None,
+                 rows_per_file: Optional[int] = None):
+        """
+        Initialize the batch runner.
+
+        Args:
+            recommender: Object with a thread-safe ``recommend(location,
+                preferences, radius, max_results)`` returning a dictionary
+                like TravelRecommender.recommend
+            max_workers: Number of queries processed concurrently
+                (default: Config.BATCH_MAX_WORKERS)
+            rows_per_file: Results per Parquet part file
+                (default: Config.BATCH_CHECKPOINT_EVERY)
+        """
+        self.recommender = recommender
+        self.max_workers = max_workers or Config.BATCH_MAX_WORKERS
+        self.rows_per_file = rows_per_file
+
+    def run(self, input_path: str, output_path: str, output_format: Optional[str] = None,
+            resume: bool = True) -> Dict[str, int]:
+        """
+        Run every query of an input file.
+
+        Args:
+            input_path: CSV or JSON Lines file of queries
+            output_path: JSONL file or Parquet directory for results
+            output_format: "jsonl" or "parquet" (default: inferred from output_path)
+            resume: Skip queries completed by earlier runs; if False, existing
+                output and checkpoint are discarded
+
+        Returns:
+            Counters: total, skipped, succeeded, failed
+        """
+        checkpoint = BatchCheckpoint(output_path.rstrip(os.sep) + ".checkpoint")
+        if not resume:
+            checkpoint.clear()
+        writer = create_result_writer(output_path, output_format, append=resume,
+                                      rows_per_file=self.rows_per_file)
+        return self.run_queries(read_queries(input_path, strict=False), writer, checkpoint)
+
+    def run_queries(self, queries: Iterable[Union[BatchQuery, InvalidQuery]], writer: ResultWriter,
+                    checkpoint: BatchCheckpoint) -> Dict[str, int]:
+        """
+        Run queries, writing results and checkpointing completed ones.
+
+        Queries already submitted are always finished and written, even if
+        reading the input fails part way.
+
+        Args:
+            queries: Queries to run; duplicates of an ID are skipped and
+                invalid records are counted as failed
+            writer: Output sink
+            checkpoint: Checkpoint of completed query IDs
+
+        Returns:
+            Counters: total, skipped, succeeded, failed
+        """
+        stats = {"total": 0, "skipped": 0, "succeeded": 0, "failed": 0}
+        seen = checkpoint.load()
+        pending: Dict[Future, BatchQuery] = {}
+
+        def drain(return_when: str) -> None:
+            done, _ = wait(pending, return_when=return_when)
+            for future in done:
+                query = pending.pop(future)
+                try:
+                    record = future.result()
+                except Exception as e:
+                    stats["failed"] += 1
+                    print(f"[{query.query_id}] 추천 실패: {str(e)}")
+                    continue
+                stats["succeeded"] += 1
+                print(f"[{query.query_id}] 장소 {len(record['places'])}개, "
+                      f"레스토랑 {len(record['restaurants'])}개")
+                checkpoint.mark(writer.write(record))
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                try:
+                    for query in queries:
+                        stats["total"] += 1
+                        if isinstance(query, InvalidQuery):
+                            stats["failed"] += 1
+                            print(f"잘못된 질의: {query.message}")
+                            continue
+                        if query.query_id in seen:
+                            stats["skipped"] += 1
+                            continue
+                        seen.add(query.query_id)
+
+                        # Keep the input lazy: only a couple of queries per worker in flight
+                        if len(pending) >= 2 * self.max_workers:
+                            drain(FIRST_COMPLETED)
+                        pending[executor.submit(self._run_query, query)] = query
+                finally:
+                    while pending:
+                        drain(FIRST_COMPLETED)
+        finally:
+            checkpoint.mark(writer.close())
+
+        return stats
+
+    def _run_query(self, query: BatchQuery) -> Dict[str, Any]:
+        """Run one query and convert the result to an output record."""
+        result = self.recommender.recommend(
+            query.location, list(query.preferences), query.radius, query.max_results
+        )
+        return {
+            "query_id": query.query_id,
+            "location": query.location,
+            "preferences": list(query.preferences),
+            "radius": query.radius,
+            "max_results": query.max_results,
+            "coordinates": result["location"],
+            "keywords": list(result["keywords"]),
+            "categories": list(result["categories"]),
+            "places": result["places"].to_dicts(),
+            "restaurants": result["restaurants"].to_dicts()
+        }
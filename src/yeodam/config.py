@@ -1,22 +1,137 @@
 """Configuration settings for the travel recommendation system."""
 
 import os
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+# Settings below read YEODAM_* variables when this module is imported; the
+# CLI (travel_recommender.py) loads .env before importing it
+
+def _env_str(name: str, default: Optional[str] = None) -> Optional[str]:
+    """Read a string setting from the environment; empty values count as unset."""
+    value = os.getenv(name, "").strip()
+    return value or default
+
+def _env_choice(name: str, default: str, choices: Tuple[str, ...]) -> str:
+    """Read a setting restricted to a fixed set of values, falling back to the default."""
+    value = _env_str(name, default)
+    if value not in choices:
+        print(f"환경 변수 '{name}' 값이 올바르지 않아 기본값 '{default}'을(를) 사용합니다: {value!r} "
+              f"(사용 가능: {', '.join(choices)})")
+        return default
+    return value
+
+def _env_flag(name: str, default: bool) -> bool:
+    """Read an on/off setting ("1", "true", "yes", "on" or "0", "false", "no", "off")."""
+    value = _env_choice(name, "1" if default else "0",
+                        ("1", "true", "yes", "on", "0", "false", "no", "off"))
+    return value in ("1", "true", "yes", "on")
+
+def _env_number(name: str, default: float, cast: type = float,
+                minimum: float = 0, maximum: Optional[float] = None) -> float:
+    """Read a numeric setting, falling back to the default if it is malformed or out of range."""
+    value = _env_str(name)
+    if value is None:
+        return default
+    try:
+        number = cast(value)
+    except ValueError:
+        number = None
+    if number is None or number < minimum or (maximum is not None and number > maximum):
+        print(f"환경 변수 '{name}' 값이 올바르지 않아 기본값 {default}을(를) 사용합니다: {value!r}")
+        return default
+    return number
 
 class Config:
     """Application configuration settings."""
     
     # File paths
     DYNAMIC_MAPPING_FILE = "dynamic_mapping.pkl"
+    DYNAMIC_MAPPING_DB = "dynamic_mapping.sqlite"
+    CACHE_DB_FILE = "yeodam_cache.sqlite"
+    # Optional JSON file ({"keyword": ["place_type", ...]}) extending CATEGORY_MAPPINGS;
+    # when unset, YEODAM_CATEGORY_MAPPINGS_FILE is read by load_category_index()
+    CATEGORY_MAPPINGS_FILE: Optional[str] = None
     
     # API settings
     GOOGLE_PLACES_BASE_URL = "https://maps.googleapis.com/maps/api/place"
     GOOGLE_GEOCODING_URL = "https://maps.googleapis.com/maps/api/geocode/json"
+    PLACE_DETAILS_FIELDS = "place_id,name,rating,user_ratings_total,formatted_address,vicinity,url,geometry,types"
+    PAGE_TOKEN_DELAY = 2.0
+    PAGE_TOKEN_MAX_ATTEMPTS = 3
+    PAGE_TOKEN_TTL = 120.0  # Google expires next_page_token after a few minutes
     
     # Default values
     DEFAULT_RADIUS = 20000
+    MAX_RADIUS = 50000  # Places API upper limit
     DEFAULT_MAX_RESULTS = 10
     MIN_RATING = 3.5
+    MIN_REVIEW_COUNT = 0
+    FUZZY_MATCH_THRESHOLD = 70
+    
+    # Keyword expansion settings
+    KEYWORD_EXPANSION_MODEL = "gpt-3.5-turbo"
+    KEYWORD_EXPANSION_PROMPT_VERSION = 1
+    KEYWORD_EXPANSION_TEMPERATURE = 0.7
+    KEYWORD_EXPANSION_DETERMINISTIC = False
+    LOCAL_EXPANSION_ENABLED = True
+    LOCAL_EXPANSION_MATCH_THRESHOLD = 90
+    KEYWORD_BATCH_WINDOW = 0.05  # Seconds; 0 disables per-keyword batching
+    KEYWORD_BATCH_MAX_SIZE = 20
+    
+    # Ranking settings
+    RANKING_RATING_WEIGHT = 0.5
+    RANKING_DISTANCE_WEIGHT = 0.3
+    RANKING_MATCH_WEIGHT = 0.2
+    RANKING_PRIOR_COUNT = 20  # Reviews needed to outweigh the mean rating
+    RANKING_DISTANCE_DECAY = 0.5  # Decay length as a fraction of the radius
+    DIVERSITY_ENABLED = True
+    DIVERSITY_LAMBDA = 0.7  # 1.0 = pure relevance, 0.0 = pure diversity
+    DIVERSITY_CATEGORY_WEIGHT = 0.5
+    DIVERSITY_DISTANCE_SCALE = 150  # Meters
+    
+    # Output settings
+    DISPLAY_RENDERER = _env_choice("YEODAM_RENDERER", "text", ("text", "ndjson", "json", "dataframe"))
+    STREAM_RESULTS = _env_flag("YEODAM_STREAM", False)  # Show places as they arrive (unranked, completion order) instead of ranked top-k
+    
+    # Concurrency settings
+    MAX_CONCURRENT_REQUESTS = 8
+    
+    # HTTP transport settings
+    HTTP_TIMEOUT = 10
+    HTTP_MAX_RETRIES = 3
+    HTTP_BACKOFF_FACTOR = 0.5
+    HTTP_BACKOFF_MAX = 8
+    HTTP_POOL_SIZE = 16
+    HTTP_RATE_LIMIT = _env_number("YEODAM_HTTP_RATE_LIMIT", 0.0)  # Google requests per second; 0 = unlimited
+    
+    # Server settings
+    SERVER_HOST = _env_str("YEODAM_HOST", "127.0.0.1")
+    SERVER_PORT = _env_number("YEODAM_PORT", 8000, cast=int, minimum=1, maximum=65535)
+    SERVER_MAX_CONCURRENCY = 16  # Recommendations computed at once
+    SERVER_QUEUE_TIMEOUT = 5.0  # Seconds a request may wait for a slot before a 503
+    SERVER_MAX_BODY_BYTES = 64 * 1024
+    SERVER_MAX_RESULTS = 50  # Largest max_results a request may ask for
+    
+    # Batch settings
+    BATCH_MAX_WORKERS = 4  # Queries processed concurrently
+    BATCH_CHECKPOINT_EVERY = 50  # Parquet results per part file
+    
+    # Cache settings
+    DETAILS_CACHE_TTL = 7 * 24 * 3600
+    DETAILS_CACHE_MEMORY_SIZE = 2048
+    DETAILS_CACHE_MAX_ENTRIES = 100000
+    GEOCODING_CACHE_TTL = 30 * 24 * 3600
+    GEOCODING_CACHE_MEMORY_SIZE = 512
+    GEOCODING_CACHE_MAX_ENTRIES = 20000
+    NEARBY_CACHE_TTL = 24 * 3600
+    NEARBY_CACHE_MEMORY_SIZE = 256
+    NEARBY_CACHE_MAX_ENTRIES = 20000
+    TRANSLATION_CACHE_TTL = 30 * 24 * 3600
+    TRANSLATION_CACHE_MEMORY_SIZE = 4096
+    TRANSLATION_CACHE_MAX_ENTRIES = 200000
+    EXPANSION_CACHE_TTL = 7 * 24 * 3600
+    EXPANSION_CACHE_MEMORY_SIZE = 1024
+    EXPANSION_CACHE_MAX_ENTRIES = 50000
     
     # API Keys (loaded from environment)
     @property
@@ -38,7 +153,7 @@ CATEGORY_MAPPINGS: Dict[str, List[str]] = {
     # 여행 목적
     "식도락": ["restaurant", "tourist_attraction"],
     "맛집": ["restaurant"],
-    "힐링": ["spa", "tourist_attraction"],
+    "힐링": ["natural_feature", "spa"],
     "관광": ["tourist_attraction"],
     "사진": ["tourist_attraction", "point_of_interest"],
     "액티비티": ["tourist_attraction", "point_of_interest"],
@@ -110,7 +225,6 @@ CATEGORY_MAPPINGS: Dict[str, List[str]] = {
     "시장": ["shopping_mall", "tourist_attraction"],
     "광장": ["tourist_attraction", "point_of_interest"],
     "분수": ["tourist_attraction", "point_of_interest"],
-    "도심": ["tourist_attraction", "point_of_interest"],
     "야경": ["tourist_attraction", "point_of_interest"],
     "벽화마을": ["tourist_attraction", "art_gallery"],
 
@@ -156,7 +270,6 @@ CATEGORY_MAPPINGS: Dict[str, List[str]] = {
     # 휴식 및 힐링
     "스파": ["spa"],
     "온천": ["spa"],
-    "힐링": ["natural_feature", "spa"],
     "요가": ["natural_feature", "spa"],
     "명상": ["natural_feature", "spa"],
     "찜질방": ["spa"],
@@ -219,3 +332,121 @@ CATEGORY_MAPPINGS: Dict[str, List[str]] = {
     "드라마 촬영지": ["tourist_attraction", "point_of_interest"],
     "인생샷": ["tourist_attraction", "point_of_interest"]
 }
+
+# Offline geocoding table - 자주 검색되는 광역자치단체와 주요 도시 좌표
+# 키는 normalize_location_query()로 정규화된 형태 (예: "서울특별시" -> "서울")
+# 시/군/도 표기는 접미사를 떼면 다른 지역과 겹칠 수 있어 별도 키로 둔다 ("광주시" ≠ "광주")
+KOREAN_LOCATIONS: Dict[str, Tuple[float, float]] = {
+    # 특별시 / 광역시 / 특별자치시
+    "서울": (37.5665, 126.9780),
+    "부산": (35.1796, 129.0756),
+    "대구": (35.8714, 128.6014),
+    "인천": (37.4563, 126.7052),
+    "광주": (35.1595, 126.8526),
+    "대전": (36.3504, 127.3845),
+    "울산": (35.5384, 129.3114),
+    "세종": (36.4800, 127.2890),
+
+    # 도 / 특별자치도
+    "경기": (37.4138, 127.5183),
+    "경기도": (37.4138, 127.5183),
+    "강원": (37.8228, 128.1555),
+    "강원도": (37.8228, 128.1555),
+    "충청북도": (36.8000, 127.7000),
+    "충북": (36.8000, 127.7000),
+    "충청남도": (36.5184, 126.8000),
+    "충남": (36.5184, 126.8000),
+    "전라북도": (35.7175, 127.1530),
+    "전북": (35.7175, 127.1530),
+    "전라남도": (34.8679, 126.9910),
+    "전남": (34.8679, 126.9910),
+    "경상북도": (36.4919, 128.8889),
+    "경북": (36.4919, 128.8889),
+    "경상남도": (35.4606, 128.2132),
+    "경남": (35.4606, 128.2132),
+    "제주": (33.4996, 126.5312),
+    "제주도": (33.4996, 126.5312),
+
+    # 주요 도시 및 관광지
+    "수원": (37.2636, 127.0286),
+    "성남": (37.4201, 127.1262),
+    "고양": (37.6584, 126.8320),
+    "용인": (37.2411, 127.1776),
+    "가평": (37.8315, 127.5105),
+    "춘천": (37.8813, 127.7298),
+    "원주": (37.3422, 127.9202),
+    "강릉": (37.7519, 128.8761),
+    "속초": (38.2070, 128.5918),
+    "양양": (38.0754, 128.6190),
+    "평창": (37.3705, 128.3903),
+    "청주": (36.6424, 127.4890),
+    "단양": (36.9846, 128.3655),
+    "천안": (36.8151, 127.1139),
+    "전주": (35.8242, 127.1480),
+    "여수": (34.7604, 127.6622),
+    "순천": (34.9507, 127.4872),
+    "목포": (34.8118, 126.3922),
+    "포항": (36.0190, 129.3435),
+    "경주": (35.8562, 129.2247),
+    "안동": (36.5684, 128.7294),
+    "창원": (35.2280, 128.6811),
+    "김해": (35.2285, 128.8894),
+    "통영": (34.8544, 128.4331),
+    "거제": (34.8806, 128.6211),
+    "남해": (34.8376, 127.8924),
+    "서귀포": (33.2541, 126.5600),
+
+    # 시/군 표기 (광주시는 경기도 광주시)
+    "서울시": (37.5665, 126.9780),
+    "부산시": (35.1796, 129.0756),
+    "대구시": (35.8714, 128.6014),
+    "인천시": (37.4563, 126.7052),
+    "대전시": (36.3504, 127.3845),
+    "울산시": (35.5384, 129.3114),
+    "세종시": (36.4800, 127.2890),
+    "광주시": (37.4292, 127.2551),
+    "제주시": (33.4996, 126.5312),
+    "수원시": (37.2636, 127.0286),
+    "성남시": (37.4201, 127.1262),
+    "고양시": (37.6584, 126.8320),
+    "용인시": (37.2411, 127.1776),
+    "가평군": (37.8315, 127.5105),
+    "춘천시": (37.8813, 127.7298),
+    "원주시": (37.3422, 127.9202),
+    "강릉시": (37.7519, 128.8761),
+    "속초시": (38.2070, 128.5918),
+    "양양군": (38.0754, 128.6190),
+    "평창군": (37.3705, 128.3903),
+    "청주시": (36.6424, 127.4890),
+    "단양군": (36.9846, 128.3655),
+    "천안시": (36.8151, 127.1139),
+    "전주시": (35.8242, 127.1480),
+    "여수시": (34.7604, 127.6622),
+    "순천시": (34.9507, 127.4872),
+    "목포시": (34.8118, 126.3922),
+    "포항시": (36.0190, 129.3435),
+    "경주시": (35.8562, 129.2247),
+    "안동시": (36.5684, 128.7294),
+    "창원시": (35.2280, 128.6811),
+    "김해시": (35.2285, 128.8894),
+    "통영시": (34.8544, 128.4331),
+    "거제시": (34.8806, 128.6211),
+    "남해군": (34.8376, 127.8924),
+    "서귀포시": (33.2541, 126.5600),
+
+    # 영문 표기
+    "seoul": (37.5665, 126.9780),
+    "busan": (35.1796, 129.0756),
+    "daegu": (35.8714, 128.6014),
+    "incheon": (37.4563, 126.7052),
+    "gwangju": (35.1595, 126.8526),
+    "daejeon": (36.3504, 127.3845),
+    "ulsan": (35.5384, 129.3114),
+    "sejong": (36.4800, 127.2890),
+    "jeju": (33.4996, 126.5312),
+    "gangneung": (37.7519, 128.8761),
+    "gyeongju": (35.8562, 129.2247),
+    "jeonju": (35.8242, 127.1480),
+    "sokcho": (38.2070, 128.5918),
+    "yeosu": (34.7604, 127.6622)
+}
@@ -0,0 +1,167 @@
+"""Typed result models for places."""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+@dataclass
+class Place:
+    """A single place resolved from the Details API."""
+
+    __slots__ = ("place_id", "name", "rating", "user_ratings_total", "formatted_address",
+                 "url", "lat", "lng", "types")
+
+    place_id: str
+    name: str
+    rating: float
+    user_ratings_total: int
+    formatted_address: str
+    url: str
+    lat: Optional[float]
+    lng: Optional[float]
+    types: Tuple[str, ...]
+
+    @classmethod
+    def from_details(cls, result: Dict[str, Any], place_id: str = "") -> "Place":
+        """
+        Build a Place from a raw Details API result.
+
+        Missing review counts become 0 (Google omits the field for places
+        without reviews); missing text fields get the usual placeholders.
+
+        Args:
+            result: Details API ``result`` payload
+            place_id: Place ID used for the lookup, if the payload lacks one
+
+        Returns:
+            Place instance
+        """
+        location = (result.get('geometry') or {}).get('location') or {}
+        return cls(
+            place_id=result.get('place_id') or place_id,
+            name=result.get('name', '정보 없음'),
+            rating=float(result.get('rating') or 0.0),
+            user_ratings_total=int(result.get('user_ratings_total') or 0),
+            formatted_address=result.get('formatted_address') or result.get('vicinity', '주소 정보가 제공되지 않음'),
+            url=result.get('url', 'URL 정보가 제공되지 않음'),
+            lat=location.get('lat'),
+            lng=location.get('lng'),
+            types=tuple(result.get('types') or ())
+        )
+
+    @property
+    def coordinates(self) -> Optional[Tuple[float, float]]:
+        """(lat, lng) of the place, if known."""
+        if self.lat is None or self.lng is None:
+            return None
+        return self.lat, self.lng
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "place_id": self.place_id,
+            "name": self.name,
+            "rating": self.rating,
+            "user_ratings_total": self.user_ratings_total,
+            "formatted_address": self.formatted_address,
+            "url": self.url,
+            "lat": self.lat,
+            "lng": self.lng,
+            "types": list(self.types)
+        }
+
+class PlaceBatch:
+    """
+    Column-oriented collection of places.
+
+    Numeric fields are NumPy arrays (coordinates are NaN when unknown) so
+    ranking and filtering run vectorized; text fields are plain lists.
+    Selecting, reordering and replacing text build new batches without
+    going through per-place dictionaries.
+    """
+
+    __slots__ = ("place_ids", "names", "formatted_addresses", "urls", "types",
+                 "ratings", "review_counts", "coords")
+
+    def __init__(self, place_ids: List[str], names: List[str], formatted_addresses: List[str],
+                 urls: List[str], types: List[Tuple[str, ...]], ratings: np.ndarray,
+                 review_counts: np.ndarray, coords: np.ndarray):
+        self.place_ids = place_ids
+        self.names = names
+        self.formatted_addresses = formatted_addresses
+        self.urls = urls
+        self.types = types
+        self.ratings = ratings
+        self.review_counts = review_counts
+        self.coords = coords
+
+    @classmethod
+    def from_places(cls, places: Iterable[Place]) -> "PlaceBatch":
+        """Build a batch from Place instances."""
+        places = list(places)
+        return cls(
+            place_ids=[p.place_id for p in places],
+            names=[p.name for p in places],
+            formatted_addresses=[p.formatted_address for p in places],
+            urls=[p.url for p in places],
+            types=[p.types for p in places],
+            ratings=np.array([p.rating for p in places], dtype=float),
+            review_counts=np.array([p.user_ratings_total for p in places], dtype=np.int64),
+            coords=np.array([
+                (p.lat, p.lng) if p.coordinates is not None else (np.nan, np.nan) for p in places
+            ], dtype=float).reshape(len(places), 2)
+        )
+
+    @classmethod
+    def empty(cls) -> "PlaceBatch":
+        """Build a batch without places."""
+        return cls.from_places([])
+
+    @property
+    def has_coords(self) -> np.ndarray:
+        """Boolean mask of places with known coordinates."""
+        return ~np.isnan(self.coords).any(axis=1)
+
+    def take(self, indices: Sequence[int]) -> "PlaceBatch":
+        """Return a new batch with the places at the given indices, in that order."""
+        indices = list(indices)
+        index_array = np.array(indices, dtype=np.intp)
+        return PlaceBatch(
+            place_ids=[self.place_ids[i] for i in indices],
+            names=[self.names[i] for i in indices],
+            formatted_addresses=[self.formatted_addresses[i] for i in indices],
+            urls=[self.urls[i] for i in indices],
+            types=[self.types[i] for i in indices],
+            ratings=self.ratings[index_array],
+            review_counts=self.review_counts[index_array],
+            coords=self.coords[index_array]
+        )
+
+    def with_text(self, names: List[str], formatted_addresses: List[str]) -> "PlaceBatch":
+        """Return a batch sharing all columns except names and addresses (e.g. translated)."""
+        return PlaceBatch(self.place_ids, list(names), list(formatted_addresses), self.urls,
+                          self.types, self.ratings, self.review_counts, self.coords)
+
+    def __len__(self) -> int:
+        return len(self.place_ids)
+
+    def __getitem__(self, index: int) -> Place:
+        lat, lng = self.coords[index]
+        return Place(
+            place_id=self.place_ids[index],
+            name=self.names[index],
+            rating=float(self.ratings[index]),
+            user_ratings_total=int(self.review_counts[index]),
+            formatted_address=self.formatted_addresses[index],
+            url=self.urls[index],
+            lat=None if np.isnan(lat) else float(lat),
+            lng=None if np.isnan(lng) else float(lng),
+            types=self.types[index]
+        )
+
+    def __iter__(self) -> Iterator[Place]:
+        return (self[i] for i in range(len(self)))
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Convert to a list of JSON-serializable dictionaries."""
+        return [place.to_dict() for place in self]
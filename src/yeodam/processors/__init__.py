@@ -4,8 +4,42 @@ Processors module - 데이터 처리 관련
 키워드 처리, AI 기반 확장 등의 기능을 제공
 """
 
-from .keyword_processor import KeywordProcessor
+from typing import TYPE_CHECKING
+from .._lazy import lazy_exports
 
 __all__ = [
-    "KeywordProcessor"
+    "KeywordProcessor",
+    "AsyncKeywordProcessor",
+    "KeywordIndex",
+    "CategoryIndex",
+    "load_category_index",
+    "LocalKeywordExpander",
+    "ExpansionBatcher",
+    "RankingEngine",
+    "DiversitySelector"
 ]
+
+# Loaded on first access so that importing the package does not pull in openai or numpy
+_LAZY_ATTRS = {
+    "KeywordProcessor": ".keyword_processor",
+    "AsyncKeywordProcessor": ".async_keyword_processor",
+    "KeywordIndex": ".keyword_index",
+    "CategoryIndex": ".category_index",
+    "load_category_index": ".category_index",
+    "LocalKeywordExpander": ".local_expander",
+    "ExpansionBatcher": ".expansion_batcher",
+    "RankingEngine": ".ranking_engine",
+    "DiversitySelector": ".diversity"
+}
+
+if TYPE_CHECKING:
+    from .keyword_processor import KeywordProcessor
+    from .async_keyword_processor import AsyncKeywordProcessor
+    from .keyword_index import KeywordIndex
+    from .category_index import CategoryIndex, load_category_index
+    from .local_expander import LocalKeywordExpander
+    from .expansion_batcher import ExpansionBatcher
+    from .ranking_engine import RankingEngine
+    from .diversity import DiversitySelector
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_ATTRS, __all__)
@@ -0,0 +1,35 @@
+"""Asyncio variant of the keyword processor."""
+
+from concurrent.futures import Executor
+from typing import Dict, List, Optional, Tuple
+from .keyword_processor import KeywordProcessor
+from ..utils.utils import run_blocking
+
+class AsyncKeywordProcessor:
+    """Async wrapper around KeywordProcessor."""
+    
+    def __init__(self, processor: KeywordProcessor, executor: Optional[Executor] = None):
+        self.processor = processor
+        self.executor = executor
+    
+    async def expand_keywords(self, keywords: List[str]) -> List[str]:
+        """Expand keywords using AI. See KeywordProcessor."""
+        return await run_blocking(self.executor, self.processor.expand_keywords, keywords)
+    
+    async def map_keywords_to_categories(self, keywords: List[str], 
+                                         default_category: List[str] = None) -> List[str]:
+        """Map keywords to Google Places categories. See KeywordProcessor."""
+        return await run_blocking(self.executor, self.processor.map_keywords_to_categories,
+                                  keywords, default_category)
+    
+    async def category_weights(self, keywords: List[str],
+                               default_category: List[str] = None) -> Dict[str, float]:
+        """Weigh mapped categories by keyword count. See KeywordProcessor."""
+        return await run_blocking(self.executor, self.processor.category_weights,
+                                  keywords, default_category)
+    
+    async def map_keywords_with_weights(self, keywords: List[str],
+                                        default_category: List[str] = None) -> Tuple[List[str], Dict[str, float]]:
+        """Map keywords to categories and weights in one pass. See KeywordProcessor."""
+        return await run_blocking(self.executor, self.processor.map_keywords_with_weights,
+                                  keywords, default_category)
@@ -0,0 +1,194 @@
+"""Compiled, read-only index over the keyword-to-category table."""
+
+import json
+import os
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from ..config import Config, CATEGORY_MAPPINGS
+from ..exceptions import ConfigurationError
+
+class CategoryIndex:
+    """
+    Frozen keyword/category lookup tables.
+
+    Every Google Places type gets an integer ID in order of first appearance
+    and each keyword's categories are stored as a bitmask over those IDs, so
+    merging the categories of many keywords is a bitwise OR and decoding a
+    mask always yields the same type order. An inverted map lists the
+    keywords carrying each type.
+    """
+
+    def __init__(self, mappings: Mapping[str, Iterable[str]]):
+        """
+        Compile the index.
+
+        Args:
+            mappings: Validated keyword to Google Places types mapping
+        """
+        type_ids: Dict[str, int] = {}
+        masks: Dict[str, int] = {}
+        types: Dict[str, Tuple[str, ...]] = {}
+        type_keywords: Dict[str, List[str]] = {}
+
+        for keyword, keyword_types in mappings.items():
+            keyword_types = tuple(dict.fromkeys(keyword_types))
+            mask = 0
+            for place_type in keyword_types:
+                type_id = type_ids.setdefault(place_type, len(type_ids))
+                mask |= 1 << type_id
+                type_keywords.setdefault(place_type, []).append(keyword)
+            masks[keyword] = mask
+            types[keyword] = keyword_types
+
+        self.keywords: Tuple[str, ...] = tuple(masks)
+        self.type_names: Tuple[str, ...] = tuple(type_ids)
+        self.type_ids: Mapping[str, int] = MappingProxyType(type_ids)
+        self.masks: Mapping[str, int] = MappingProxyType(masks)
+        self.mappings: Mapping[str, Tuple[str, ...]] = MappingProxyType(types)
+        self.type_keywords: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+            {place_type: tuple(keywords) for place_type, keywords in type_keywords.items()}
+        )
+
+    def mask(self, keyword: str) -> int:
+        """Category bitmask of a keyword (0 if unknown)."""
+        return self.masks.get(keyword, 0)
+
+    def types_for(self, keyword: str) -> Tuple[str, ...]:
+        """Categories of a keyword in table order (empty if unknown)."""
+        return self.mappings.get(keyword, ())
+
+    def keywords_for_type(self, place_type: str) -> Tuple[str, ...]:
+        """Keywords mapped to a Google Places type."""
+        return self.type_keywords.get(place_type, ())
+
+    def encode(self, place_types: Iterable[str]) -> Tuple[int, List[str]]:
+        """
+        Encode place types as a bitmask.
+
+        Args:
+            place_types: Google Places types
+
+        Returns:
+            Tuple of (bitmask of known types, list of types not in the index)
+        """
+        mask = 0
+        unknown = []
+        for place_type in place_types:
+            type_id = self.type_ids.get(place_type)
+            if type_id is None:
+                unknown.append(place_type)
+            else:
+                mask |= 1 << type_id
+        return mask, unknown
+
+    def decode(self, mask: int) -> List[str]:
+        """Place types set in a bitmask, in type ID order."""
+        names = []
+        type_id = 0
+        while mask:
+            if mask & 1:
+                names.append(self.type_names[type_id])
+            mask >>= 1
+            type_id += 1
+        return names
+
+    def __contains__(self, keyword: str) -> bool:
+        return keyword in self.masks
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+def _reject_duplicate_keys(pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    """JSON object hook that fails on repeated keys instead of keeping the last."""
+    result: Dict[str, Any] = {}
+    for key, value in pairs:
+        if key in result:
+            raise ConfigurationError(f"카테고리 매핑 파일에 중복된 키워드가 있습니다: '{key}'")
+        result[key] = value
+    return result
+
+def validate_category_mappings(mappings: Mapping[str, Any]) -> Dict[str, Tuple[str, ...]]:
+    """
+    Validate and normalize a keyword to categories mapping.
+
+    Args:
+        mappings: Mapping of keyword to a list of Google Places types
+
+    Returns:
+        Mapping with stripped keywords and deduplicated type tuples
+
+    Raises:
+        ConfigurationError: If a keyword or category list is malformed
+    """
+    validated: Dict[str, Tuple[str, ...]] = {}
+    for keyword, place_types in mappings.items():
+        if not isinstance(keyword, str) or not keyword.strip():
+            raise ConfigurationError(f"잘못된 카테고리 키워드: {keyword!r}")
+        if (isinstance(place_types, str) or not isinstance(place_types, (list, tuple))
+                or not place_types
+                or not all(isinstance(t, str) and t.strip() for t in place_types)):
+            raise ConfigurationError(f"'{keyword}'의 카테고리 목록이 올바르지 않습니다: {place_types!r}")
+
+        keyword = keyword.strip()
+        if keyword in validated:
+            raise ConfigurationError(f"중복된 카테고리 키워드: '{keyword}'")
+        validated[keyword] = tuple(dict.fromkeys(t.strip() for t in place_types))
+    return validated
+
+def load_category_mappings_file(path: str) -> Dict[str, Tuple[str, ...]]:
+    """
+    Load additional category mappings from a JSON file.
+
+    Args:
+        path: Path to a JSON object of keyword to Google Places types
+
+    Returns:
+        Validated mappings
+
+    Raises:
+        ConfigurationError: If the file cannot be read or is invalid
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f, object_pairs_hook=_reject_duplicate_keys)
+    except (OSError, ValueError) as e:
+        raise ConfigurationError(f"카테고리 매핑 파일 로드 실패: {str(e)}")
+
+    if not isinstance(data, dict):
+        raise ConfigurationError("카테고리 매핑 파일은 JSON 객체여야 합니다.")
+    return validate_category_mappings(data)
+
+def compile_category_index(mappings: Mapping[str, Iterable[str]],
+                           extra_mappings: Optional[Mapping[str, Iterable[str]]] = None) -> CategoryIndex:
+    """
+    Validate mappings and compile them into a CategoryIndex.
+
+    Args:
+        mappings: Base keyword to categories mapping
+        extra_mappings: Additional entries; these replace base entries with the same keyword
+
+    Returns:
+        Compiled index
+    """
+    merged = dict(validate_category_mappings(mappings))
+    if extra_mappings:
+        merged.update(validate_category_mappings(extra_mappings))
+    return CategoryIndex(merged)
+
+@lru_cache(maxsize=None)
+def load_category_index(path: Optional[str] = None) -> CategoryIndex:
+    """
+    Build the shared category index on first use.
+
+    Args:
+        path: Optional JSON file extending CATEGORY_MAPPINGS; defaults to
+            Config.CATEGORY_MAPPINGS_FILE, then the
+            YEODAM_CATEGORY_MAPPINGS_FILE environment variable
+
+    Returns:
+        Compiled index, cached per path
+    """
+    path = path or Config.CATEGORY_MAPPINGS_FILE or os.getenv("YEODAM_CATEGORY_MAPPINGS_FILE", "").strip()
+    extra = load_category_mappings_file(path) if path else None
+    return compile_category_index(CATEGORY_MAPPINGS, extra)
@@ -0,0 +1,142 @@
+"""Diversity-aware selection of ranked places."""
+
+import math
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+from ..config import Config
+from ..models import PlaceBatch
+from ..utils.geo import METERS_PER_DEGREE
+
+# Types attached to nearly every place; they say nothing about redundancy
+GENERIC_TYPES = frozenset({"point_of_interest", "establishment"})
+
+class DiversitySelector:
+    """
+    Maximal-marginal-relevance (MMR) selection over scored places.
+
+    Places are picked greedily by ``lambda * score - (1 - lambda) * redundancy``,
+    where redundancy is the highest similarity to any place already picked.
+    Similarity blends the Jaccard overlap of the places' types with a
+    distance decay, so repeats of one category and near-duplicate places
+    (e.g. several entrances of the same complex) are pushed down.
+
+    Places are bucketed into a uniform grid of ``distance_cutoff`` cells, so
+    each pick only computes distances to places in the neighboring cells.
+    """
+
+    def __init__(self, lambda_: Optional[float] = None, category_weight: Optional[float] = None,
+                 distance_scale: Optional[float] = None):
+        """
+        Initialize the selector. Unset parameters default to Config.
+
+        Args:
+            lambda_: Trade-off between relevance (1.0) and diversity (0.0)
+            category_weight: Share of category overlap in the similarity;
+                the rest is geographic proximity
+            distance_scale: Distance in meters at which geographic
+                similarity has decayed to 1/e
+        """
+        self.lambda_ = Config.DIVERSITY_LAMBDA if lambda_ is None else lambda_
+        self.category_weight = Config.DIVERSITY_CATEGORY_WEIGHT if category_weight is None else category_weight
+        self.distance_scale = Config.DIVERSITY_DISTANCE_SCALE if distance_scale is None else distance_scale
+        self.distance_cutoff = 3 * self.distance_scale
+
+    def select(self, places: PlaceBatch, scores: Sequence[float], k: int) -> List[int]:
+        """
+        Select k diverse, relevant places.
+
+        Args:
+            places: Candidate places
+            scores: Relevance score per place
+            k: Number of places to select
+
+        Returns:
+            Indices of the selected places, in selection order
+        """
+        n = len(places)
+        k = min(k, n)
+        if k <= 0:
+            return []
+
+        # Scale by the best score only; min-max scaling would blow small score
+        # gaps up to the full range and drown out redundancy
+        relevance = np.asarray(scores, dtype=float)
+        top = relevance.max()
+        relevance = relevance / top if top > 0 else np.ones(n)
+
+        types = self._type_matrix(places)
+        type_counts = types.sum(axis=1)
+        xy, has_coords = self._project(places)
+        grid = self._build_grid(xy, has_coords)
+
+        redundancy = np.zeros(n)
+        available = np.ones(n, dtype=bool)
+        selected: List[int] = []
+
+        for _ in range(k):
+            mmr = self.lambda_ * relevance - (1 - self.lambda_) * redundancy
+            mmr[~available] = -np.inf
+            best = int(np.argmax(mmr))
+            selected.append(best)
+            available[best] = False
+
+            similarity = np.zeros(n)
+            if self.category_weight > 0:
+                overlap = types @ types[best]
+                union = type_counts + type_counts[best] - overlap
+                jaccard = np.divide(overlap, union, out=np.zeros(n), where=union > 0)
+                similarity += self.category_weight * jaccard
+            if self.category_weight < 1 and has_coords[best]:
+                neighbors = self._neighbors(grid, xy[best])
+                if len(neighbors):
+                    distance = np.hypot(*(xy[neighbors] - xy[best]).T)
+                    similarity[neighbors] += (1 - self.category_weight) * np.exp(-distance / self.distance_scale)
+
+            np.maximum(redundancy, similarity, out=redundancy)
+
+        return selected
+
+    def _type_matrix(self, places: PlaceBatch) -> np.ndarray:
+        """Binary place x type matrix, ignoring generic types."""
+        type_ids: Dict[str, int] = {}
+        rows = []
+        for place_types in places.types:
+            ids = [type_ids.setdefault(t, len(type_ids))
+                   for t in dict.fromkeys(place_types) if t not in GENERIC_TYPES]
+            rows.append(ids)
+
+        matrix = np.zeros((len(places), max(1, len(type_ids))))
+        for row, ids in enumerate(rows):
+            matrix[row, ids] = 1.0
+        return matrix
+
+    def _project(self, places: PlaceBatch) -> Tuple[np.ndarray, np.ndarray]:
+        """Project coordinates to local planar meters around their mean."""
+        has_coords = places.has_coords
+        latlng = np.where(has_coords[:, None], places.coords, 0.0)
+
+        if has_coords.any():
+            origin = latlng[has_coords].mean(axis=0)
+        else:
+            origin = np.zeros(2)
+        xy = np.empty_like(latlng)
+        xy[:, 0] = (latlng[:, 1] - origin[1]) * METERS_PER_DEGREE * math.cos(math.radians(origin[0]))
+        xy[:, 1] = (latlng[:, 0] - origin[0]) * METERS_PER_DEGREE
+        return xy, has_coords
+
+    def _build_grid(self, xy: np.ndarray, has_coords: np.ndarray) -> Dict[Tuple[int, int], List[int]]:
+        """Bucket place indices into square cells of distance_cutoff meters."""
+        grid: Dict[Tuple[int, int], List[int]] = {}
+        cells = np.floor(xy / self.distance_cutoff).astype(int)
+        for i in np.flatnonzero(has_coords):
+            grid.setdefault((cells[i, 0], cells[i, 1]), []).append(int(i))
+        return grid
+
+    def _neighbors(self, grid: Dict[Tuple[int, int], List[int]], point: np.ndarray) -> np.ndarray:
+        """Indices of places in the 3x3 cells around a point."""
+        cx, cy = (int(v) for v in np.floor(point / self.distance_cutoff))
+        indices = []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                indices.extend(grid.get((cx + dx, cy + dy), ()))
+        return np.array(indices, dtype=int)
@@ -0,0 +1,132 @@
+"""Micro-batching of keyword expansion requests."""
+
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional
+
+class ExpansionBatcher:
+    """
+    Coalesce per-keyword expansion requests from concurrent callers.
+
+    Keywords submitted within a short window are sent to ``expand_batch`` as
+    one batch and each caller waits only for its own keywords. A keyword that
+    is already queued or in flight is never sent twice; later callers simply
+    share its pending result. The first caller of a new batch waits out the
+    window and then sends it; a caller that fills a batch sends it at once.
+    A caller that is alone (no other expansion in progress) sends right away,
+    so single-user runs never pay the window. No background thread is needed.
+    """
+
+    def __init__(self, expand_batch: Callable[[List[str]], Dict[str, List[str]]],
+                 window: float = 0.05, max_batch: int = 20):
+        """
+        Initialize the batcher.
+
+        Args:
+            expand_batch: Function expanding a list of keywords into a
+                mapping of keyword to related keywords
+            window: Seconds to collect keywords before sending a batch
+            max_batch: Maximum keywords per batch; a full batch is sent early
+        """
+        self.expand_batch = expand_batch
+        self.window = window
+        self.max_batch = max_batch
+
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+        self._inflight: Dict[str, Future] = {}
+        self._batch_full: Optional[threading.Event] = None
+        self._active = 0
+        self._stats = {"keywords": 0, "coalesced": 0, "batches": 0, "sent": 0}
+
+    def expand(self, keywords: List[str]) -> Dict[str, List[str]]:
+        """
+        Expand keywords, batching them with concurrent callers.
+
+        Args:
+            keywords: Keywords to expand
+
+        Returns:
+            Mapping of each keyword to its related keywords
+
+        Raises:
+            Exception: Whatever ``expand_batch`` raised for the batch
+        """
+        futures: Dict[str, Future] = {}
+        full_batches: List[Dict[str, Future]] = []
+        lead: Optional[threading.Event] = None
+
+        with self._lock:
+            self._active += 1
+            for keyword in dict.fromkeys(keywords):
+                self._stats["keywords"] += 1
+                future = self._inflight.get(keyword)
+                if future is not None:
+                    self._stats["coalesced"] += 1
+                    futures[keyword] = future
+                    continue
+
+                if not self._pending:
+                    self._batch_full = threading.Event()
+                    lead = self._batch_full
+                future = Future()
+                self._pending[keyword] = future
+                self._inflight[keyword] = future
+                futures[keyword] = future
+
+                if len(self._pending) >= self.max_batch:
+                    if lead is self._batch_full:
+                        lead = None
+                    full_batches.append(self._take_batch())
+
+        try:
+            for batch in full_batches:
+                self._send(batch)
+
+            if lead is not None:
+                with self._lock:
+                    alone = self._active == 1
+                if not alone:
+                    lead.wait(self.window)
+                with self._lock:
+                    batch = self._take_batch() if self._batch_full is lead else {}
+                self._send(batch)
+
+            return {keyword: future.result() for keyword, future in futures.items()}
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def _take_batch(self) -> Dict[str, Future]:
+        """Detach the pending batch and wake its leader. Must be called with the lock held."""
+        batch, self._pending = self._pending, {}
+        if self._batch_full is not None:
+            self._batch_full.set()
+        self._batch_full = None
+        return batch
+
+    def _send(self, batch: Dict[str, Future]) -> None:
+        """Expand a detached batch and resolve its futures."""
+        if not batch:
+            return
+
+        keywords = list(batch)
+        try:
+            results = self.expand_batch(keywords)
+        except Exception as e:
+            for future in batch.values():
+                future.set_exception(e)
+        else:
+            for keyword, future in batch.items():
+                future.set_result(results.get(keyword) or [keyword])
+        finally:
+            with self._lock:
+                self._stats["batches"] += 1
+                self._stats["sent"] += len(keywords)
+                for keyword in keywords:
+                    self._inflight.pop(keyword, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters for submitted, coalesced and sent keywords."""
+        with self._lock:
+            return dict(self._stats)
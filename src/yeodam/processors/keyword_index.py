@@ -0,0 +1,144 @@
+"""Precomputed fuzzy-match index over category keywords."""
+
+import functools
+import heapq
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_scorer = None
+
+def _weighted_ratio(query: str, choice: str) -> float:
+    """WRatio score, using rapidfuzz when installed and fuzzywuzzy otherwise."""
+    global _scorer
+    if _scorer is None:
+        try:
+            from rapidfuzz import fuzz
+            from rapidfuzz.utils import default_process
+            _scorer = functools.partial(fuzz.WRatio, processor=default_process)
+        except ImportError:
+            from fuzzywuzzy import fuzz
+            _scorer = fuzz.WRatio
+    return _scorer(query, choice)
+
+_NON_ALNUM_RE = re.compile(r"\W+|_")
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+
+def decompose_hangul(text: str) -> str:
+    """Decompose precomposed Hangul syllables into conjoining jamo."""
+    chars = []
+    for char in text:
+        code = ord(char)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            index = code - _HANGUL_BASE
+            chars.append(chr(0x1100 + index // 588))
+            chars.append(chr(0x1161 + (index % 588) // 28))
+            if index % 28:
+                chars.append(chr(0x11A7 + index % 28))
+        else:
+            chars.append(char)
+    return "".join(chars)
+
+def normalize_keyword(text: str) -> str:
+    """Lowercase and replace non-alphanumeric runs with single spaces."""
+    return _NON_ALNUM_RE.sub(" ", text.lower()).strip()
+
+class KeywordIndex:
+    """
+    Fuzzy keyword matcher backed by a jamo n-gram inverted index.
+
+    Keywords are decomposed into Hangul jamo and indexed by character
+    n-grams. A query is only scored (with the WRatio scorer used by
+    ``fuzzywuzzy.process.extractOne``) against the keywords sharing the most
+    n-grams with it, so matching cost stays flat as the table grows.
+    """
+
+    def __init__(self, keywords: Iterable[str], ngram_size: int = 2,
+                 max_candidates: int = 16, memo_size: int = 4096):
+        """
+        Build the index.
+
+        Args:
+            keywords: Keywords to match against
+            ngram_size: Length of jamo n-grams
+            max_candidates: Number of keywords scored per query
+            memo_size: Maximum number of memoized query results
+        """
+        self.keywords: List[str] = list(dict.fromkeys(keywords))
+        self.ngram_size = ngram_size
+        self.max_candidates = max_candidates
+        self.memo_size = memo_size
+
+        self._exact: Dict[str, int] = {}
+        self._postings: Dict[str, List[int]] = {}
+        for i, keyword in enumerate(self.keywords):
+            self._exact.setdefault(normalize_keyword(keyword), i)
+            for gram in set(self._ngrams(keyword)):
+                self._postings.setdefault(gram, []).append(i)
+
+        self._memo: Dict[str, Optional[Tuple[str, float]]] = {}
+        self._memo_lock = threading.Lock()
+
+    def _ngrams(self, text: str) -> List[str]:
+        """Padded jamo n-grams of a keyword."""
+        jamo = "^" + decompose_hangul(normalize_keyword(text)).replace(" ", "") + "$"
+        n = self.ngram_size
+        return [jamo[i:i + n] for i in range(max(1, len(jamo) - n + 1))]
+
+    def candidates(self, query: str) -> List[int]:
+        """Indices of keywords sharing the most n-grams with the query, in table order."""
+        overlap: Dict[int, int] = {}
+        for gram in set(self._ngrams(query)):
+            for i in self._postings.get(gram, ()):
+                overlap[i] = overlap.get(i, 0) + 1
+        top = heapq.nsmallest(self.max_candidates, overlap, key=lambda i: (-overlap[i], i))
+        return sorted(top)
+
+    def match(self, query: str) -> Optional[Tuple[str, float]]:
+        """
+        Find the best-matching keyword for a query.
+
+        Args:
+            query: Keyword to match
+
+        Returns:
+            Tuple of (matched keyword, score 0-100), or None if nothing is similar
+        """
+        with self._memo_lock:
+            if query in self._memo:
+                return self._memo[query]
+
+        exact = self._exact.get(normalize_keyword(query))
+        if exact is not None:
+            result: Optional[Tuple[str, float]] = (self.keywords[exact], 100.0)
+        else:
+            result = None
+            for i in self.candidates(query):
+                score = _weighted_ratio(query, self.keywords[i])
+                if result is None or score > result[1]:
+                    result = (self.keywords[i], score)
+
+        with self._memo_lock:
+            if len(self._memo) >= self.memo_size:
+                self._memo.clear()
+            self._memo[query] = result
+        return result
+
+    def map_many(self, queries: Iterable[str], threshold: float = 0) -> List[Optional[Tuple[str, float]]]:
+        """
+        Match a batch of queries.
+
+        Args:
+            queries: Keywords to match
+            threshold: Minimum score for a match to be returned
+
+        Returns:
+            For each query, (matched keyword, score) or None if below threshold
+        """
+        results = []
+        for query in queries:
+            result = self.match(query)
+            results.append(result if result is not None and result[1] >= threshold else None)
+        return results
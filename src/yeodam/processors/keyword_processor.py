@@ -1,23 +1,70 @@
 """Keyword processing service for travel recommendations."""
 
-from openai import OpenAI
-from typing import List, Dict, Any
-from fuzzywuzzy import process
-from ..config import CATEGORY_MAPPINGS
+import hashlib
+import json
+import threading
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple
+from ..config import Config
+from .category_index import CategoryIndex, load_category_index
+from .keyword_index import KeywordIndex
+from .local_expander import LocalKeywordExpander
+from .expansion_batcher import ExpansionBatcher
 from ..exceptions import KeywordProcessingError
-from ..utils.utils import load_dynamic_mapping, save_dynamic_mapping
+from ..utils.cache import BaseCache
+from ..utils.mapping_store import DynamicMappingStore
+from ..utils.utils import canonicalize_keywords
+
+if TYPE_CHECKING:
+    from openai import OpenAI
 
 class KeywordProcessor:
     """Service for processing and expanding travel keywords."""
     
-    def __init__(self, openai_api_key: str):
-        self.client = OpenAI(api_key=openai_api_key)
-        self.dynamic_mapping = load_dynamic_mapping()
+    def __init__(self, openai_api_key: str, dynamic_mapping: Optional[DynamicMappingStore] = None,
+                 expansion_cache: Optional[BaseCache] = None, deterministic: Optional[bool] = None,
+                 category_index: Optional[CategoryIndex] = None):
+        self.openai_api_key = openai_api_key
+        self._client: Optional["OpenAI"] = None
+        self._client_lock = threading.Lock()
+        self.dynamic_mapping = dynamic_mapping if dynamic_mapping is not None else DynamicMappingStore()
+        self.category_index = category_index if category_index is not None else load_category_index()
+        self.keyword_index = KeywordIndex(self.category_index.keywords)
+        self.local_expander = LocalKeywordExpander(
+            self.category_index.mappings, self.keyword_index, self.dynamic_mapping,
+            match_threshold=Config.LOCAL_EXPANSION_MATCH_THRESHOLD
+        ) if Config.LOCAL_EXPANSION_ENABLED else None
+        self.expansion_cache = expansion_cache
+        self.deterministic = Config.KEYWORD_EXPANSION_DETERMINISTIC if deterministic is None else deterministic
+        self.expansion_batcher = ExpansionBatcher(
+            self._expand_keyword_batch, Config.KEYWORD_BATCH_WINDOW, Config.KEYWORD_BATCH_MAX_SIZE
+        ) if Config.KEYWORD_BATCH_WINDOW > 0 else None
+    
+    @property
+    def client(self) -> "OpenAI":
+        """OpenAI client, created on first use so that importing openai is deferred."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    from openai import OpenAI
+                    self._client = OpenAI(api_key=self.openai_api_key)
+        return self._client
+    
+    @client.setter
+    def client(self, client: "OpenAI") -> None:
+        self._client = client
     
     def expand_keywords(self, keywords: List[str]) -> List[str]:
         """
         Expand keywords using AI to include related terms.
         
+        Keywords are canonicalized (normalized, deduplicated, sorted) so that
+        the same preference set in any order or spelling variant is served
+        from the expansion cache without calling OpenAI. Sets made only of
+        known category keywords are expanded locally first; OpenAI is only
+        asked about genuinely novel input. Unless batching is disabled, novel
+        keywords are expanded and cached one by one, and concurrent requests
+        share a single batched OpenAI call.
+        
         Args:
             keywords: List of original keywords
             
@@ -30,8 +77,26 @@ class KeywordProcessor:
         if not keywords:
             return keywords
         
+        canonical = canonicalize_keywords(keywords)
+        if not canonical:
+            return []
+        
+        if self.local_expander is not None:
+            local = self.local_expander.expand(canonical)
+            if local is not None:
+                return local
+        
+        if self.expansion_batcher is not None:
+            return self._expand_per_keyword(canonical)
+        
+        cache_key = self._expansion_cache_key(canonical)
+        if self.expansion_cache is not None:
+            cached = self.expansion_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
-            keywords_str = ", ".join(keywords)
+            keywords_str = ", ".join(canonical)
             prompt = f"""
             다음 여행 키워드들과 관련된 추가 키워드들을 제안해주세요: {keywords_str}
             
@@ -40,10 +105,10 @@ class KeywordProcessor:
             """
             
             response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
+                model=Config.KEYWORD_EXPANSION_MODEL,
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=150,
-                temperature=0.7
+                **self._sampling_params()
             )
             
             expanded_text = response.choices[0].message.content.strip()
@@ -57,10 +122,115 @@ class KeywordProcessor:
                     unique_keywords.append(kw)
                     seen.add(kw)
             
-            return unique_keywords
+        except Exception as e:
+            raise KeywordProcessingError(f"키워드 확장 실패: {str(e)}")
+        
+        if self.expansion_cache is not None:
+            self.expansion_cache.set(cache_key, unique_keywords)
+        
+        return unique_keywords
+    
+    def _expand_per_keyword(self, canonical: List[str]) -> List[str]:
+        """Expand each keyword separately through the cache and the batcher."""
+        expansions: Dict[str, List[str]] = {}
+        missing = []
+        for keyword in canonical:
+            cached = None
+            if self.expansion_cache is not None:
+                cached = self.expansion_cache.get(self._expansion_cache_key([keyword], per_keyword=True))
+            if cached is not None:
+                expansions[keyword] = cached
+            else:
+                missing.append(keyword)
+        
+        if missing:
+            try:
+                expansions.update(self.expansion_batcher.expand(missing))
+            except KeywordProcessingError:
+                raise
+            except Exception as e:
+                raise KeywordProcessingError(f"키워드 확장 실패: {str(e)}")
+        
+        expanded = list(canonical)
+        for keyword in canonical:
+            expanded.extend(expansions[keyword])
+        return list(dict.fromkeys(expanded))
+    
+    def _expand_keyword_batch(self, keywords: List[str]) -> Dict[str, List[str]]:
+        """
+        Expand several keywords with a single JSON-mode OpenAI request.
+        
+        If the reply is cut off by the token limit, each keyword is retried
+        with its own request.
+        
+        Args:
+            keywords: Keywords to expand
+            
+        Returns:
+            Mapping of each keyword to its related keywords (including itself)
+            
+        Raises:
+            KeywordProcessingError: If the request fails or returns invalid JSON
+        """
+        try:
+            keywords_json = json.dumps(keywords, ensure_ascii=False)
+            prompt = f"""
+            다음 여행 키워드 각각에 대해 관련된 추가 키워드들을 제안해주세요: {keywords_json}
+            
+            각 키워드를 키로, 원래 키워드를 포함한 관련 키워드 목록을 값으로 하는 JSON 객체로만 답해주세요.
+            예시: {{"박물관": ["박물관", "미술관", "전시관", "문화센터"]}}
+            """
             
+            response = self.client.chat.completions.create(
+                model=Config.KEYWORD_EXPANSION_MODEL,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=min(4096, 150 * len(keywords)),
+                response_format={"type": "json_object"},
+                **self._sampling_params()
+            )
+        except Exception as e:
+            raise KeywordProcessingError(f"키워드 확장 실패: {str(e)}")
+        
+        choice = response.choices[0]
+        if getattr(choice, "finish_reason", None) == "length":
+            if len(keywords) == 1:
+                raise KeywordProcessingError("키워드 확장 실패: 응답이 토큰 한도에서 잘렸습니다.")
+            results = {}
+            for keyword in keywords:
+                results.update(self._expand_keyword_batch([keyword]))
+            return results
+        
+        try:
+            data = json.loads(choice.message.content)
         except Exception as e:
             raise KeywordProcessingError(f"키워드 확장 실패: {str(e)}")
+        
+        results = {}
+        for keyword in keywords:
+            related = data.get(keyword) if isinstance(data, dict) else None
+            if not isinstance(related, list):
+                related = []
+            related = [str(kw).strip() for kw in related]
+            results[keyword] = list(dict.fromkeys([keyword] + [kw for kw in related if kw]))
+            
+            if self.expansion_cache is not None:
+                self.expansion_cache.set(self._expansion_cache_key([keyword], per_keyword=True), results[keyword])
+        
+        return results
+    
+    def _sampling_params(self) -> Dict[str, Any]:
+        """Sampling parameters for the expansion request."""
+        if self.deterministic:
+            return {"temperature": 0, "seed": 0}
+        return {"temperature": Config.KEYWORD_EXPANSION_TEMPERATURE}
+    
+    def _expansion_cache_key(self, canonical: List[str], per_keyword: bool = False) -> str:
+        """Build a cache key from the model, prompt version, sampling mode and keyword set."""
+        mode = "deterministic" if self.deterministic else f"t{Config.KEYWORD_EXPANSION_TEMPERATURE}"
+        if per_keyword:
+            mode = f"kw:{mode}"
+        digest = hashlib.sha1("\x1f".join(canonical).encode("utf-8")).hexdigest()
+        return f"{Config.KEYWORD_EXPANSION_MODEL}:v{Config.KEYWORD_EXPANSION_PROMPT_VERSION}:{mode}:{digest}"
     
     def map_keywords_to_categories(self, keywords: List[str], 
                                  default_category: List[str] = None) -> List[str]:
@@ -72,37 +242,108 @@ class KeywordProcessor:
             default_category: Default categories if no match found
             
         Returns:
-            List of mapped categories
+            List of mapped categories, in category index order
+        """
+        return self._merge_categories(self._resolve_categories(keywords, default_category))
+    
+    def category_weights(self, keywords: List[str],
+                         default_category: List[str] = None) -> Dict[str, float]:
+        """
+        Weigh mapped categories by how many keywords map to them.
+        
+        Args:
+            keywords: List of keywords to map
+            default_category: Default categories if no match found
+            
+        Returns:
+            Mapping of category to weight in (0, 1], 1 for the most common category
+        """
+        return self._weigh_categories(self._resolve_categories(keywords, default_category))
+    
+    def map_keywords_with_weights(self, keywords: List[str],
+                                  default_category: List[str] = None) -> Tuple[List[str], Dict[str, float]]:
+        """
+        Map keywords to categories and weigh them in a single resolution pass.
+        
+        Equivalent to calling ``map_keywords_to_categories`` and
+        ``category_weights``, but fuzzy matching and dynamic-mapping updates
+        run only once.
+        
+        Args:
+            keywords: List of keywords to map
+            default_category: Default categories if no match found
+            
+        Returns:
+            Tuple of (categories in category index order, category weights)
+        """
+        resolved = self._resolve_categories(keywords, default_category)
+        return self._merge_categories(resolved), self._weigh_categories(resolved)
+    
+    def _merge_categories(self, resolved: List[Tuple[int, List[str]]]) -> List[str]:
+        """Union of resolved categories, indexed ones in index order first."""
+        mapped_mask = 0
+        unknown_categories: Dict[str, None] = {}
+        for mask, unknown in resolved:
+            mapped_mask |= mask
+            unknown_categories.update(dict.fromkeys(unknown))
+        
+        return self.category_index.decode(mapped_mask) + list(unknown_categories)
+    
+    def _weigh_categories(self, resolved: List[Tuple[int, List[str]]]) -> Dict[str, float]:
+        """Weigh resolved categories by the number of keywords mapping to them."""
+        counts: Dict[str, int] = {}
+        for mask, unknown in resolved:
+            for category in self.category_index.decode(mask) + unknown:
+                counts[category] = counts.get(category, 0) + 1
+        
+        if not counts:
+            return {}
+        top = max(counts.values())
+        return {category: count / top for category, count in counts.items()}
+    
+    def _resolve_categories(self, keywords: List[str],
+                            default_category: List[str] = None) -> List[Tuple[int, List[str]]]:
+        """
+        Resolve each keyword to its categories, learning new fuzzy matches.
+        
+        Returns:
+            For each keyword, (bitmask of indexed categories, other categories)
         """
         if default_category is None:
             default_category = ["tourist_attraction"]
         
-        mapped_categories = set()
+        index = self.category_index
+        resolved: List[Tuple[int, List[str]]] = []
+        new_mappings = {}
         
+        # Check dynamic mapping first
+        unmapped = []
         for keyword in keywords:
-            # Check dynamic mapping first
-            if keyword in self.dynamic_mapping:
-                mapped_categories.update(self.dynamic_mapping[keyword])
-                continue
-            
-            # Use fuzzy matching for static mappings
-            best_match = process.extractOne(keyword, CATEGORY_MAPPINGS.keys())
-            
-            if best_match and best_match[1] >= 70:  # 70% similarity threshold
+            categories = self.dynamic_mapping.get(keyword)
+            if categories is not None:
+                resolved.append(index.encode(categories))
+            else:
+                unmapped.append(keyword)
+        
+        # Use the fuzzy-match index for static mappings
+        matches = self.keyword_index.map_many(unmapped, threshold=Config.FUZZY_MATCH_THRESHOLD)
+        
+        for keyword, best_match in zip(unmapped, matches):
+            if best_match:
                 matched_key = best_match[0]
-                categories = CATEGORY_MAPPINGS[matched_key]
-                mapped_categories.update(categories)
+                resolved.append((index.mask(matched_key), []))
                 
                 # Save to dynamic mapping for future use
-                self.dynamic_mapping[keyword] = categories
+                new_mappings[keyword] = list(index.types_for(matched_key))
             else:
                 # Use default category
-                mapped_categories.update(default_category)
+                resolved.append(index.encode(default_category))
         
-        # Save updated dynamic mapping
-        try:
-            save_dynamic_mapping(self.dynamic_mapping)
-        except Exception as e:
-            print(f"동적 매핑 저장 중 오류: {str(e)}")
+        # Persist only newly learned mappings
+        if new_mappings:
+            try:
+                self.dynamic_mapping.put_many(new_mappings)
+            except Exception as e:
+                print(f"동적 매핑 저장 중 오류: {str(e)}")
         
-        return list(mapped_categories)
+        return resolved
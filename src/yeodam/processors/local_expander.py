@@ -0,0 +1,142 @@
+"""Offline keyword expansion from the category mapping table."""
+
+import math
+import threading
+from typing import Dict, Iterable, List, Mapping, Optional
+from .keyword_index import KeywordIndex
+from ..utils.mapping_store import DynamicMappingStore
+
+class LocalKeywordExpander:
+    """
+    Expand keywords locally using a synonym graph over known keywords.
+
+    Keywords from the category index (and the learned dynamic mapping) are
+    nodes; two keywords are related by the IDF-weighted Jaccard similarity of
+    their Google Places types, so rare shared types ("restaurant", "spa")
+    count for more than ubiquitous ones ("tourist_attraction"). A request is
+    answered locally only when every input keyword resolves confidently to a
+    known keyword; otherwise the caller should fall back to the LLM.
+    """
+
+    def __init__(self, mappings: Mapping[str, Iterable[str]], keyword_index: KeywordIndex,
+                 dynamic_mapping: Optional[DynamicMappingStore] = None,
+                 match_threshold: float = 90, similarity_threshold: float = 0.6,
+                 max_neighbors: int = 3):
+        """
+        Initialize the expander. The graph is built lazily on first use and
+        rebuilt when the dynamic mapping learns new keywords.
+
+        Args:
+            mappings: Static keyword to Google Places types mapping
+            keyword_index: Fuzzy index over the static keywords
+            dynamic_mapping: Learned keyword mappings added to the graph
+            match_threshold: Minimum fuzzy score for a keyword to count as known
+            similarity_threshold: Minimum similarity for a related keyword
+            max_neighbors: Maximum related keywords added per input keyword
+        """
+        self.mappings = mappings
+        self.keyword_index = keyword_index
+        self.dynamic_mapping = dynamic_mapping
+        self.match_threshold = match_threshold
+        self.similarity_threshold = similarity_threshold
+        self.max_neighbors = max_neighbors
+        self.stats = {"local": 0, "fallback": 0}
+
+        self._types: Optional[Dict[str, frozenset]] = None
+        self._type_keywords: Dict[str, List[str]] = {}
+        self._idf: Dict[str, float] = {}
+        self._neighbors: Dict[str, List[str]] = {}
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def _build(self) -> Dict[str, frozenset]:
+        """Build the keyword graph on first use, or again once the dynamic mapping has changed."""
+        version = self.dynamic_mapping.version if self.dynamic_mapping is not None else 0
+        if self._types is not None and version == self._version:
+            return self._types
+
+        types: Dict[str, frozenset] = {keyword: frozenset(t) for keyword, t in self.mappings.items()}
+        if self.dynamic_mapping is not None:
+            for keyword, t in self.dynamic_mapping.items():
+                types.setdefault(keyword, frozenset(t))
+
+        type_keywords: Dict[str, List[str]] = {}
+        for keyword, keyword_types in types.items():
+            for place_type in keyword_types:
+                type_keywords.setdefault(place_type, []).append(keyword)
+
+        self._idf = {
+            place_type: math.log(len(types) / len(keywords))
+            for place_type, keywords in type_keywords.items()
+        }
+        self._type_keywords = type_keywords
+        self._neighbors = {}
+        self._types = types
+        self._version = version
+        return types
+
+    def _similarity(self, a: frozenset, b: frozenset) -> float:
+        """IDF-weighted Jaccard similarity of two type sets."""
+        union = sum(self._idf.get(t, 0.0) for t in a | b)
+        if union == 0:
+            return 1.0 if a == b else 0.0
+        return sum(self._idf.get(t, 0.0) for t in a & b) / union
+
+    def neighbors(self, keyword: str) -> List[str]:
+        """Most related known keywords, strongest first."""
+        types = self._build()
+        if keyword in self._neighbors:
+            return self._neighbors[keyword]
+
+        own = types[keyword]
+        candidates = {other for t in own for other in self._type_keywords[t] if other != keyword}
+        order = {k: i for i, k in enumerate(types)}
+        scored = sorted(
+            ((self._similarity(own, types[other]), other) for other in candidates),
+            key=lambda item: (-item[0], order[item[1]])
+        )
+        neighbors = [other for score, other in scored[:self.max_neighbors]
+                     if score >= self.similarity_threshold]
+        self._neighbors[keyword] = neighbors
+        return neighbors
+
+    def resolve(self, keyword: str) -> Optional[str]:
+        """Resolve a keyword to a known graph keyword, if confident."""
+        types = self._build()
+        if keyword in types:
+            return keyword
+
+        match = self.keyword_index.match(keyword)
+        if match is not None and match[1] >= self.match_threshold:
+            return match[0]
+        return None
+
+    def expand(self, keywords: List[str]) -> Optional[List[str]]:
+        """
+        Expand keywords locally.
+
+        Args:
+            keywords: Keywords to expand
+
+        Returns:
+            Original keywords followed by related keywords, or None if any
+            keyword is unknown and the LLM should be used instead
+        """
+        with self._lock:
+            resolved = [self.resolve(keyword) for keyword in keywords]
+            if not keywords or any(r is None for r in resolved):
+                self.stats["fallback"] += 1
+                return None
+
+            expanded = list(keywords)
+            for keyword in resolved:
+                expanded.append(keyword)
+                expanded.extend(self.neighbors(keyword))
+
+            self.stats["local"] += 1
+            return list(dict.fromkeys(expanded))
+
+    def fallback_rate(self) -> float:
+        """Share of expansion requests that needed the LLM."""
+        total = self.stats["local"] + self.stats["fallback"]
+        return self.stats["fallback"] / total if total else 0.0
@@ -0,0 +1,133 @@
+"""Relevance ranking of candidate places."""
+
+import heapq
+import numpy as np
+from typing import Mapping, Optional, Tuple
+from ..config import Config
+from ..models import PlaceBatch
+from .diversity import DiversitySelector
+from ..utils.geo import EARTH_RADIUS_M
+
+class RankingEngine:
+    """
+    Score and select the most relevant places.
+
+    Each candidate gets a weighted sum of three components in [0, 1]:
+
+    * quality: Bayesian-averaged rating, shrinking ratings backed by few
+      reviews towards the mean rating of all candidates
+    * proximity: exponential decay of the distance from the search center
+    * match: strongest weight among the place's types in the requested
+      category weights
+
+    Scores are computed for all candidates in one vectorized NumPy pass and
+    the top k are selected with a heap, or with a DiversitySelector when one
+    is configured.
+    """
+
+    def __init__(self, rating_weight: Optional[float] = None, distance_weight: Optional[float] = None,
+                 match_weight: Optional[float] = None, prior_count: Optional[float] = None,
+                 distance_decay: Optional[float] = None,
+                 diversity: Optional[DiversitySelector] = None):
+        """
+        Initialize the ranking engine. Unset parameters default to Config.
+
+        Args:
+            rating_weight: Weight of the Bayesian-averaged rating
+            distance_weight: Weight of the distance decay
+            match_weight: Weight of the category match strength
+            prior_count: Review count at which a place's own rating and the
+                mean rating weigh equally
+            distance_decay: Decay length as a fraction of the search radius
+            diversity: MMR selector trading score against redundancy when
+                picking the top k
+        """
+        self.rating_weight = Config.RANKING_RATING_WEIGHT if rating_weight is None else rating_weight
+        self.distance_weight = Config.RANKING_DISTANCE_WEIGHT if distance_weight is None else distance_weight
+        self.match_weight = Config.RANKING_MATCH_WEIGHT if match_weight is None else match_weight
+        self.prior_count = Config.RANKING_PRIOR_COUNT if prior_count is None else prior_count
+        self.distance_decay = Config.RANKING_DISTANCE_DECAY if distance_decay is None else distance_decay
+        self.diversity = diversity
+
+    def score(self, places: PlaceBatch, center: Tuple[float, float], radius: float,
+              category_weights: Optional[Mapping[str, float]] = None) -> np.ndarray:
+        """
+        Compute relevance scores.
+
+        Args:
+            places: Candidate places
+            center: Search center as (lat, lng)
+            radius: Search radius in meters
+            category_weights: Weight per Google Places type; places matching
+                no weighted type get no match score. If omitted, match
+                strength is ignored.
+
+        Returns:
+            Array of scores, one per place
+        """
+        n = len(places)
+        if n == 0:
+            return np.zeros(0)
+
+        ratings = places.ratings
+        counts = places.review_counts.astype(float)
+        has_coords = places.has_coords
+        lat = np.radians(np.where(has_coords, places.coords[:, 0], center[0]))
+        lng = np.radians(np.where(has_coords, places.coords[:, 1], center[1]))
+
+        # Bayesian average: (v * R + m * C) / (v + m), scaled to [0, 1]
+        rated = counts > 0
+        mean_rating = ratings[rated].mean() if rated.any() else 0.0
+        quality = (counts * ratings + self.prior_count * mean_rating) / np.maximum(counts + self.prior_count, 1e-9) / 5.0
+
+        # Haversine distance from the center, then exponential decay
+        center_lat, center_lng = np.radians(center[0]), np.radians(center[1])
+        a = (np.sin((lat - center_lat) / 2) ** 2
+             + np.cos(center_lat) * np.cos(lat) * np.sin((lng - center_lng) / 2) ** 2)
+        distance = 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+        proximity = np.where(has_coords, np.exp(-distance / max(radius * self.distance_decay, 1.0)), 0.0)
+
+        scores = self.rating_weight * quality + self.distance_weight * proximity
+        if category_weights:
+            type_ids = {place_type: i for i, place_type in enumerate(category_weights)}
+            weights = np.fromiter(category_weights.values(), dtype=float, count=len(type_ids))
+            membership = np.zeros((n, len(type_ids)))
+            for row, place_types in enumerate(places.types):
+                for place_type in place_types:
+                    column = type_ids.get(place_type)
+                    if column is not None:
+                        membership[row, column] = 1.0
+            match = (membership * weights).max(axis=1)
+            scores = scores + self.match_weight * match
+
+        return scores
+
+    def rank(self, places: PlaceBatch, center: Tuple[float, float], radius: float,
+             category_weights: Optional[Mapping[str, float]] = None,
+             k: Optional[int] = None) -> PlaceBatch:
+        """
+        Return the k most relevant places, best first.
+
+        Args:
+            places: Candidate places
+            center: Search center as (lat, lng)
+            radius: Search radius in meters
+            category_weights: Weight per Google Places type (see ``score``)
+            k: Number of places to return (default: all)
+
+        Returns:
+            Ranked places (in MMR selection order if diversity is enabled);
+            ties keep their original order
+        """
+        if k is None or k > len(places):
+            k = len(places)
+        if k <= 0:
+            return places.take([])
+
+        scores = self.score(places, center, radius, category_weights)
+        if self.diversity is not None:
+            return places.take(self.diversity.select(places, scores, k))
+
+        scores = scores.tolist()
+        top = heapq.nlargest(k, range(len(places)), key=lambda i: (scores[i], -i))
+        return places.take(top)
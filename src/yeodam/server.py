@@ -0,0 +1,265 @@
+"""Dependency-free ASGI application serving recommendations."""
+
+import asyncio
+import json
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl
+from .batch import BatchQuery
+from .config import Config
+from .exceptions import APIError, LocationNotFoundError, YeodamError
+
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+class HTTPError(Exception):
+    """Error answered with an HTTP status and a JSON error body."""
+
+    def __init__(self, status: int, message: str, headers: Optional[List[Tuple[bytes, bytes]]] = None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or []
+
+class RecommendationApp:
+    """
+    ASGI application around a long-lived recommendation pipeline.
+
+    The recommender (and with it every HTTP client, cache, keyword mapping
+    and translator) is built once per process, at lifespan startup or on
+    the first request, and shared by all requests. At most
+    ``max_concurrency`` recommendations run at once; requests that cannot
+    get a slot within ``queue_timeout`` seconds are answered with 503.
+
+    Routes:
+        POST /recommend: JSON body with location, preferences and optional
+            radius (at most Config.MAX_RADIUS), max_results (at most
+            Config.SERVER_MAX_RESULTS); GET with the same query parameters
+            also works
+        GET /health: Liveness and readiness
+        GET /metrics: Request and service counters in Prometheus text format
+    """
+
+    def __init__(self, recommender_factory: Callable[[], Any], max_concurrency: Optional[int] = None,
+                 queue_timeout: Optional[float] = None, max_body_bytes: Optional[int] = None):
+        """
+        Initialize the application.
+
+        Args:
+            recommender_factory: Callable building an object with an async
+                ``recommend(location, preferences, radius, max_results)``
+                like AsyncTravelRecommender; ``stats()`` and ``close()``
+                are used when present
+            max_concurrency: Recommendations computed at once
+                (default: Config.SERVER_MAX_CONCURRENCY)
+            queue_timeout: Seconds a request may wait for a slot
+                (default: Config.SERVER_QUEUE_TIMEOUT)
+            max_body_bytes: Largest accepted request body
+                (default: Config.SERVER_MAX_BODY_BYTES)
+        """
+        self.recommender_factory = recommender_factory
+        self.max_concurrency = max_concurrency or Config.SERVER_MAX_CONCURRENCY
+        self.queue_timeout = Config.SERVER_QUEUE_TIMEOUT if queue_timeout is None else queue_timeout
+        self.max_body_bytes = max_body_bytes or Config.SERVER_MAX_BODY_BYTES
+
+        self.recommender: Optional[Any] = None
+        self._recommender_lock = threading.Lock()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._started = time.monotonic()
+
+        self.in_flight = 0
+        self.rejected = 0
+        self.duration_sum = 0.0
+        self.duration_count = 0
+        self.responses: Dict[Tuple[str, int], int] = {}
+
+    async def __call__(self, scope: Dict[str, Any], receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        """Build the recommender on startup and release it on shutdown."""
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await asyncio.get_running_loop().run_in_executor(None, self.get_recommender)
+                except Exception as e:
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.close()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    def get_recommender(self) -> Any:
+        """Return the shared recommender, building it on first use."""
+        with self._recommender_lock:
+            if self.recommender is None:
+                self.recommender = self.recommender_factory()
+            return self.recommender
+
+    def close(self) -> None:
+        """Release the shared recommender."""
+        with self._recommender_lock:
+            recommender, self.recommender = self.recommender, None
+        if recommender is not None and hasattr(recommender, "close"):
+            recommender.close()
+
+    async def _http(self, scope: Dict[str, Any], receive: Receive, send: Send) -> None:
+        """Route one HTTP request and record its outcome."""
+        path, method = scope["path"], scope["method"]
+        routes = {
+            "/recommend": ("GET", "POST"),
+            "/health": ("GET", "HEAD"),
+            "/metrics": ("GET", "HEAD")
+        }
+        start = time.monotonic()
+
+        try:
+            if path not in routes:
+                raise HTTPError(404, "요청한 경로를 찾을 수 없습니다.")
+            if method not in routes[path]:
+                raise HTTPError(405, "허용되지 않는 메서드입니다.",
+                                [(b"allow", ", ".join(routes[path]).encode())])
+
+            if path == "/recommend":
+                status, body, content_type = 200, await self._recommend(scope, receive), b"application/json"
+            elif path == "/health":
+                status, body, content_type = 200, self._health(), b"application/json"
+            else:
+                status, body, content_type = 200, self._metrics().encode(), b"text/plain; version=0.0.4"
+            headers = [(b"content-type", content_type)]
+        except HTTPError as e:
+            status, body, headers = e.status, _json_bytes({"error": str(e)}), [
+                (b"content-type", b"application/json"), *e.headers
+            ]
+
+        key = (path if path in routes else "other", status)
+        self.responses[key] = self.responses.get(key, 0) + 1
+        if path == "/recommend":
+            self.duration_sum += time.monotonic() - start
+            self.duration_count += 1
+
+        headers.append((b"content-length", str(len(body)).encode()))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": b"" if method == "HEAD" else body})
+
+    async def _recommend(self, scope: Dict[str, Any], receive: Receive) -> bytes:
+        """Parse, admit and run one recommendation request."""
+        if scope["method"] == "POST":
+            try:
+                record = json.loads(await self._read_body(receive) or b"{}")
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                raise HTTPError(400, "요청 본문이 올바른 JSON이 아닙니다.")
+            if not isinstance(record, dict):
+                raise HTTPError(400, "요청 본문은 JSON 객체여야 합니다.")
+        else:
+            record = dict(parse_qsl(scope.get("query_string", b"").decode("utf-8", "replace")))
+
+        try:
+            query = BatchQuery.from_record(record)
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+        if query.radius is not None and query.radius > Config.MAX_RADIUS:
+            raise HTTPError(400, f"radius는 {Config.MAX_RADIUS} 이하여야 합니다.")
+        if query.max_results is not None and query.max_results > Config.SERVER_MAX_RESULTS:
+            raise HTTPError(400, f"max_results는 {Config.SERVER_MAX_RESULTS} 이하여야 합니다.")
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise HTTPError(503, "요청이 많아 잠시 후 다시 시도해주세요.",
+                            [(b"retry-after", str(max(1, round(self.queue_timeout))).encode())])
+
+        self.in_flight += 1
+        try:
+            recommender = self.recommender or await asyncio.get_running_loop().run_in_executor(
+                None, self.get_recommender
+            )
+            result = await recommender.recommend(
+                query.location, list(query.preferences), query.radius, query.max_results
+            )
+        except LocationNotFoundError as e:
+            raise HTTPError(404, str(e))
+        except APIError as e:
+            raise HTTPError(502, str(e))
+        except YeodamError as e:
+            raise HTTPError(500, str(e))
+        except Exception as e:
+            raise HTTPError(500, f"예상치 못한 오류가 발생했습니다: {str(e)}")
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+        return _json_bytes({
+            "location": result["location"],
+            "keywords": list(result["keywords"]),
+            "categories": list(result["categories"]),
+            "places": result["places"].to_dicts(),
+            "restaurants": result["restaurants"].to_dicts()
+        })
+
+    async def _read_body(self, receive: Receive) -> bytes:
+        """Read the request body, rejecting bodies over max_body_bytes."""
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                raise HTTPError(400, "요청 본문을 받기 전에 연결이 끊어졌습니다.")
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body_bytes:
+                raise HTTPError(413, "요청 본문이 너무 큽니다.")
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                return b"".join(chunks)
+
+    def _health(self) -> bytes:
+        """Liveness plus whether the shared recommender has been built."""
+        return _json_bytes({
+            "status": "ok",
+            "ready": self.recommender is not None,
+            "uptime": round(time.monotonic() - self._started, 3)
+        })
+
+    def _metrics(self) -> str:
+        """Render request and service counters in Prometheus text format."""
+        lines = [
+            "# TYPE yeodam_http_responses_total counter",
+            *(f'yeodam_http_responses_total{{path="{path}",status="{status}"}} {count}'
+              for (path, status), count in sorted(self.responses.items())),
+            "# TYPE yeodam_requests_in_flight gauge",
+            f"yeodam_requests_in_flight {self.in_flight}",
+            "# TYPE yeodam_requests_rejected_total counter",
+            f"yeodam_requests_rejected_total {self.rejected}",
+            "# TYPE yeodam_recommend_duration_seconds summary",
+            f"yeodam_recommend_duration_seconds_sum {self.duration_sum:.6f}",
+            f"yeodam_recommend_duration_seconds_count {self.duration_count}"
+        ]
+
+        recommender = self.recommender
+        if recommender is not None and hasattr(recommender, "stats"):
+            for name, value in _flatten(recommender.stats(), "yeodam"):
+                lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+def _flatten(stats: Dict[str, Any], prefix: str) -> Iterator[Tuple[str, Any]]:
+    """Yield (metric name, value) for every numeric leaf of a nested stats dictionary."""
+    for key, value in stats.items():
+        name = f"{prefix}_{''.join(c if c.isalnum() else '_' for c in str(key))}"
+        if isinstance(value, dict):
+            yield from _flatten(value, name)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield name, value
+
+def _json_bytes(data: Any) -> bytes:
+    """Encode a JSON response body."""
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
@@ -4,12 +4,35 @@ Services module - API 관련 서비스들
 Google Places API, Geocoding API, Translation 서비스 등을 제공
 """
 
-from .geocoding_service import GeocodingService
-from .places_service import PlacesService
-from .translation_service import TranslationService
+from typing import TYPE_CHECKING
+from .._lazy import lazy_exports
 
 __all__ = [
     "GeocodingService",
-    "PlacesService", 
-    "TranslationService"
+    "PlacesService",
+    "TranslationService",
+    "HttpClient",
+    "AsyncGeocodingService",
+    "AsyncPlacesService",
+    "AsyncTranslationService"
 ]
+
+# Imported on first access; the services depend on requests and deep_translator
+_LAZY_ATTRS = {
+    "GeocodingService": ".geocoding_service",
+    "PlacesService": ".places_service",
+    "TranslationService": ".translation_service",
+    "HttpClient": ".http_client",
+    "AsyncGeocodingService": ".async_services",
+    "AsyncPlacesService": ".async_services",
+    "AsyncTranslationService": ".async_services"
+}
+
+if TYPE_CHECKING:
+    from .geocoding_service import GeocodingService
+    from .places_service import PlacesService
+    from .translation_service import TranslationService
+    from .http_client import HttpClient
+    from .async_services import AsyncGeocodingService, AsyncPlacesService, AsyncTranslationService
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_ATTRS, __all__)
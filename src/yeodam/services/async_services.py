@@ -0,0 +1,62 @@
+"""Asyncio variants of the API services.
+
+The underlying HTTP clients are blocking, so each async service delegates
+to its synchronous counterpart on a shared, bounded executor. Many
+concurrent requests can then be driven from a single event loop while
+reusing all of the synchronous services' behaviour.
+"""
+
+from concurrent.futures import Executor
+from typing import List, Dict, Any, Optional, Tuple
+from .geocoding_service import GeocodingService
+from .places_service import PlacesService
+from .translation_service import TranslationService
+from ..models import Place, PlaceBatch
+from ..utils.utils import run_blocking
+
+class AsyncGeocodingService:
+    """Async wrapper around GeocodingService."""
+    
+    def __init__(self, service: GeocodingService, executor: Optional[Executor] = None):
+        self.service = service
+        self.executor = executor
+    
+    async def get_location_coordinates(self, location: str) -> str:
+        """Get coordinates for a location name. See GeocodingService."""
+        return await run_blocking(self.executor, self.service.get_location_coordinates, location)
+
+class AsyncPlacesService:
+    """Async wrapper around PlacesService."""
+    
+    def __init__(self, service: PlacesService, executor: Optional[Executor] = None):
+        self.service = service
+        self.executor = executor
+    
+    async def get_place_details(self, place_id: str) -> Optional[Place]:
+        """Get detailed information for a place. See PlacesService."""
+        return await run_blocking(self.executor, self.service.get_place_details, place_id)
+    
+    async def search_nearby_places(self, location: str, radius: int, place_type: str) -> List[Dict[str, Any]]:
+        """Search for nearby places of a specific type. See PlacesService."""
+        return await run_blocking(self.executor, self.service.search_nearby_places, location, radius, place_type)
+    
+    async def get_places_by_categories(self, categories: List[str], location: str, 
+                                       radius: int, max_results: int) -> Tuple[PlaceBatch, PlaceBatch]:
+        """Get places and restaurants by categories. See PlacesService."""
+        return await run_blocking(self.executor, self.service.get_places_by_categories,
+                                  categories, location, radius, max_results)
+
+class AsyncTranslationService:
+    """Async wrapper around TranslationService."""
+    
+    def __init__(self, service: TranslationService, executor: Optional[Executor] = None):
+        self.service = service
+        self.executor = executor
+    
+    async def translate_text(self, text: str, target_language: str = 'ko') -> str:
+        """Translate text to target language. See TranslationService."""
+        return await run_blocking(self.executor, self.service.translate_text, text, target_language)
+    
+    async def translate_batch(self, texts: List[str], target_language: str = 'ko') -> List[str]:
+        """Translate several texts in bulk. See TranslationService."""
+        return await run_blocking(self.executor, self.service.translate_batch, texts, target_language)
@@ -1,22 +1,33 @@
 """Geocoding service for location coordinate retrieval."""
 
 import requests
-from typing import Optional, Tuple
-from ..config import Config
+from typing import Dict, Optional, Tuple
+from ..config import Config, KOREAN_LOCATIONS
 from ..exceptions import APIError, LocationNotFoundError
-from ..utils.utils import validate_coordinates, format_location_string, safe_get_nested
+from ..utils.cache import BaseCache
+from .http_client import HttpClient
+from ..utils.utils import validate_coordinates, format_location_string, safe_get_nested, normalize_location_query
 
 class GeocodingService:
     """Service for geocoding location names to coordinates."""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache: Optional[BaseCache] = None,
+                 offline_table: Optional[Dict[str, Tuple[float, float]]] = None,
+                 http_client: Optional[HttpClient] = None):
         self.api_key = api_key
         self.config = Config()
+        self.http_client = http_client or HttpClient()
+        self.cache = cache
+        self.offline_table = KOREAN_LOCATIONS if offline_table is None else offline_table
     
     def get_location_coordinates(self, location: str) -> str:
         """
         Get coordinates for a location name.
         
+        The normalized query is looked up in the offline table of Korean
+        provinces and major cities, then in the geocoding cache, before the
+        Geocoding API is called.
+        
         Args:
             location: Location name to geocode
             
@@ -27,16 +38,33 @@ class GeocodingService:
             LocationNotFoundError: If location cannot be found
             APIError: If API request fails
         """
+        query = normalize_location_query(location)
+        
+        if query in self.offline_table:
+            lat, lng = self.offline_table[query]
+            return format_location_string(lat, lng)
+        
+        if self.cache is not None:
+            cached = self.cache.get(query)
+            if cached is not None:
+                return cached
+        
+        coordinates = self._geocode(location)
+        
+        if self.cache is not None:
+            self.cache.set(query, coordinates)
+        
+        return coordinates
+    
+    def _geocode(self, location: str) -> str:
+        """Call the Geocoding API for a location name."""
         params = {
             "address": location,
             "key": self.api_key
         }
         
         try:
-            response = requests.get(self.config.GOOGLE_GEOCODING_URL, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self.http_client.get_json(self.config.GOOGLE_GEOCODING_URL, params)
             results = data.get('results', [])
             
             if not results:
@@ -0,0 +1,106 @@
+"""Shared HTTP transport for the Google API services."""
+
+import random
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional
+from ..config import Config
+from ..utils.rate_limiter import RateLimiter
+from ..utils.singleflight import SingleFlight
+
+class HttpClient:
+    """
+    Pooled HTTP client with timeouts and retry/backoff.
+
+    A single instance is meant to be shared by all services so that
+    concurrent and repeated calls reuse keep-alive connections. Requests are
+    retried with exponential backoff and full jitter on connection errors,
+    timeouts, HTTP 429/5xx and Google's OVER_QUERY_LIMIT / UNKNOWN_ERROR
+    statuses. Identical requests (same URL and parameters) already in
+    flight are coalesced, so the decoded response may be shared between
+    callers and must be treated as read-only. An optional RateLimiter caps
+    the rate of attempts (retries included) across all threads.
+    """
+
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    RETRY_API_STATUSES = frozenset({"OVER_QUERY_LIMIT", "UNKNOWN_ERROR"})
+
+    def __init__(self, timeout: Optional[float] = None, max_retries: Optional[int] = None,
+                 backoff_factor: Optional[float] = None, pool_size: Optional[int] = None,
+                 rate_limiter: Optional[RateLimiter] = None):
+        self.config = Config()
+        self.timeout = timeout or self.config.HTTP_TIMEOUT
+        self.max_retries = self.config.HTTP_MAX_RETRIES if max_retries is None else max_retries
+        self.backoff_factor = self.config.HTTP_BACKOFF_FACTOR if backoff_factor is None else backoff_factor
+
+        pool_size = pool_size or self.config.HTTP_POOL_SIZE
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._inflight = SingleFlight()
+        self.rate_limiter = rate_limiter
+
+    def get_json(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a GET request and return the decoded JSON body.
+
+        Concurrent calls with the same URL and parameters share one request.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            requests.RequestException: If the request still fails after all retries
+        """
+        key = (url, tuple(sorted((k, str(v)) for k, v in params.items())))
+        return self._inflight.do(key, self._get_json_with_retries, url, params)
+
+    def _get_json_with_retries(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a GET request, retrying transient failures."""
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= self.max_retries:
+                    raise
+            else:
+                if response.status_code in self.RETRY_STATUS_CODES and attempt < self.max_retries:
+                    self._sleep(attempt, response.headers.get("Retry-After"))
+                    attempt += 1
+                    continue
+
+                response.raise_for_status()
+                data = response.json()
+
+                if data.get("status") not in self.RETRY_API_STATUSES or attempt >= self.max_retries:
+                    return data
+
+            self._sleep(attempt)
+            attempt += 1
+
+    def _sleep(self, attempt: int, retry_after: Optional[str] = None) -> None:
+        """Wait before the next attempt using exponential backoff with full jitter."""
+        delay = min(self.config.HTTP_BACKOFF_MAX, self.backoff_factor * (2 ** attempt))
+        delay = random.uniform(0, delay)
+
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, min(float(retry_after), self.config.HTTP_BACKOFF_MAX))
+
+        time.sleep(delay)
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters for executed and coalesced requests."""
+        return self._inflight.stats()
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
@@ -1,44 +1,61 @@
 """Google Places API service for place search and details."""
 
+import queue
+import threading
+import time
 import requests
-from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator, Callable
 from ..config import Config
 from ..exceptions import APIError
-from ..utils.utils import safe_get_nested
+from ..models import Place, PlaceBatch
+from ..utils.cache import BaseCache
+from .http_client import HttpClient
+from ..utils.spatial_cache import SpatialTileCache
+from ..utils.utils import safe_get_nested, parse_location_string
 
 class PlacesService:
     """Service for Google Places API operations."""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, max_workers: Optional[int] = None,
+                 details_cache: Optional[BaseCache] = None,
+                 nearby_cache: Optional[SpatialTileCache] = None,
+                 http_client: Optional[HttpClient] = None):
         self.api_key = api_key
         self.config = Config()
+        self.http_client = http_client or HttpClient()
+        self.max_workers = max(1, max_workers or self.config.MAX_CONCURRENT_REQUESTS)
+        self.details_cache = details_cache
+        self.nearby_cache = nearby_cache
+        self.stats = _new_query_stats()
+        self._stats_lock = threading.Lock()
     
-    def get_place_details(self, place_id: str) -> Optional[Dict[str, Any]]:
+    def get_place_details(self, place_id: str, fields: Optional[str] = None) -> Optional[Place]:
         """
         Get detailed information for a place.
         
+        The details cache, if configured, is consulted before calling the
+        Details API and is keyed by place_id and requested fields.
+        
         Args:
             place_id: Google Places place ID
+            fields: Comma-separated Details API fields (default: Config.PLACE_DETAILS_FIELDS)
             
         Returns:
-            Place details dictionary or None if rating < MIN_RATING
+            Place or None if rating < MIN_RATING
             
         Raises:
             APIError: If API request fails
         """
-        url = f"{self.config.GOOGLE_PLACES_BASE_URL}/details/json"
-        params = {
-            "place_id": place_id,
-            "key": self.api_key,
-            "fields": "name,rating,user_ratings_total,formatted_address,vicinity,url,geometry"
-        }
+        fields = fields or self.config.PLACE_DETAILS_FIELDS
+        cache_key = f"{place_id}:{fields}"
         
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            result = data.get('result', {})
+            result = self.details_cache.get(cache_key) if self.details_cache is not None else None
+            if result is None:
+                result = self._fetch_place_details(place_id, fields)
+                if result and self.details_cache is not None:
+                    self.details_cache.set(cache_key, result)
             
             if not result:
                 return None
@@ -47,22 +64,30 @@ class PlacesService:
             if rating < self.config.MIN_RATING:
                 return None
             
-            return {
-                "name": result.get('name', '정보 없음'),
-                "rating": rating,
-                "user_ratings_total": result.get('user_ratings_total', '정보 없음'),
-                "formatted_address": result.get('formatted_address') or result.get('vicinity', '주소 정보가 제공되지 않음'),
-                "url": result.get('url', 'URL 정보가 제공되지 않음'),
-                "geometry": result.get('geometry', {})
-            }
+            return Place.from_details(result, place_id)
             
         except requests.RequestException as e:
             raise APIError(f"Place details API 요청 실패: {str(e)}")
     
+    def _fetch_place_details(self, place_id: str, fields: str) -> Dict[str, Any]:
+        """Call the Details API and return the raw result payload."""
+        url = f"{self.config.GOOGLE_PLACES_BASE_URL}/details/json"
+        params = {
+            "place_id": place_id,
+            "key": self.api_key,
+            "fields": fields
+        }
+        
+        data = self.http_client.get_json(url, params)
+        return data.get('result', {})
+    
     def search_nearby_places(self, location: str, radius: int, place_type: str) -> List[Dict[str, Any]]:
         """
         Search for nearby places of a specific type.
         
+        If a spatial tile cache is configured, results for the covering tile
+        are reused and filtered by distance from the query center.
+        
         Args:
             location: Location coordinates as "lat,lng"
             radius: Search radius in meters
@@ -74,76 +99,403 @@ class PlacesService:
         Raises:
             APIError: If API request fails
         """
+        try:
+            if self.nearby_cache is not None:
+                lat, lng = parse_location_string(location)
+                results = self.nearby_cache.search(
+                    lat, lng, radius, place_type,
+                    lambda tile_location, tile_radius, page_token: self._fetch_nearby_page(
+                        tile_location, tile_radius, place_type, page_token
+                    )
+                )
+                if results is not None:
+                    return results
+            
+            return self._fetch_nearby_places(location, radius, place_type)
+            
+        except requests.RequestException as e:
+            raise APIError(f"Nearby search API 요청 실패: {str(e)}")
+    
+    def _fetch_nearby_places(self, location: str, radius: int, place_type: str) -> List[Dict[str, Any]]:
+        """Call the Nearby Search API and return the raw results."""
+        return self._fetch_nearby_page(location, radius, place_type)[0]
+    
+    def _fetch_nearby_page(self, location: str, radius: int, place_type: str,
+                           page_token: Optional[str] = None
+                           ) -> Optional[Tuple[List[Dict[str, Any]], Optional[str]]]:
+        """
+        Fetch one raw Nearby Search page.
+        
+        Returns:
+            Tuple of (results, next_page_token), or None if page_token is
+            still rejected after PAGE_TOKEN_MAX_ATTEMPTS (e.g. it expired)
+        """
         url = f"{self.config.GOOGLE_PLACES_BASE_URL}/nearbysearch/json"
-        params = {
-            "location": location,
-            "radius": radius,
-            "type": place_type,
-            "key": self.api_key
-        }
+        if page_token is None:
+            data = self.http_client.get_json(url, {
+                "location": location,
+                "radius": radius,
+                "type": place_type,
+                "key": self.api_key
+            })
+        else:
+            # A new page token only becomes valid after a short delay
+            for _ in range(self.config.PAGE_TOKEN_MAX_ATTEMPTS):
+                time.sleep(self.config.PAGE_TOKEN_DELAY)
+                data = self.http_client.get_json(url, {"pagetoken": page_token, "key": self.api_key})
+                if data.get('status') != 'INVALID_REQUEST':
+                    break
+            else:
+                return None
         
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
+        return data.get('results', []), data.get('next_page_token')
+    
+    def iter_nearby_places(self, location: str, radius: int, place_type: str) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate nearby search results across result pages.
+        
+        Further pages are requested via ``next_page_token`` only when the
+        consumer asks for more items, honoring the token activation delay.
+        When a spatial tile cache is configured the pages are those of the
+        covering tile: everything cached for it is yielded first, and the
+        tile query is continued from its cached ``next_page_token`` only if
+        more are needed.
+        
+        Args:
+            location: Location coordinates as "lat,lng"
+            radius: Search radius in meters
+            place_type: Google Places type
+            
+        Yields:
+            Place dictionaries, deduplicated by place_id
             
-            data = response.json()
-            return data.get('results', [])
+        Raises:
+            APIError: If API request fails
+        """
+        seen_ids = set()
+        
+        try:
+            pages = None
+            if self.nearby_cache is not None:
+                lat, lng = parse_location_string(location)
+                pages = self.nearby_cache.search_pages(
+                    lat, lng, radius, place_type,
+                    lambda tile_location, tile_radius, page_token: self._fetch_nearby_page(
+                        tile_location, tile_radius, place_type, page_token
+                    )
+                )
+            if pages is None:
+                pages = self._iter_nearby_pages(location, radius, place_type)
             
+            for page in pages:
+                for place in page:
+                    place_id = place.get('place_id')
+                    if place_id in seen_ids:
+                        continue
+                    seen_ids.add(place_id)
+                    yield place
+                    
         except requests.RequestException as e:
             raise APIError(f"Nearby search API 요청 실패: {str(e)}")
     
+    def _iter_nearby_pages(self, location: str, radius: int, place_type: str) -> Iterator[List[Dict[str, Any]]]:
+        """Yield raw Nearby Search result pages, following next_page_token."""
+        results, page_token = self._fetch_nearby_page(location, radius, place_type)
+        yield results
+        
+        while page_token:
+            fetched = self._fetch_nearby_page(location, radius, place_type, page_token)
+            if fetched is None:
+                return
+            results, page_token = fetched
+            yield results
+    
     def get_places_by_categories(self, categories: List[str], location: str, 
-                                radius: int, max_results: int) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+                                radius: int, max_results: int,
+                                stats: Optional[Dict[str, int]] = None) -> Tuple[PlaceBatch, PlaceBatch]:
         """
         Get places and restaurants by categories.
         
+        Every category (and the restaurant search) is consumed in parallel
+        as a lazily paginated stream. Candidates are pre-filtered on the
+        nearby-search payload (rating, review count, business status) so
+        Details quota is only spent on survivors. Detail lookups are resolved
+        concurrently with at most ``max_workers`` requests in flight, and a
+        stream stops fetching once ``max_results`` places rated at least
+        MIN_RATING are collected. Results keep category order and are
+        deduplicated by place_id; each place is looked up at most once.
+        
         Args:
             categories: List of place categories
             location: Location coordinates as "lat,lng"
             radius: Search radius in meters
             max_results: Maximum number of results per category
+            stats: Optional dictionary updated with this query's candidate and
+                Details call counters (see ``self.stats`` for running totals)
             
         Returns:
-            Tuple of (places, restaurants) lists
+            Tuple of (places, restaurants) batches
             
         Raises:
             APIError: If API requests fail
         """
-        all_places = []
-        restaurants = []
-        seen_place_ids = set()
-        seen_restaurant_ids = set()
-        
-        # Search for places by category
-        for category in categories:
-            try:
-                results = self.search_nearby_places(location, radius, category)
-                
-                for place in results[:max_results]:
-                    place_id = place.get('place_id')
-                    if place_id and place_id not in seen_place_ids:
-                        place_details = self.get_place_details(place_id)
-                        if place_details:
-                            all_places.append(place_details)
-                            seen_place_ids.add(place_id)
-                            
-            except APIError as e:
-                print(f"카테고리 '{category}' 검색 중 오류: {str(e)}")
-                continue
-        
-        # Search for restaurants
+        with ThreadPoolExecutor(max_workers=self.max_workers) as details_executor, \
+                ThreadPoolExecutor(max_workers=self.max_workers) as search_executor:
+            resolver = _DetailsResolver(self, details_executor)
+            
+            # Search each distinct category once, in parallel
+            category_futures = {
+                category: search_executor.submit(self._collect_category, resolver, location, radius,
+                                                 category, max_results, f"카테고리 '{category}'")
+                for category in dict.fromkeys(categories)
+            }
+            
+            # Reuse the restaurant category search if it is already running
+            restaurant_future = category_futures.get("restaurant") or search_executor.submit(
+                self._collect_category, resolver, location, radius, "restaurant", max_results, "레스토랑"
+            )
+            
+            all_places = self._merge_collected(future.result() for future in category_futures.values())
+            restaurants = self._merge_collected([restaurant_future.result()])
+        
+        self._record_stats(resolver, stats)
+        return all_places, restaurants
+    
+    def iter_places_by_categories(self, categories: List[str], location: str,
+                                  radius: int, max_results: int,
+                                  enrich: Optional[Callable[[Place], Place]] = None,
+                                  stats: Optional[Dict[str, int]] = None) -> Iterator[Tuple[str, Place]]:
+        """
+        Stream places and restaurants as soon as their details resolve.
+        
+        Searches run exactly as in ``get_places_by_categories``, but each
+        place is yielded the moment its Details lookup (and ``enrich``, if
+        given) completes, in completion order. Closing the generator early
+        stops the remaining searches and cancels queued lookups.
+        
+        Args:
+            categories: List of place categories
+            location: Location coordinates as "lat,lng"
+            radius: Search radius in meters
+            max_results: Maximum number of results per category
+            enrich: Optional function applied to each place on the worker
+                thread right after its details resolve (e.g. translation)
+            stats: Optional dictionary updated with this query's counters
+                once the stream is exhausted or closed
+            
+        Yields:
+            Tuples of ("places" or "restaurants", place), each place at most
+            once per section
+            
+        Raises:
+            APIError: If API requests fail
+        """
+        results: "queue.Queue[Optional[Tuple[Tuple[str, ...], str, Place]]]" = queue.Queue()
+        
+        # A restaurant category search also feeds the restaurant section
+        sections_by_type: Dict[str, Tuple[str, ...]] = {
+            category: ("places",) for category in dict.fromkeys(categories)
+        }
+        sections_by_type["restaurant"] = sections_by_type.get("restaurant", ()) + ("restaurants",)
+        
+        resolver: Optional[_DetailsResolver] = None
         try:
-            restaurant_results = self.search_nearby_places(location, radius, "restaurant")
-            
-            for restaurant in restaurant_results[:max_results]:
-                place_id = restaurant.get('place_id')
-                if place_id and place_id not in seen_restaurant_ids:
-                    restaurant_details = self.get_place_details(place_id)
-                    if restaurant_details:
-                        restaurants.append(restaurant_details)
-                        seen_restaurant_ids.add(place_id)
+            with ThreadPoolExecutor(max_workers=self.max_workers) as details_executor, \
+                    ThreadPoolExecutor(max_workers=self.max_workers) as search_executor:
+                resolver = _DetailsResolver(self, details_executor, enrich)
+                futures = []
+                for place_type, sections in sections_by_type.items():
+                    label = "레스토랑" if sections == ("restaurants",) else f"카테고리 '{place_type}'"
+                    on_place = (lambda place_id, place, sections=sections: results.put((sections, place_id, place)))
+                    future = search_executor.submit(self._collect_category, resolver, location, radius,
+                                                    place_type, max_results, label, on_place)
+                    future.add_done_callback(lambda _: results.put(None))
+                    futures.append(future)
+                
+                seen_ids: Dict[str, set] = {"places": set(), "restaurants": set()}
+                try:
+                    remaining = len(futures)
+                    while remaining:
+                        item = results.get()
+                        if item is None:
+                            remaining -= 1
+                            continue
                         
+                        sections, place_id, place = item
+                        for section in sections:
+                            if place_id not in seen_ids[section]:
+                                seen_ids[section].add(place_id)
+                                yield section, place
+                    
+                    for future in futures:
+                        future.result()
+                finally:
+                    resolver.stop()
+        
+        finally:
+            if resolver is not None:
+                self._record_stats(resolver, stats)
+    
+    def _record_stats(self, resolver: "_DetailsResolver", stats: Optional[Dict[str, int]]) -> None:
+        """Add a query's counters to the running totals and the caller's dictionary."""
+        query_stats = resolver.query_stats()
+        with self._stats_lock:
+            for key, value in query_stats.items():
+                self.stats[key] += value
+        if stats is not None:
+            stats.update(query_stats)
+    
+    def _passes_prefilter(self, place: Dict[str, Any]) -> bool:
+        """Check a nearby-search hit against rating, review and status thresholds."""
+        if place.get('rating', 0) < self.config.MIN_RATING:
+            return False
+        if place.get('user_ratings_total', 0) < self.config.MIN_REVIEW_COUNT:
+            return False
+        return place.get('business_status', 'OPERATIONAL') == 'OPERATIONAL'
+    
+    def _collect_category(self, resolver: "_DetailsResolver", location: str, radius: int,
+                          place_type: str, max_results: int, label: str,
+                          on_place: Optional[Callable[[str, Place], None]] = None) -> List[Tuple[str, Place]]:
+        """
+        Consume one category stream until max_results qualifying places are found.
+        
+        Without ``on_place`` each batch is returned in search order; with it,
+        every place is also reported as soon as its lookup completes.
+        """
+        collected = []
+        seen_ids = set()
+        stream = self.iter_nearby_places(location, radius, place_type)
+        
+        try:
+            while len(collected) < max_results and not resolver.stopped:
+                batch = []
+                for place in stream:
+                    place_id = place.get('place_id')
+                    if place_id and place_id not in seen_ids:
+                        seen_ids.add(place_id)
+                        if not self._passes_prefilter(place):
+                            resolver.count('prefiltered')
+                            continue
+                        batch.append(place_id)
+                        if len(batch) >= max_results - len(collected):
+                            break
+                
+                if not batch:
+                    break
+                
+                if on_place is None:
+                    resolved = zip(batch, resolver.resolve(batch))
+                else:
+                    resolved = resolver.resolve_as_completed(batch)
+                
+                for place_id, details in resolved:
+                    if details:
+                        collected.append((place_id, details))
+                        if on_place is not None:
+                            on_place(place_id, details)
+                
         except APIError as e:
-            print(f"레스토랑 검색 중 오류: {str(e)}")
+            print(f"{label} 검색 중 오류: {str(e)}")
+        finally:
+            stream.close()
         
-        return all_places, restaurants
+        return collected
+    
+    def _merge_collected(self, collected_lists: Iterable[List[Tuple[str, Place]]]) -> PlaceBatch:
+        """Merge per-category results in order, dropping repeated place IDs."""
+        merged = []
+        seen_ids = set()
+        for collected in collected_lists:
+            for place_id, details in collected:
+                if place_id not in seen_ids:
+                    seen_ids.add(place_id)
+                    merged.append(details)
+        return PlaceBatch.from_places(merged)
+
+class _DetailsResolver:
+    """Resolve place details concurrently, looking each place_id up once per query."""
+    
+    def __init__(self, service: PlacesService, executor: ThreadPoolExecutor,
+                 enrich: Optional[Callable[[Place], Place]] = None):
+        self.service = service
+        self.executor = executor
+        self.enrich = enrich
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._stats = _new_query_stats()
+        self._stopped = threading.Event()
+    
+    @property
+    def stopped(self) -> bool:
+        """Whether the consumer has stopped; searches should not fetch more."""
+        return self._stopped.is_set()
+    
+    def stop(self) -> None:
+        """Stop further searches and cancel lookups that have not started."""
+        self._stopped.set()
+        with self._lock:
+            for future in self._futures.values():
+                future.cancel()
+    
+    def _lookup(self, place_id: str) -> Optional[Place]:
+        """Fetch details and apply the enrichment step."""
+        details = self.service.get_place_details(place_id)
+        if details is not None and self.enrich is not None:
+            details = self.enrich(details)
+        return details
+    
+    def count(self, key: str, amount: int = 1) -> None:
+        """Increment a per-query counter."""
+        with self._lock:
+            self._stats[key] += amount
+    
+    def query_stats(self) -> Dict[str, int]:
+        """Return the counters for this query."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['details_avoided'] = stats['prefiltered'] + stats['deduplicated']
+        return stats
+    
+    def _submit(self, place_ids: List[str]) -> List[Future]:
+        """Start (or reuse) a lookup future for each place ID."""
+        with self._lock:
+            futures = []
+            for place_id in place_ids:
+                if place_id in self._futures:
+                    self._stats['deduplicated'] += 1
+                else:
+                    self._stats['details_requests'] += 1
+                    self._futures[place_id] = self.executor.submit(self._lookup, place_id)
+                futures.append(self._futures[place_id])
+        return futures
+    
+    def resolve(self, place_ids: List[str]) -> List[Optional[Place]]:
+        """Return details for each place ID in order (None if filtered or failed)."""
+        return [self._result(future) for future in self._submit(place_ids)]
+    
+    def resolve_as_completed(self, place_ids: List[str]) -> Iterator[Tuple[str, Optional[Place]]]:
+        """Yield (place_id, details) pairs in completion order (details None if filtered or failed)."""
+        futures = {}
+        for place_id, future in zip(place_ids, self._submit(place_ids)):
+            futures.setdefault(future, place_id)
+        for future in as_completed(futures):
+            yield futures[future], self._result(future)
+    
+    def _result(self, future: Future) -> Optional[Place]:
+        """Wait for a lookup, reporting API errors instead of raising them."""
+        try:
+            return future.result()
+        except CancelledError:
+            return None
+        except APIError as e:
+            print(f"장소 상세 정보 조회 중 오류: {str(e)}")
+            return None
+
+def _new_query_stats() -> Dict[str, int]:
+    """Create zeroed Details-call counters."""
+    return {
+        "prefiltered": 0,
+        "deduplicated": 0,
+        "details_requests": 0,
+        "details_avoided": 0
+    }
@@ -1,14 +1,34 @@
 """Translation service for text translation."""
 
-from deep_translator import GoogleTranslator
-from typing import Optional
+import hashlib
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional
 from ..exceptions import TranslationError
+from ..utils.cache import BaseCache
+from ..utils.script import needs_translation
+
+if TYPE_CHECKING:
+    from deep_translator import GoogleTranslator
 
 class TranslationService:
     """Service for text translation using Google Translator."""
     
-    def __init__(self):
-        self.translator = GoogleTranslator()
+    # Google Translate accepts at most 5000 characters per request
+    MAX_BATCH_CHARS = 4500
+    BATCH_SEPARATOR = "\n"
+    
+    def __init__(self, cache: Optional[BaseCache] = None):
+        self.cache = cache
+        self.stats = {
+            "texts": 0,
+            "skipped": 0,
+            "deduplicated": 0,
+            "cache_hits": 0,
+            "translated": 0,
+            "requests": 0
+        }
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
     
     def translate_text(self, text: str, target_language: str = 'ko') -> str:
         """
@@ -27,28 +47,121 @@ class TranslationService:
         if not text or not text.strip():
             return text
         
-        try:
-            # Skip translation if text is already in Korean (simple heuristic)
-            if self._is_korean(text):
-                return text
+        return self.translate_batch([text], target_language)[0]
+    
+    def translate_batch(self, texts: List[str], target_language: str = 'ko') -> List[str]:
+        """
+        Translate several texts with as few network calls as possible.
+        
+        Texts already in the target script are skipped, inputs are
+        deduplicated and served from the translation cache when possible,
+        and the remaining strings are sent in bulk requests of up to
+        MAX_BATCH_CHARS characters. Avoided network translations are
+        counted in ``self.stats``.
+        
+        Args:
+            texts: Texts to translate
+            target_language: Target language code (default: 'ko')
             
-            translated = self.translator.translate(text, target=target_language)
-            return translated if translated else text
+        Returns:
+            Translated texts in input order
             
+        Raises:
+            TranslationError: If translation fails
+        """
+        results = list(texts)
+        pending: Dict[str, List[int]] = {}
+        
+        for i, (text, needed) in enumerate(zip(texts, needs_translation(texts, target_language))):
+            if needed:
+                pending.setdefault(text, []).append(i)
+        
+        untranslated = []
+        for text, indices in pending.items():
+            cached = self.cache.get(self._cache_key(text, target_language)) if self.cache is not None else None
+            if cached is None:
+                untranslated.append(text)
+                continue
+            for i in indices:
+                results[i] = cached
+        
+        needed_count = sum(len(indices) for indices in pending.values())
+        self._count(
+            texts=len(texts),
+            skipped=len(texts) - needed_count,
+            deduplicated=needed_count - len(pending),
+            cache_hits=len(pending) - len(untranslated),
+            translated=len(untranslated)
+        )
+        
+        try:
+            translations = self._translate_bulk(untranslated, target_language)
         except Exception as e:
             raise TranslationError(f"번역 실패: {str(e)}")
-    
-    def _is_korean(self, text: str) -> bool:
-        """Check if text contains Korean characters."""
-        korean_chars = 0
-        total_chars = len([c for c in text if c.isalpha()])
         
-        if total_chars == 0:
-            return False
+        for text, translated in zip(untranslated, translations):
+            translated = translated or text
+            if self.cache is not None:
+                self.cache.set(self._cache_key(text, target_language), translated)
+            for i in pending[text]:
+                results[i] = translated
+        
+        return results
+    
+    def _translate_bulk(self, texts: List[str], target_language: str) -> List[str]:
+        """Translate texts joined into chunks, falling back per text on mismatch."""
+        translations = []
+        for chunk in self._chunk(texts):
+            if len(chunk) == 1:
+                translations.append(self._translate_one(chunk[0], target_language))
+                continue
+            
+            joined = self.BATCH_SEPARATOR.join(text.replace(self.BATCH_SEPARATOR, " ") for text in chunk)
+            parts = (self._translate_one(joined, target_language) or "").split(self.BATCH_SEPARATOR)
+            
+            if len(parts) == len(chunk):
+                translations.extend(part.strip() for part in parts)
+            else:
+                translations.extend(self._translate_one(text, target_language) for text in chunk)
         
-        for char in text:
-            if '\uac00' <= char <= '\ud7af':  # Korean syllables
-                korean_chars += 1
+        return translations
+    
+    def _chunk(self, texts: List[str]) -> List[List[str]]:
+        """Group texts into chunks that fit in a single request."""
+        chunks: List[List[str]] = []
+        size = 0
+        for text in texts:
+            if chunks and size + len(text) + len(self.BATCH_SEPARATOR) <= self.MAX_BATCH_CHARS:
+                chunks[-1].append(text)
+                size += len(text) + len(self.BATCH_SEPARATOR)
+            else:
+                chunks.append([text])
+                size = len(text)
+        return chunks
+    
+    def _translate_one(self, text: str, target_language: str) -> str:
+        """Translate a single request's worth of text."""
+        self._count(requests=1)
+        return self._get_translator(target_language).translate(text)
+    
+    def _get_translator(self, target_language: str) -> "GoogleTranslator":
+        """Return a per-thread translator for the target language."""
+        from deep_translator import GoogleTranslator
         
-        # If more than 50% of alphabetic characters are Korean, consider it Korean
-        return korean_chars / total_chars > 0.5
+        translators = getattr(self._local, "translators", None)
+        if translators is None:
+            translators = self._local.translators = {}
+        if target_language not in translators:
+            translators[target_language] = GoogleTranslator(source='auto', target=target_language)
+        return translators[target_language]
+    
+    def _cache_key(self, text: str, target_language: str) -> str:
+        """Build a cache key from the target language and a hash of the text."""
+        digest = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        return f"{target_language}:{digest}"
+    
+    def _count(self, **amounts: int) -> None:
+        """Increment translation counters."""
+        with self._stats_lock:
+            for key, amount in amounts.items():
+                self.stats[key] += amount
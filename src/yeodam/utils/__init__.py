@@ -4,11 +4,73 @@ Utils module - 유틸리티 함수들
 공통 유틸리티 함수와 디스플레이 서비스를 제공
 """
 
-from .utils import load_dynamic_mapping, save_dynamic_mapping
-from .display_service import DisplayService
+from typing import TYPE_CHECKING
+from .._lazy import lazy_exports
 
 __all__ = [
     "load_dynamic_mapping",
     "save_dynamic_mapping",
-    "DisplayService"
+    "DisplayService",
+    "ResultRenderer",
+    "TextTableRenderer",
+    "NDJSONRenderer",
+    "JSONRenderer",
+    "DataFrameRenderer",
+    "create_renderer",
+    "BaseCache",
+    "MemoryCache",
+    "SQLiteCache",
+    "TieredCache",
+    "create_cache",
+    "SpatialTileCache",
+    "SingleFlight",
+    "RateLimiter",
+    "DynamicMappingStore",
+    "ScriptCounts",
+    "classify_script",
+    "classify_scripts",
+    "is_target_language",
+    "needs_translation"
 ]
+
+# Resolved on first access (PEP 562); DisplayService in particular needs pandas
+_LAZY_ATTRS = {
+    "load_dynamic_mapping": ".utils",
+    "save_dynamic_mapping": ".utils",
+    "DisplayService": ".display_service",
+    "ResultRenderer": ".renderers",
+    "TextTableRenderer": ".renderers",
+    "NDJSONRenderer": ".renderers",
+    "JSONRenderer": ".renderers",
+    "DataFrameRenderer": ".renderers",
+    "create_renderer": ".renderers",
+    "BaseCache": ".cache",
+    "MemoryCache": ".cache",
+    "SQLiteCache": ".cache",
+    "TieredCache": ".cache",
+    "create_cache": ".cache",
+    "SpatialTileCache": ".spatial_cache",
+    "SingleFlight": ".singleflight",
+    "RateLimiter": ".rate_limiter",
+    "DynamicMappingStore": ".mapping_store",
+    "ScriptCounts": ".script",
+    "classify_script": ".script",
+    "classify_scripts": ".script",
+    "is_target_language": ".script",
+    "needs_translation": ".script"
+}
+
+if TYPE_CHECKING:
+    from .utils import load_dynamic_mapping, save_dynamic_mapping
+    from .display_service import DisplayService
+    from .renderers import (
+        ResultRenderer, TextTableRenderer, NDJSONRenderer, JSONRenderer, DataFrameRenderer, create_renderer
+    )
+    from .cache import BaseCache, MemoryCache, SQLiteCache, TieredCache, create_cache
+    from .spatial_cache import SpatialTileCache
+    from .singleflight import SingleFlight
+    from .rate_limiter import RateLimiter
+    from .mapping_store import DynamicMappingStore
+    from .script import ScriptCounts, classify_script, classify_scripts, is_target_language, needs_translation
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_ATTRS, __all__)
@@ -0,0 +1,226 @@
+"""Caching primitives shared by the API services."""
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+from ..config import Config
+
+class BaseCache(ABC):
+    """Interface for key-value caches with per-entry TTL and hit/miss counters."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key, expiring after ttl seconds."""
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for this cache."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0
+        }
+
+    def _record(self, value: Optional[Any]) -> Optional[Any]:
+        """Update hit/miss counters for a lookup result."""
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+class MemoryCache(BaseCache):
+    """Thread-safe in-memory LRU cache with per-entry TTL."""
+
+    def __init__(self, max_entries: int = 1024, default_ttl: Optional[float] = None):
+        super().__init__()
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return self._record(None)
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                return self._record(None)
+
+            self._entries.move_to_end(key)
+            return self._record(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = ttl if ttl is not None else self.default_ttl
+        expires_at = time.time() + ttl if ttl is not None else None
+
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats["size"] = len(self._entries)
+        return stats
+
+class SQLiteCache(BaseCache):
+    """Persistent SQLite-backed cache with per-entry TTL and size-bounded eviction.
+
+    Values are stored as JSON, so only JSON-serializable values are supported.
+    """
+
+    # Evict at most once per this many writes to keep writes cheap
+    EVICTION_INTERVAL = 100
+
+    def __init__(self, path: str, table: str = "cache",
+                 default_ttl: Optional[float] = None, max_entries: int = 100000):
+        super().__init__()
+        if not table.isidentifier():
+            raise ValueError(f"유효하지 않은 캐시 테이블 이름입니다: {table}")
+
+        self.path = path
+        self.table = table
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn = connect_sqlite(path)
+        with self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+            )
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {table}_expires_at ON {table} (expires_at)"
+            )
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return self._record(None)
+
+            value, expires_at = row
+            if expires_at is not None and expires_at <= time.time():
+                with self._conn:
+                    self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                return self._record(None)
+
+            return self._record(json.loads(value))
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = ttl if ttl is not None else self.default_ttl
+        expires_at = time.time() + ttl if ttl is not None else None
+
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(value, ensure_ascii=False), expires_at)
+                )
+
+            self._writes += 1
+            if self._writes % self.EVICTION_INTERVAL == 0:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Drop expired entries, then the soonest-expiring ones above max_entries."""
+        with self._conn:
+            self._conn.execute(
+                f"DELETE FROM {self.table} WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),)
+            )
+            self._conn.execute(
+                f"DELETE FROM {self.table} WHERE key IN ("
+                f"SELECT key FROM {self.table} ORDER BY expires_at IS NULL, expires_at "
+                f"LIMIT max(0, (SELECT COUNT(*) FROM {self.table}) - ?))",
+                (self.max_entries,)
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats["size"] = len(self)
+        return stats
+
+class TieredCache(BaseCache):
+    """Two-level cache: a fast front cache backed by a persistent store."""
+
+    def __init__(self, front: BaseCache, back: BaseCache):
+        super().__init__()
+        self.front = front
+        self.back = back
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.front.get(key)
+        if value is None:
+            value = self.back.get(key)
+            if value is not None:
+                self.front.set(key, value)
+        return self._record(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.front.set(key, value, ttl)
+        self.back.set(key, value, ttl)
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats["front"] = self.front.stats()
+        stats["back"] = self.back.stats()
+        return stats
+
+def connect_sqlite(path: str) -> sqlite3.Connection:
+    """Open a SQLite connection suitable for sharing across threads and processes."""
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+def create_cache(table: str, ttl: Optional[float], memory_size: int,
+                 max_entries: int, path: Optional[str] = None) -> BaseCache:
+    """
+    Create an in-memory LRU cache backed by a persistent SQLite store.
+
+    Args:
+        table: SQLite table name for this cache
+        ttl: Default time-to-live in seconds
+        memory_size: Maximum number of entries kept in memory
+        max_entries: Maximum number of entries kept on disk
+        path: SQLite database path (default: Config.CACHE_DB_FILE)
+
+    Returns:
+        Tiered cache, or a memory-only cache if the store cannot be opened
+    """
+    front = MemoryCache(memory_size, ttl)
+    try:
+        back = SQLiteCache(path or Config.CACHE_DB_FILE, table, ttl, max_entries)
+    except sqlite3.Error as e:
+        print(f"캐시 저장소를 열 수 없어 메모리 캐시만 사용합니다: {str(e)}")
+        return front
+    return TieredCache(front, back)
@@ -1,72 +1,140 @@
 """Display service for showing search results."""
 
-import pandas as pd
-from typing import List, Dict, Any
-from IPython.display import display
-from ..services.translation_service import TranslationService
+import dataclasses
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+from ..config import Config
+from ..exceptions import TranslationError
+from .renderers import ResultRenderer, create_renderer
+
+if TYPE_CHECKING:
+    from ..models import Place, PlaceBatch
+    from ..services.translation_service import TranslationService
 
 class DisplayService:
-    """Service for displaying search results in formatted tables."""
+    """Service for displaying search results through a pluggable renderer."""
+    
+    def __init__(self, translator: Optional["TranslationService"] = None,
+                 renderer: Optional[ResultRenderer] = None):
+        """
+        Initialize the display service.
+        
+        Args:
+            translator: Translator for names and addresses (created on first use if omitted)
+            renderer: Output renderer (default: Config.DISPLAY_RENDERER)
+        """
+        self._translator = translator
+        self.renderer = renderer or create_renderer(Config.DISPLAY_RENDERER)
     
-    def __init__(self):
-        self.translator = TranslationService()
+    @property
+    def translator(self) -> "TranslationService":
+        """Translator, created on first use if none was injected."""
+        if self._translator is None:
+            from ..services.translation_service import TranslationService
+            self._translator = TranslationService()
+        return self._translator
     
-    def display_results(self, places: List[Dict[str, Any]], 
-                       restaurants: List[Dict[str, Any]]) -> None:
+    def display_results(self, places: "PlaceBatch", restaurants: "PlaceBatch") -> None:
         """
-        Display places and restaurants in formatted DataFrames.
+        Translate and render places and restaurants.
         
         Args:
-            places: List of place details
-            restaurants: List of restaurant details
+            places: Place results
+            restaurants: Restaurant results
         """
-        self._display_places(places)
-        self._display_restaurants(restaurants)
+        names, addresses = self._translate_names_and_addresses(
+            places.names + restaurants.names,
+            places.formatted_addresses + restaurants.formatted_addresses
+        )
+        split = len(places)
+        self._render_section("places", "추천 장소", "추천 장소가 없습니다.",
+                             places.with_text(names[:split], addresses[:split]))
+        self._render_section("restaurants", "추천 맛집", "추천 맛집이 없습니다.",
+                             restaurants.with_text(names[split:], addresses[split:]))
+        self.renderer.finish()
     
-    def _display_places(self, places: List[Dict[str, Any]]) -> None:
-        """Display places in a DataFrame."""
-        if not places:
-            print("추천 장소가 없습니다.")
-            return
+    def translate_place(self, place: "Place") -> "Place":
+        """
+        Translate one place's name and address.
         
-        print("추천 장소:")
-        places_data = []
+        Meant to run per item while results are still arriving; if the
+        translation fails the place is returned unchanged.
         
-        for place in places:
-            translated_name = self.translator.translate_text(place.get('name', '정보 없음'))
-            translated_address = self.translator.translate_text(place.get('formatted_address', '주소 정보가 제공되지 않음'))
+        Args:
+            place: Place to translate
             
-            places_data.append({
-                "이름": translated_name,
-                "주소": translated_address,
-                "평점": place.get('rating', 0),
-                "리뷰 수": place.get('user_ratings_total', '정보 없음'),
-                "URL": place.get('url', 'URL 정보가 제공되지 않음')
-            })
-        
-        places_df = pd.DataFrame(places_data)
-        display(places_df)
+        Returns:
+            Place with translated name and address
+        """
+        try:
+            name, address = self.translator.translate_batch([place.name, place.formatted_address])
+        except TranslationError as e:
+            print(f"번역 중 오류: {str(e)}")
+            return place
+        return dataclasses.replace(place, name=name, formatted_address=address)
     
-    def _display_restaurants(self, restaurants: List[Dict[str, Any]]) -> None:
-        """Display restaurants in a DataFrame."""
-        if not restaurants:
-            print("추천 맛집이 없습니다.")
-            return
+    def display_stream(self, stream: Iterator[Tuple[str, "Place"]], max_results: int) -> None:
+        """
+        Render places progressively as a stream produces them.
         
-        print("\n추천 맛집:")
-        restaurants_data = []
+        Place rows are written the moment they arrive. So that the two
+        sections do not interleave, restaurants arriving while the places
+        section is still open are held back and written as soon as it closes,
+        i.e. once max_results places have been written or the stream ends;
+        after that restaurant rows are written as they arrive too. Places
+        are expected to be translated already (see ``translate_place``).
+        Once both sections have max_results rows the stream is closed, which
+        stops any searches still running behind it.
         
-        for restaurant in restaurants:
-            translated_name = self.translator.translate_text(restaurant.get('name', '정보 없음'))
-            translated_address = self.translator.translate_text(restaurant.get('formatted_address', '주소 정보가 제공되지 않음'))
-            
-            restaurants_data.append({
-                "이름": translated_name,
-                "주소": translated_address,
-                "평점": restaurant.get('rating', 0),
-                "리뷰 수": restaurant.get('user_ratings_total', '정보 없음'),
-                "URL": restaurant.get('url', 'URL 정보가 제공되지 않음')
-            })
+        Args:
+            stream: Iterator of ("places" or "restaurants", place) tuples
+            max_results: Maximum number of rows per section
+        """
+        held: List["Place"] = []
+        counts = {"places": 0, "restaurants": 0}
+        current = "places"
+        self.renderer.begin_section("places", "추천 장소")
+        try:
+            for section, place in stream:
+                if section == current:
+                    if counts[section] < max_results:
+                        self.renderer.write_row(section, place)
+                        counts[section] += 1
+                elif section == "restaurants" and len(held) < max_results:
+                    held.append(place)
+                
+                if current == "places" and counts["places"] >= max_results:
+                    current = self._open_restaurants(counts, held)
+                if counts["places"] >= max_results and counts["restaurants"] >= max_results:
+                    break
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
         
-        restaurants_df = pd.DataFrame(restaurants_data)
-        display(restaurants_df)
+        if current == "places":
+            self._open_restaurants(counts, held)
+        self.renderer.end_section("restaurants", counts["restaurants"], "추천 맛집이 없습니다.")
+        self.renderer.finish()
+    
+    def _open_restaurants(self, counts: Dict[str, int], held: List["Place"]) -> str:
+        """Close the places section, open the restaurants section and write held-back rows."""
+        self.renderer.end_section("places", counts["places"], "추천 장소가 없습니다.")
+        self.renderer.begin_section("restaurants", "추천 맛집")
+        for place in held:
+            self.renderer.write_row("restaurants", place)
+        counts["restaurants"] += len(held)
+        held.clear()
+        return "restaurants"
+    
+    def _translate_names_and_addresses(self, names: List[str],
+                                       addresses: List[str]) -> Tuple[List[str], List[str]]:
+        """Translate every name and address with a single batch call."""
+        translated = self.translator.translate_batch(names + addresses)
+        return translated[:len(names)], translated[len(names):]
+    
+    def _render_section(self, key: str, title: str, empty_message: str, places: "PlaceBatch") -> None:
+        """Stream one section of results to the renderer."""
+        self.renderer.begin_section(key, title)
+        for place in places:
+            self.renderer.write_row(key, place)
+        self.renderer.end_section(key, len(places), empty_message)
@@ -0,0 +1,88 @@
+"""Geospatial helpers: distances and geohash tiles."""
+
+import math
+from typing import Optional, Tuple
+
+EARTH_RADIUS_M = 6371008.8
+METERS_PER_DEGREE = math.pi * EARTH_RADIUS_M / 180
+
+_GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_GEOHASH_DECODE = {char: i for i, char in enumerate(_GEOHASH_BASE32)}
+
+def haversine_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance between two coordinates in meters."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+def geohash_encode(lat: float, lng: float, precision: int) -> str:
+    """Encode coordinates as a geohash string of the given length."""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    value = 0
+    even = True
+
+    while len(chars) < precision:
+        rng, coord = (lng_range, lng) if even else (lat_range, lat)
+        mid = (rng[0] + rng[1]) / 2
+        value <<= 1
+        if coord >= mid:
+            value |= 1
+            rng[0] = mid
+        else:
+            rng[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_GEOHASH_BASE32[value])
+            bits = 0
+            value = 0
+
+    return "".join(chars)
+
+def geohash_decode(geohash: str) -> Tuple[float, float]:
+    """Decode a geohash to the coordinates of its tile center."""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    even = True
+
+    for char in geohash:
+        value = _GEOHASH_DECODE[char]
+        for shift in range(4, -1, -1):
+            rng = lng_range if even else lat_range
+            mid = (rng[0] + rng[1]) / 2
+            if (value >> shift) & 1:
+                rng[0] = mid
+            else:
+                rng[1] = mid
+            even = not even
+
+    return (lat_range[0] + lat_range[1]) / 2, (lng_range[0] + lng_range[1]) / 2
+
+def geohash_tile_half_diagonal(precision: int, lat: float) -> float:
+    """Half the diagonal of a geohash tile at the given latitude, in meters."""
+    lng_bits = (5 * precision + 1) // 2
+    lat_bits = 5 * precision // 2
+    height = 180.0 / 2 ** lat_bits * METERS_PER_DEGREE
+    width = 360.0 / 2 ** lng_bits * METERS_PER_DEGREE * math.cos(math.radians(lat))
+    return math.hypot(width, height) / 2
+
+def geohash_precision_for_radius(radius: float, lat: float, fraction: float = 0.25,
+                                 max_precision: int = 9) -> int:
+    """Coarsest geohash precision whose tile half-diagonal is within fraction * radius."""
+    for precision in range(1, max_precision + 1):
+        if geohash_tile_half_diagonal(precision, lat) <= radius * fraction:
+            return precision
+    return max_precision
+
+def place_coordinates(place: dict) -> Optional[Tuple[float, float]]:
+    """Extract (lat, lng) from a Places API payload's geometry, if present."""
+    location = (place.get('geometry') or {}).get('location') or {}
+    lat, lng = location.get('lat'), location.get('lng')
+    if lat is None or lng is None:
+        return None
+    return lat, lng
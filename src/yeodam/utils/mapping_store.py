@@ -0,0 +1,147 @@
+"""Persistent store for learned keyword-to-category mappings."""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+from ..config import Config
+from ..exceptions import TravelRecommendationError
+from .cache import connect_sqlite
+from .utils import load_dynamic_mapping
+
+class DynamicMappingStore:
+    """
+    SQLite-backed dynamic mapping shared safely between processes.
+
+    The database runs in WAL mode and only new keyword entries are ever
+    inserted, so concurrent workers never overwrite each other. Nothing is
+    read until first use; after that, lookups are served from an in-memory
+    cache and misses fall through to the database to pick up entries written
+    by other processes. An existing pickle mapping is imported on first use.
+    ``version`` increases whenever entries are added to the cache, so
+    derived structures can tell when to rebuild.
+    """
+
+    def __init__(self, path: Optional[str] = None, legacy_path: Optional[str] = None):
+        self.path = path or Config.DYNAMIC_MAPPING_DB
+        self.legacy_path = legacy_path or Config.DYNAMIC_MAPPING_FILE
+        self._conn: Optional[sqlite3.Connection] = None
+        self._cache: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+        self.version = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database and load existing entries on first use."""
+        if self._conn is not None:
+            return self._conn
+
+        try:
+            conn = connect_sqlite(self.path)
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS dynamic_mapping ("
+                    "keyword TEXT PRIMARY KEY, categories TEXT NOT NULL)"
+                )
+            self._import_legacy(conn)
+            self._cache = {
+                keyword: json.loads(categories)
+                for keyword, categories in conn.execute("SELECT keyword, categories FROM dynamic_mapping")
+            }
+        except sqlite3.Error as e:
+            raise TravelRecommendationError(f"동적 매핑 로드 실패: {str(e)}")
+
+        self._conn = conn
+        return conn
+
+    def _import_legacy(self, conn: sqlite3.Connection) -> None:
+        """Import the legacy pickle mapping into an empty database."""
+        if not os.path.exists(self.legacy_path):
+            return
+        if conn.execute("SELECT 1 FROM dynamic_mapping LIMIT 1").fetchone():
+            return
+
+        legacy = load_dynamic_mapping(self.legacy_path)
+        with conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO dynamic_mapping (keyword, categories) VALUES (?, ?)",
+                [(keyword, json.dumps(list(categories))) for keyword, categories in legacy.items()]
+            )
+
+    def get(self, keyword: str) -> Optional[List[str]]:
+        """Return the categories mapped to a keyword, or None if unknown."""
+        with self._lock:
+            conn = self._connection()
+            if keyword in self._cache:
+                return self._cache[keyword]
+
+            row = conn.execute(
+                "SELECT categories FROM dynamic_mapping WHERE keyword = ?", (keyword,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._cache[keyword] = json.loads(row[0])
+            self.version += 1
+            return self._cache[keyword]
+
+    def put_many(self, entries: Dict[str, List[str]]) -> int:
+        """
+        Persist new keyword mappings, ignoring keywords already stored.
+
+        The first writer of a keyword wins: if another process stored it
+        meanwhile, its categories are kept and cached instead of ours.
+
+        Args:
+            entries: Mapping of keyword to categories
+
+        Returns:
+            Number of entries written
+        """
+        with self._lock:
+            conn = self._connection()
+            new_entries = {keyword: list(categories) for keyword, categories in entries.items()
+                           if keyword not in self._cache}
+            if not new_entries:
+                return 0
+
+            try:
+                with conn:
+                    written = conn.executemany(
+                        "INSERT OR IGNORE INTO dynamic_mapping (keyword, categories) VALUES (?, ?)",
+                        [(keyword, json.dumps(categories, ensure_ascii=False))
+                         for keyword, categories in new_entries.items()]
+                    ).rowcount
+                    rows = [
+                        conn.execute(
+                            "SELECT categories FROM dynamic_mapping WHERE keyword = ?", (keyword,)
+                        ).fetchone()
+                        for keyword in new_entries
+                    ]
+            except sqlite3.Error as e:
+                raise TravelRecommendationError(f"동적 매핑 저장 실패: {str(e)}")
+
+            self._cache.update(
+                (keyword, json.loads(row[0])) for keyword, row in zip(new_entries, rows) if row is not None
+            )
+            self.version += 1
+            return written
+
+    def items(self) -> List[Tuple[str, List[str]]]:
+        """Return all loaded (keyword, categories) pairs."""
+        with self._lock:
+            self._connection()
+            return list(self._cache.items())
+
+    def __contains__(self, keyword: str) -> bool:
+        return self.get(keyword) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            self._connection()
+            return iter(list(self._cache))
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._connection()
+            return len(self._cache)
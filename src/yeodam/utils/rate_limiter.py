@@ -0,0 +1,60 @@
+"""Token-bucket rate limiting shared across threads."""
+
+import threading
+import time
+from typing import Dict, Optional
+
+class RateLimiter:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``; each
+    ``acquire`` takes one token, sleeping until one is available. One
+    instance shared by every worker enforces a process-wide request rate.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Sustained number of acquisitions per second
+            burst: Maximum number of acquisitions without waiting
+                (default: one second's worth, at least 1)
+
+        Raises:
+            ValueError: If rate is not positive
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, int(burst if burst is not None else rate))
+        self.waited = 0.0
+        self.acquired = 0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, blocking until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            # Reserve the token now and sleep off the debt outside the lock,
+            # so waiting callers are served in arrival order
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.acquired += 1
+            self.waited += delay
+
+        if delay > 0:
+            time.sleep(delay)
+
+    def stats(self) -> Dict[str, float]:
+        """Return the number of acquisitions and the total time spent waiting."""
+        return {
+            "acquired": self.acquired,
+            "waited": self.waited
+        }
@@ -0,0 +1,193 @@
+"""Output renderers for recommendation results."""
+
+import json
+import sys
+import unicodedata
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, TextIO, Tuple
+
+if TYPE_CHECKING:
+    from ..models import Place
+
+# (header, Place attribute, display width); the last column is not padded
+COLUMNS: Tuple[Tuple[str, str, int], ...] = (
+    ("이름", "name", 28),
+    ("주소", "formatted_address", 44),
+    ("평점", "rating", 4),
+    ("리뷰 수", "user_ratings_total", 7),
+    ("URL", "url", 0)
+)
+
+def display_width(text: str) -> int:
+    """Terminal width of a string, counting East Asian wide characters as two."""
+    return sum(2 if unicodedata.east_asian_width(char) in ("W", "F") else 1 for char in text)
+
+def fit_width(text: str, width: int) -> str:
+    """Truncate (with an ellipsis) or pad a string to an exact display width."""
+    if display_width(text) > width:
+        result, used = [], 0
+        for char in text:
+            char_width = display_width(char)
+            if used + char_width > width - 1:
+                break
+            result.append(char)
+            used += char_width
+        text = "".join(result) + "…"
+    return text + " " * (width - display_width(text))
+
+class ResultRenderer(ABC):
+    """
+    Interface for rendering result sections.
+
+    DisplayService calls ``begin_section`` once per section, ``write_row``
+    for every place as soon as it is ready, ``end_section`` with the number
+    of rows written, and ``finish`` after the last section.
+    """
+
+    def begin_section(self, key: str, title: str) -> None:
+        """Start a section such as "places" or "restaurants"."""
+
+    @abstractmethod
+    def write_row(self, key: str, place: "Place") -> None:
+        """Render one place of the current section."""
+
+    def end_section(self, key: str, count: int, empty_message: str) -> None:
+        """Close a section; ``empty_message`` is meant for sections without rows."""
+
+    def finish(self) -> None:
+        """Flush anything buffered for the whole result."""
+
+class TextTableRenderer(ResultRenderer):
+    """
+    Dependency-free streaming text table.
+
+    Columns have fixed display widths (wide Hangul/Hanja characters count as
+    two cells), so each row is written and flushed as soon as it arrives.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream or sys.stdout
+        self._sections = 0
+        self._header_written = False
+
+    def begin_section(self, key: str, title: str) -> None:
+        if self._sections:
+            self.stream.write("\n")
+        self._sections += 1
+        self.stream.write(f"{title}:\n")
+        self._header_written = False
+
+    def write_row(self, key: str, place: "Place") -> None:
+        if not self._header_written:
+            self._write_line([header for header, _, _ in COLUMNS])
+            self._write_line(["-" * (width or 3) for _, _, width in COLUMNS])
+            self._header_written = True
+        self._write_line([self._format(getattr(place, attr)) for _, attr, _ in COLUMNS])
+        self.stream.flush()
+
+    def end_section(self, key: str, count: int, empty_message: str) -> None:
+        if not count:
+            self.stream.write(f"{empty_message}\n")
+            self.stream.flush()
+
+    def finish(self) -> None:
+        self._sections = 0
+
+    def _write_line(self, cells: List[str]) -> None:
+        parts = [fit_width(cell, width) if width else cell for cell, (_, _, width) in zip(cells, COLUMNS)]
+        self.stream.write("  ".join(parts).rstrip() + "\n")
+
+    def _format(self, value: Any) -> str:
+        if isinstance(value, float):
+            return f"{value:.1f}"
+        return str(value)
+
+class NDJSONRenderer(ResultRenderer):
+    """One JSON object per place and line, written as soon as it is ready."""
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream or sys.stdout
+
+    def write_row(self, key: str, place: "Place") -> None:
+        self.stream.write(json.dumps({"section": key, **place.to_dict()}, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+class JSONRenderer(ResultRenderer):
+    """A single JSON document with one list per section, written on finish."""
+
+    def __init__(self, stream: Optional[TextIO] = None, indent: Optional[int] = 2):
+        self.stream = stream or sys.stdout
+        self.indent = indent
+        self._sections: Dict[str, List[Dict[str, Any]]] = {}
+
+    def begin_section(self, key: str, title: str) -> None:
+        self._sections[key] = []
+
+    def write_row(self, key: str, place: "Place") -> None:
+        self._sections.setdefault(key, []).append(place.to_dict())
+
+    def finish(self) -> None:
+        json.dump(self._sections, self.stream, ensure_ascii=False, indent=self.indent)
+        self.stream.write("\n")
+        self.stream.flush()
+        self._sections = {}
+
+class DataFrameRenderer(ResultRenderer):
+    """
+    pandas DataFrame per section, shown with IPython's rich display.
+
+    Meant for notebooks; requires pandas and IPython.
+    """
+
+    def __init__(self):
+        self._rows: List[Dict[str, Any]] = []
+        self._title = ""
+        self._sections = 0
+
+    def begin_section(self, key: str, title: str) -> None:
+        self._rows = []
+        self._title = title
+
+    def write_row(self, key: str, place: "Place") -> None:
+        self._rows.append({header: getattr(place, attr) for header, attr, _ in COLUMNS})
+
+    def end_section(self, key: str, count: int, empty_message: str) -> None:
+        self._sections += 1
+        if not count:
+            print(empty_message)
+            return
+
+        import pandas as pd
+        from IPython.display import display
+        print(f"{self._title}:" if self._sections == 1 else f"\n{self._title}:")
+        display(pd.DataFrame(self._rows))
+
+    def finish(self) -> None:
+        self._sections = 0
+
+RENDERERS = {
+    "text": TextTableRenderer,
+    "ndjson": NDJSONRenderer,
+    "json": JSONRenderer,
+    "dataframe": DataFrameRenderer
+}
+
+def create_renderer(name: str, stream: Optional[TextIO] = None) -> ResultRenderer:
+    """
+    Create a renderer by name.
+
+    Args:
+        name: One of "text", "ndjson", "json" or "dataframe"
+        stream: Output stream for text-based renderers (default: stdout)
+
+    Returns:
+        Renderer instance
+
+    Raises:
+        ValueError: If the renderer name is unknown
+    """
+    if name not in RENDERERS:
+        raise ValueError(f"알 수 없는 출력 형식입니다: '{name}' (사용 가능: {', '.join(RENDERERS)})")
+    if name == "dataframe":
+        return DataFrameRenderer()
+    return RENDERERS[name](stream)
@@ -0,0 +1,92 @@
+"""Script classification for deciding which texts need translation."""
+
+import re
+from typing import List, NamedTuple
+
+# Precomposed Hangul syllables; Hangul Jamo, Compatibility Jamo and Jamo Extended-A/B
+_HANGUL_SYLLABLE_RE = re.compile("[\uac00-\ud7a3]")
+_HANGUL_JAMO_RE = re.compile("[\u1100-\u11ff\u3130-\u318f\ua960-\ua97f\ud7b0-\ud7ff]")
+_HANJA_RE = re.compile("[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]")
+_LATIN_RE = re.compile("[A-Za-z\u00c0-\u024f]")
+_DIGIT_RE = re.compile("[0-9]")
+# Letters of any script: word characters that are neither digits nor underscores
+_LETTER_RE = re.compile(r"[^\W\d_]")
+
+# A precomposed syllable carries two to three jamo, so it is weighted like
+# several Latin letters when comparing scripts
+HANGUL_SYLLABLE_WEIGHT = 3
+
+class ScriptCounts(NamedTuple):
+    """Character counts per script for a text."""
+
+    hangul_syllables: int
+    hangul_jamo: int
+    hanja: int
+    latin: int
+    digits: int
+    other_letters: int = 0
+
+    @property
+    def hangul_weight(self) -> int:
+        """Hangul content measured in jamo."""
+        return self.hangul_syllables * HANGUL_SYLLABLE_WEIGHT + self.hangul_jamo
+
+    @property
+    def letter_weight(self) -> int:
+        """Weighted count of all letters, including those of other scripts (kana, Cyrillic, ...)."""
+        return self.hangul_weight + self.hanja + self.latin + self.other_letters
+
+def classify_script(text: str) -> ScriptCounts:
+    """Count Hangul, Hanja, Latin, other-script letter and digit characters in a text."""
+    hangul_syllables = len(_HANGUL_SYLLABLE_RE.findall(text))
+    hangul_jamo = len(_HANGUL_JAMO_RE.findall(text))
+    hanja = len(_HANJA_RE.findall(text))
+    latin = len(_LATIN_RE.findall(text))
+    alphabetic = len(_LETTER_RE.findall(text))
+    return ScriptCounts(
+        hangul_syllables=hangul_syllables,
+        hangul_jamo=hangul_jamo,
+        hanja=hanja,
+        latin=latin,
+        digits=len(_DIGIT_RE.findall(text)),
+        other_letters=max(0, alphabetic - hangul_syllables - hangul_jamo - hanja - latin)
+    )
+
+def classify_scripts(texts: List[str]) -> List[ScriptCounts]:
+    """Classify a batch of texts."""
+    return [classify_script(text) for text in texts]
+
+def is_target_language(counts: ScriptCounts, target_language: str, threshold: float = 0.5) -> bool:
+    """
+    Decide whether classified text is already in the target language.
+
+    Text without any alphabetic characters (numbers, punctuation) never
+    needs translation; letters of scripts other than Hangul, Hanja and Latin
+    count against the target language. For Korean, Hanja counts towards
+    Korean only alongside Hangul, as in mixed-script Korean addresses.
+
+    Args:
+        counts: Script counts of the text
+        target_language: Target language code
+        threshold: Minimum weighted share of target-script letters
+
+    Returns:
+        True if translating the text to target_language can be skipped
+    """
+    letters = counts.letter_weight
+    if letters == 0:
+        return True
+
+    if target_language == 'ko':
+        korean = counts.hangul_weight + (counts.hanja if counts.hangul_weight else 0)
+        return korean / letters >= threshold
+    if target_language == 'en':
+        return counts.latin / letters >= threshold
+    return False
+
+def needs_translation(texts: List[str], target_language: str = 'ko') -> List[bool]:
+    """Return, for each text, whether it must be sent for translation."""
+    return [
+        bool(text and text.strip()) and not is_target_language(counts, target_language)
+        for text, counts in zip(texts, classify_scripts(texts))
+    ]
@@ -0,0 +1,65 @@
+"""Single-flight coalescing of identical in-flight calls."""
+
+import threading
+from concurrent.futures import Future
+from typing import Dict, Any, Callable, Hashable
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for and share its result (or exception). Once the call
+    completes the key is released, so later calls run again.
+    """
+
+    def __init__(self):
+        self.executed = 0
+        self.coalesced = 0
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run func once for all concurrent callers with the same key.
+
+        Args:
+            key: Hashable identity of the call
+            func: Function to execute
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Result of func, shared between coalesced callers
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+                self.executed += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Return executed/coalesced call counters."""
+        return {
+            "executed": self.executed,
+            "coalesced": self.coalesced
+        }
@@ -0,0 +1,208 @@
+"""Geohash tile cache for nearby-search results."""
+
+import threading
+import time
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple
+from .cache import BaseCache
+from .geo import (
+    haversine_distance,
+    geohash_encode,
+    geohash_decode,
+    geohash_tile_half_diagonal,
+    geohash_precision_for_radius,
+    place_coordinates
+)
+from .utils import format_location_string
+
+# fetch("lat,lng", radius, page_token) -> (results, next_page_token), or None
+# if page_token was rejected (expired or never valid)
+PageFetch = Callable[[str, int, Optional[str]], Optional[Tuple[List[Dict[str, Any]], Optional[str]]]]
+
+class SpatialTileCache:
+    """
+    Cache nearby-search results per geohash tile.
+
+    A query center is snapped to a geohash tile sized relative to the query
+    radius. The upstream search is issued from the tile center with a radius
+    bucket large enough to cover any query center inside the tile, so nearby
+    queries ("제주" and "제주시") share one cached result set. Cached results
+    are filtered locally by haversine distance from the actual query center.
+
+    Every result page walked for a tile is appended to its entry together
+    with the tile query's ``next_page_token`` and when it was issued, so a
+    later walk resumes where the previous one stopped instead of refetching
+    the first page. Google expires page tokens after a few minutes; older
+    tokens, and tokens Google rejects, restart the walk from the first page,
+    skipping places already cached.
+    """
+
+    # Upstream search radii in meters (Google allows at most 50000)
+    RADIUS_BUCKETS = (500, 1000, 2000, 3000, 5000, 7500, 10000, 15000, 20000, 25000, 30000, 40000, 50000)
+
+    def __init__(self, cache: BaseCache, tile_fraction: float = 0.25, max_radius_ratio: float = 4.0,
+                 page_token_ttl: float = 120.0):
+        """
+        Initialize the tile cache.
+
+        Args:
+            cache: Backing cache storing results per (place type, tile)
+            tile_fraction: Maximum tile half-diagonal as a fraction of the query radius
+            max_radius_ratio: Largest cached radius reused, relative to the covering radius
+            page_token_ttl: Seconds a cached next_page_token is resumed from
+        """
+        self.cache = cache
+        self.tile_fraction = tile_fraction
+        self.max_radius_ratio = max_radius_ratio
+        self.page_token_ttl = page_token_ttl
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self._lock = threading.Lock()
+
+    def search(self, lat: float, lng: float, radius: int, place_type: str,
+               fetch: PageFetch) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return nearby results for a query, fetching the covering tile on a miss.
+
+        Only pages already cached for the tile are returned; further pages
+        are fetched by ``search_pages``.
+
+        Args:
+            lat: Query center latitude
+            lng: Query center longitude
+            radius: Query radius in meters
+            place_type: Google Places type
+            fetch: Callable performing one upstream search page for
+                ("lat,lng", radius, page_token) and returning
+                (results, next_page_token), or None if page_token was rejected
+
+        Returns:
+            Results within radius of the query center, or None if the query is
+            too large to be served from a tile
+        """
+        pages = self.search_pages(lat, lng, radius, place_type, fetch)
+        return None if pages is None else next(pages)
+
+    def search_pages(self, lat: float, lng: float, radius: int, place_type: str,
+                     fetch: PageFetch) -> Optional[Iterator[List[Dict[str, Any]]]]:
+        """
+        Lazily iterate result pages for a query from its covering tile.
+
+        The first page holds everything cached for the tile. Each further
+        page continues the tile query from its cached ``next_page_token``
+        (or from the first page if the token is stale or rejected) and its
+        new places are appended to the cache entry before they are yielded.
+
+        Args:
+            lat: Query center latitude
+            lng: Query center longitude
+            radius: Query radius in meters
+            place_type: Google Places type
+            fetch: Callable performing one upstream search page for
+                ("lat,lng", radius, page_token) and returning
+                (results, next_page_token), or None if page_token was rejected
+
+        Returns:
+            Iterator of result lists within radius of the query center, or
+            None if the query is too large to be served from a tile
+        """
+        precision = geohash_precision_for_radius(radius, lat, self.tile_fraction)
+        tile = geohash_encode(lat, lng, precision)
+        needed = radius + geohash_tile_half_diagonal(precision, lat)
+        buckets = [bucket for bucket in self.RADIUS_BUCKETS if bucket >= needed]
+
+        if not buckets:
+            self._count("bypassed")
+            return None
+
+        return self._iter_tile_pages(lat, lng, radius, place_type, tile, needed, buckets[0], fetch)
+
+    def _iter_tile_pages(self, lat: float, lng: float, radius: int, place_type: str, tile: str,
+                         needed: float, bucket: int, fetch: PageFetch) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the cached tile results, then walk and cache further tile pages."""
+        key = f"{place_type}:{tile}"
+        entry = self.cache.get(key) or {}
+        reusable = [int(r) for r in entry if needed <= int(r) <= needed * self.max_radius_ratio]
+        tile_lat, tile_lng = geohash_decode(tile)
+        tile_location = format_location_string(tile_lat, tile_lng)
+
+        if reusable:
+            self._count("hits")
+            tile_radius = min(reusable)
+            cached = entry[str(tile_radius)]
+            results, page_token = cached["results"], cached["next_page_token"]
+            yield self._filter(results, lat, lng, radius)
+            if page_token is None:
+                return
+            if time.time() - cached["token_time"] > self.page_token_ttl:
+                page_token = None
+        else:
+            self._count("misses")
+            tile_radius, results, page_token = bucket, [], None
+
+        seen_ids = {place.get("place_id") for place in results}
+        for page, next_token in self._walk(tile_location, tile_radius, page_token, fetch):
+            new = [place for place in page if place.get("place_id") not in seen_ids]
+            seen_ids.update(place.get("place_id") for place in new)
+            results = results + new
+            self._store(key, tile_radius, results, next_token)
+            yield self._filter(new, lat, lng, radius)
+
+    def _walk(self, tile_location: str, tile_radius: int, page_token: Optional[str],
+              fetch: PageFetch) -> Iterator[Tuple[List[Dict[str, Any]], Optional[str]]]:
+        """
+        Yield (results, next_page_token) for the tile query from page_token on.
+
+        A None page_token starts from the first page. A rejected token
+        restarts the walk from the first page once; if that walk's own token
+        is rejected too the walk just stops, leaving the tile resumable.
+        """
+        restarted = page_token is None
+        while True:
+            fetched = fetch(tile_location, tile_radius, page_token)
+            if fetched is None:
+                if restarted:
+                    return
+                restarted, page_token = True, None
+                continue
+
+            yield fetched
+            page_token = fetched[1]
+            if page_token is None:
+                return
+
+    def _store(self, key: str, tile_radius: int, results: List[Dict[str, Any]],
+               page_token: Optional[str]) -> None:
+        """Record the pages walked so far for one tile radius."""
+        entry = self.cache.get(key) or {}
+        entry[str(tile_radius)] = {
+            "results": results,
+            "next_page_token": page_token,
+            "token_time": time.time()
+        }
+        self.cache.set(key, entry)
+
+    def _filter(self, results: List[Dict[str, Any]], lat: float, lng: float,
+                radius: int) -> List[Dict[str, Any]]:
+        """Keep results within radius of the query center."""
+        return [place for place in results if self._within(place, lat, lng, radius)]
+
+    def _within(self, place: Dict[str, Any], lat: float, lng: float, radius: int) -> bool:
+        """Check whether a result lies within radius of the query center."""
+        coordinates = place_coordinates(place)
+        if coordinates is None:
+            return True
+        return haversine_distance(lat, lng, coordinates[0], coordinates[1]) <= radius
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return tile hit/miss counters and backing cache statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "cache": self.cache.stats()
+        }
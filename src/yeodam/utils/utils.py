@@ -2,27 +2,29 @@
 
 import os
 import pickle
-from typing import Dict, Any, Optional
+import asyncio
+import functools
+import unicodedata
+from concurrent.futures import Executor
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from ..config import Config
 from ..exceptions import TravelRecommendationError
 
-def load_dynamic_mapping() -> Dict[str, Any]:
+def load_dynamic_mapping(path: Optional[str] = None) -> Dict[str, Any]:
     """Load dynamic mapping from pickle file."""
+    path = path or Config.DYNAMIC_MAPPING_FILE
     try:
-        if os.path.exists(Config.DYNAMIC_MAPPING_FILE):
-            with open(Config.DYNAMIC_MAPPING_FILE, "rb") as f:
+        if os.path.exists(path):
+            with open(path, "rb") as f:
                 return pickle.load(f)
         return {}
     except Exception as e:
         raise TravelRecommendationError(f"동적 매핑 로드 실패: {str(e)}")
 
 def save_dynamic_mapping(dynamic_mapping: Dict[str, Any]) -> None:
-    """Save dynamic mapping to pickle file."""
-    try:
-        with open(Config.DYNAMIC_MAPPING_FILE, "wb") as f:
-            pickle.dump(dynamic_mapping, f)
-    except Exception as e:
-        raise TravelRecommendationError(f"동적 매핑 저장 실패: {str(e)}")
+    """Save dynamic mapping entries to the shared DynamicMappingStore; stored keywords are kept."""
+    from .mapping_store import DynamicMappingStore
+    DynamicMappingStore().put_many(dynamic_mapping)
 
 def validate_coordinates(lat: Optional[float], lng: Optional[float]) -> bool:
     """Validate latitude and longitude coordinates."""
@@ -34,6 +36,39 @@ def format_location_string(lat: float, lng: float) -> str:
     """Format coordinates as location string."""
     return f"{lat},{lng}"
 
+def parse_location_string(location: str) -> Tuple[float, float]:
+    """Parse a "lat,lng" location string into coordinates."""
+    lat, lng = location.split(",")
+    return float(lat), float(lng)
+
+# Administrative suffixes folded by normalize_location_query, longest first.
+# Plain 시/군/도 are kept: "광주시" (Gyeonggi) and "광주광역시" are different places.
+LOCATION_SUFFIXES = ("특별자치도", "특별자치시", "특별시", "광역시")
+
+def normalize_location_query(location: str) -> str:
+    """
+    Normalize a location query for cache and offline-table lookups.
+    
+    Applies NFC normalization, collapses whitespace, lowercases, and folds an
+    unambiguous administrative suffix ("서울특별시" -> "서울",
+    "제주특별자치도" -> "제주") as long as at least two characters remain.
+    Plain 시/군/도 are kept, since e.g. "광주시" is not "광주광역시".
+    """
+    text = " ".join(unicodedata.normalize("NFC", location).split()).lower()
+    for suffix in LOCATION_SUFFIXES:
+        if text.endswith(suffix) and len(text) - len(suffix) >= 2:
+            return text[:-len(suffix)].rstrip()
+    return text
+
+def canonicalize_keywords(keywords: List[str]) -> List[str]:
+    """Normalize (NFC, whitespace, case), deduplicate and sort keywords."""
+    canonical = {
+        " ".join(unicodedata.normalize("NFC", keyword).split()).lower()
+        for keyword in keywords
+    }
+    canonical.discard("")
+    return sorted(canonical)
+
 def safe_get_nested(data: Dict[str, Any], keys: list, default: Any = None) -> Any:
     """Safely get nested dictionary values."""
     for key in keys:
@@ -42,3 +77,8 @@ def safe_get_nested(data: Dict[str, Any], keys: list, default: Any = None) -> An
         else:
             return default
     return data
+
+async def run_blocking(executor: Optional[Executor], func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking callable on an executor without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
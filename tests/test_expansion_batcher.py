@@ -0,0 +1,105 @@
+"""ExpansionBatcher: coalescing, early sends, the alone fast path and error fan-out."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.yeodam.processors.expansion_batcher import ExpansionBatcher
+
+TIMEOUT = 5
+
+class FakeExpander:
+    """expand_batch stand-in recording calls; keywords in ``blocking`` wait for ``release``."""
+
+    def __init__(self, blocking=(), error=None):
+        self.calls = []
+        self.blocking = set(blocking)
+        self.error = error
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, keywords):
+        self.calls.append(list(keywords))
+        if self.blocking & set(keywords):
+            self.entered.set()
+            assert self.release.wait(TIMEOUT)
+        if self.error is not None:
+            raise self.error
+        return {keyword: [keyword, keyword + "+"] for keyword in keywords}
+
+def wait_for(condition):
+    deadline = time.monotonic() + TIMEOUT
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+def test_identical_inflight_keywords_are_sent_once():
+    expander = FakeExpander(blocking={"a"})
+    batcher = ExpansionBatcher(expander, window=TIMEOUT)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        first = pool.submit(batcher.expand, ["a"])
+        assert expander.entered.wait(TIMEOUT)
+        others = [pool.submit(batcher.expand, ["a"]) for _ in range(2)]
+        wait_for(lambda: batcher.stats()["coalesced"] == 2)
+        expander.release.set()
+
+        results = [future.result(TIMEOUT) for future in [first, *others]]
+
+    assert expander.calls == [["a"]]
+    assert results == [{"a": ["a", "a+"]}] * 3
+
+def test_full_batch_is_sent_without_waiting_for_the_window():
+    # A blocked expansion keeps the batcher busy, so the next leader waits out its window
+    expander = FakeExpander(blocking={"busy"})
+    batcher = ExpansionBatcher(expander, window=TIMEOUT, max_batch=2)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        busy = pool.submit(batcher.expand, ["busy"])
+        assert expander.entered.wait(TIMEOUT)
+
+        start = time.monotonic()
+        leader = pool.submit(batcher.expand, ["a"])
+        wait_for(lambda: batcher.stats()["keywords"] == 2)
+        filler = pool.submit(batcher.expand, ["b"])
+
+        assert leader.result(TIMEOUT) == {"a": ["a", "a+"]}
+        assert filler.result(TIMEOUT) == {"b": ["b", "b+"]}
+        assert time.monotonic() - start < TIMEOUT / 2
+
+        expander.release.set()
+        busy.result(TIMEOUT)
+
+    assert expander.calls == [["busy"], ["a", "b"]]
+
+def test_lone_caller_skips_the_window():
+    expander = FakeExpander()
+    batcher = ExpansionBatcher(expander, window=TIMEOUT)
+
+    start = time.monotonic()
+    assert batcher.expand(["a", "b"]) == {"a": ["a", "a+"], "b": ["b", "b+"]}
+
+    assert time.monotonic() - start < TIMEOUT / 2
+    assert expander.calls == [["a", "b"]]
+
+def test_batch_error_reaches_every_waiting_caller():
+    expander = FakeExpander(blocking={"a"}, error=RuntimeError("boom"))
+    batcher = ExpansionBatcher(expander, window=TIMEOUT)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        first = pool.submit(batcher.expand, ["a", "b"])
+        assert expander.entered.wait(TIMEOUT)
+        others = [pool.submit(batcher.expand, ["a"]), pool.submit(batcher.expand, ["b"])]
+        wait_for(lambda: batcher.stats()["coalesced"] == 2)
+        expander.release.set()
+
+        for future in [first, *others]:
+            with pytest.raises(RuntimeError, match="boom"):
+                future.result(TIMEOUT)
+
+    # The failed keywords are no longer in flight and are sent again
+    expander.error = None
+    assert batcher.expand(["a"]) == {"a": ["a", "a+"]}
+    assert expander.calls == [["a", "b"], ["a"]]
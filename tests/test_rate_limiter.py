@@ -0,0 +1,63 @@
+"""RateLimiter: a burst passes at once, then acquisitions follow the rate."""
+
+import pytest
+
+from src.yeodam.utils import rate_limiter
+from src.yeodam.utils.rate_limiter import RateLimiter
+
+class FakeClock:
+    """Stand-in for the time module; sleep advances the clock instead of blocking."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", fake)
+    return fake
+
+def test_burst_then_throttled_rate(clock):
+    limiter = RateLimiter(rate=2, burst=3)
+
+    for _ in range(3):
+        limiter.acquire()
+    assert clock.sleeps == []
+
+    for _ in range(4):
+        limiter.acquire()
+    assert clock.sleeps == [0.5] * 4
+    assert limiter.stats() == {"acquired": 7, "waited": 2.0}
+
+def test_tokens_refill_while_idle(clock):
+    limiter = RateLimiter(rate=4)
+    for _ in range(4):
+        limiter.acquire()
+
+    clock.now += 0.5
+    limiter.acquire()
+    limiter.acquire()
+    assert clock.sleeps == []
+
+    limiter.acquire()
+    assert clock.sleeps == [0.25]
+
+def test_refill_is_capped_at_burst(clock):
+    limiter = RateLimiter(rate=1, burst=2)
+
+    clock.now += 60
+    for _ in range(3):
+        limiter.acquire()
+    assert clock.sleeps == [1.0]
+
+def test_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
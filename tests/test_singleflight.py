@@ -0,0 +1,65 @@
+"""SingleFlight: one call per in-flight key, shared errors, key release."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.yeodam.utils.singleflight import SingleFlight
+
+TIMEOUT = 5
+
+def wait_for(condition):
+    deadline = time.monotonic() + TIMEOUT
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+def run_concurrently(flight, func, callers):
+    """Start one leader blocked in func, join ``callers - 1`` followers, then release it."""
+    entered, release = threading.Event(), threading.Event()
+
+    def blocking():
+        entered.set()
+        assert release.wait(TIMEOUT)
+        return func()
+
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        futures = [pool.submit(flight.do, "key", blocking)]
+        assert entered.wait(TIMEOUT)
+        futures += [pool.submit(flight.do, "key", blocking) for _ in range(callers - 1)]
+        wait_for(lambda: flight.coalesced == callers - 1)
+        release.set()
+        return [future.exception(TIMEOUT) or future.result() for future in futures]
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    calls = []
+
+    results = run_concurrently(flight, lambda: calls.append(1) or "value", callers=4)
+
+    assert results == ["value"] * 4
+    assert calls == [1]
+    assert flight.stats() == {"executed": 1, "coalesced": 3}
+
+def test_exception_reaches_every_caller():
+    flight = SingleFlight()
+    error = RuntimeError("boom")
+
+    def fail():
+        raise error
+
+    assert run_concurrently(flight, fail, callers=3) == [error] * 3
+
+def test_key_is_released_after_the_call():
+    flight = SingleFlight()
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        flight.do("key", fail)
+    assert flight.do("key", lambda: "first") == "first"
+    assert flight.do("key", lambda: "second") == "second"
+    assert flight.stats() == {"executed": 3, "coalesced": 0}
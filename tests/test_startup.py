@@ -0,0 +1,40 @@
+"""Startup budget: importing the CLI and building the recommender stays cheap."""
+
+import json
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("numpy", "pandas", "openai", "requests", "deep_translator")
+
+STARTUP_BUDGET_SECONDS = 0.2
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import travel_recommender
+travel_recommender.TravelRecommender()
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "elapsed": elapsed,
+    "loaded": [name for name in %r if name in sys.modules]
+}))
+""" % (HEAVY_MODULES,)
+
+def run_probe():
+    env = dict(os.environ, GOOGLE_API_KEY="test-google-key", OPENAI_API_KEY="test-openai-key")
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE], cwd=REPO_ROOT, env=env,
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def test_startup_does_not_load_heavy_dependencies():
+    assert run_probe()["loaded"] == []
+
+def test_startup_within_budget():
+    # Best of three, so a cold file-system cache does not fail the run
+    elapsed = min(run_probe()["elapsed"] for _ in range(3))
+    assert elapsed < STARTUP_BUDGET_SECONDS, f"startup took {elapsed * 1000:.0f} ms"
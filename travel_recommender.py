@@ -6,32 +6,179 @@ and OpenAI to suggest places and restaurants based on user preferences.
 """
 
 import os
+import sys
+import argparse
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from dotenv import load_dotenv
-from typing import List, Tuple
+from typing import TYPE_CHECKING, List, Tuple, Dict, Any, Optional
+
+# Config reads YEODAM_* settings at import time, so .env is loaded first
+load_dotenv()
 
 from src.yeodam.config import Config
 from src.yeodam.exceptions import YeodamError as TravelRecommendationError, APIError, ConfigurationError
-from src.yeodam.services.geocoding_service import GeocodingService
-from src.yeodam.services.places_service import PlacesService
-from src.yeodam.processors.keyword_processor import KeywordProcessor
-from src.yeodam.utils.display_service import DisplayService
+
+# Services, caches and their third-party dependencies (requests, openai,
+# numpy, pandas, ...) are imported where they are first constructed, so the
+# CLI reaches its first prompt without loading them
+if TYPE_CHECKING:
+    from src.yeodam.models import PlaceBatch
+    from src.yeodam.server import RecommendationApp
+    from src.yeodam.services.geocoding_service import GeocodingService
+    from src.yeodam.services.places_service import PlacesService
+    from src.yeodam.services.translation_service import TranslationService
+    from src.yeodam.services.http_client import HttpClient
+    from src.yeodam.processors.keyword_processor import KeywordProcessor
+    from src.yeodam.processors.ranking_engine import RankingEngine
+    from src.yeodam.utils.display_service import DisplayService
+    from src.yeodam.utils.cache import BaseCache
+    from src.yeodam.utils.spatial_cache import SpatialTileCache
 
 # LocationNotFoundError는 APIError의 하위 클래스로 처리
 LocationNotFoundError = APIError
 
+class locked_cached_property(cached_property):
+    """
+    cached_property whose first build holds the instance's ``_build_lock``.
+    
+    functools.cached_property has no lock since Python 3.12, so threads
+    racing for a component could each build their own HTTP client, cache or
+    SQLite connection. The lock is reentrant because components build their
+    dependencies; once built, values are plain instance attributes.
+    """
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        with instance._build_lock:
+            return super().__get__(instance, owner)
+
 class TravelRecommender:
     """Main travel recommendation system."""
     
-    def __init__(self):
-        """Initialize the travel recommender with all required services."""
-        load_dotenv()
-        self.config = Config()
+    def __init__(self, stream: Optional[bool] = None):
+        """
+        Initialize the travel recommender.
         
-        # Initialize services
-        self.geocoding_service = GeocodingService(self.config.google_api_key)
-        self.places_service = PlacesService(self.config.google_api_key)
-        self.keyword_processor = KeywordProcessor(self.config.openai_api_key)
-        self.display_service = DisplayService()
+        API keys are validated immediately; caches and services are created
+        on first use, once even when several threads ask for them at once.
+        
+        Args:
+            stream: Show places as they arrive instead of ranked
+                (default: Config.STREAM_RESULTS)
+        """
+        self.config = Config()
+        self.stream = self.config.STREAM_RESULTS if stream is None else stream
+        self._build_lock = threading.RLock()
+        self.google_api_key = self.config.google_api_key
+        self.openai_api_key = self.config.openai_api_key
+    
+    # Caches
+    @locked_cached_property
+    def details_cache(self) -> "BaseCache":
+        from src.yeodam.utils.cache import create_cache
+        return create_cache(
+            "place_details",
+            ttl=self.config.DETAILS_CACHE_TTL,
+            memory_size=self.config.DETAILS_CACHE_MEMORY_SIZE,
+            max_entries=self.config.DETAILS_CACHE_MAX_ENTRIES
+        )
+    
+    @locked_cached_property
+    def geocoding_cache(self) -> "BaseCache":
+        from src.yeodam.utils.cache import create_cache
+        return create_cache(
+            "geocoding",
+            ttl=self.config.GEOCODING_CACHE_TTL,
+            memory_size=self.config.GEOCODING_CACHE_MEMORY_SIZE,
+            max_entries=self.config.GEOCODING_CACHE_MAX_ENTRIES
+        )
+    
+    @locked_cached_property
+    def translation_cache(self) -> "BaseCache":
+        from src.yeodam.utils.cache import create_cache
+        return create_cache(
+            "translations",
+            ttl=self.config.TRANSLATION_CACHE_TTL,
+            memory_size=self.config.TRANSLATION_CACHE_MEMORY_SIZE,
+            max_entries=self.config.TRANSLATION_CACHE_MAX_ENTRIES
+        )
+    
+    @locked_cached_property
+    def expansion_cache(self) -> "BaseCache":
+        from src.yeodam.utils.cache import create_cache
+        return create_cache(
+            "keyword_expansions",
+            ttl=self.config.EXPANSION_CACHE_TTL,
+            memory_size=self.config.EXPANSION_CACHE_MEMORY_SIZE,
+            max_entries=self.config.EXPANSION_CACHE_MAX_ENTRIES
+        )
+    
+    @locked_cached_property
+    def nearby_cache(self) -> "SpatialTileCache":
+        from src.yeodam.utils.cache import create_cache
+        from src.yeodam.utils.spatial_cache import SpatialTileCache
+        return SpatialTileCache(create_cache(
+            "nearby_tiles",
+            ttl=self.config.NEARBY_CACHE_TTL,
+            memory_size=self.config.NEARBY_CACHE_MEMORY_SIZE,
+            max_entries=self.config.NEARBY_CACHE_MAX_ENTRIES
+        ), page_token_ttl=self.config.PAGE_TOKEN_TTL)
+    
+    # Services sharing one pooled HTTP client
+    @locked_cached_property
+    def http_client(self) -> "HttpClient":
+        from src.yeodam.services.http_client import HttpClient
+        from src.yeodam.utils.rate_limiter import RateLimiter
+        return HttpClient(
+            pool_size=max(self.config.HTTP_POOL_SIZE, self.config.MAX_CONCURRENT_REQUESTS),
+            rate_limiter=RateLimiter(self.config.HTTP_RATE_LIMIT) if self.config.HTTP_RATE_LIMIT > 0 else None
+        )
+    
+    @locked_cached_property
+    def geocoding_service(self) -> "GeocodingService":
+        from src.yeodam.services.geocoding_service import GeocodingService
+        return GeocodingService(
+            self.google_api_key,
+            cache=self.geocoding_cache,
+            http_client=self.http_client
+        )
+    
+    @locked_cached_property
+    def places_service(self) -> "PlacesService":
+        from src.yeodam.services.places_service import PlacesService
+        return PlacesService(
+            self.google_api_key,
+            details_cache=self.details_cache,
+            nearby_cache=self.nearby_cache,
+            http_client=self.http_client
+        )
+    
+    @locked_cached_property
+    def keyword_processor(self) -> "KeywordProcessor":
+        from src.yeodam.processors.keyword_processor import KeywordProcessor
+        return KeywordProcessor(self.openai_api_key, expansion_cache=self.expansion_cache)
+    
+    @locked_cached_property
+    def translation_service(self) -> "TranslationService":
+        from src.yeodam.services.translation_service import TranslationService
+        return TranslationService(cache=self.translation_cache)
+    
+    @locked_cached_property
+    def display_service(self) -> "DisplayService":
+        from src.yeodam.utils.display_service import DisplayService
+        return DisplayService(self.translation_service)
+    
+    @locked_cached_property
+    def ranking_engine(self) -> "RankingEngine":
+        from src.yeodam.processors.ranking_engine import RankingEngine
+        from src.yeodam.processors.diversity import DiversitySelector
+        return RankingEngine(
+            diversity=DiversitySelector() if self.config.DIVERSITY_ENABLED else None
+        )
     
     def get_user_input(self) -> Tuple[str, List[str], int, int]:
         """
@@ -76,13 +223,25 @@ class TravelRecommender:
             print(f"확장된 키워드: {expanded_preferences}")
             
             # Map keywords to categories
-            categories = self.keyword_processor.map_keywords_to_categories(expanded_preferences)
+            categories, category_weights = self.keyword_processor.map_keywords_with_weights(expanded_preferences)
             print(f"매핑된 카테고리: {categories}")
             
             # Search for places and restaurants
             print("장소와 레스토랑을 검색하는 중...")
+            search_stats = {}
+            if self.stream:
+                self.stream_results(categories, location_coords, radius, max_results, search_stats)
+                return
+            
             places, restaurants = self.places_service.get_places_by_categories(
-                categories, location_coords, radius, max_results
+                categories, location_coords, radius, max_results, stats=search_stats
+            )
+            print(f"상세 정보 요청 {search_stats['details_requests']}건 "
+                  f"(사전 필터링으로 {search_stats['details_avoided']}건 절약)")
+            
+            # Rank merged results by relevance
+            places, restaurants = self.rank_results(
+                places, restaurants, location_coords, radius, max_results, category_weights
             )
             
             # Display results
@@ -98,6 +257,139 @@ class TravelRecommender:
         except Exception as e:
             print(f"예상치 못한 오류가 발생했습니다: {str(e)}")
     
+    def stream_results(self, categories: List[str], location_coords: str, radius: int,
+                       max_results: int, search_stats: Dict[str, int]) -> None:
+        """
+        Search, translate and display places progressively.
+        
+        Each place is translated on the details worker as soon as it
+        resolves and rendered immediately, in arrival order. Results are
+        not ranked, since ranking needs every candidate first.
+        
+        Args:
+            categories: Mapped place categories
+            location_coords: Search center as "lat,lng"
+            radius: Search radius in meters
+            max_results: Maximum number of places and restaurants
+            search_stats: Dictionary filled with this query's counters
+        """
+        print()
+        stream = self.places_service.iter_places_by_categories(
+            categories, location_coords, radius, max_results,
+            enrich=self.display_service.translate_place, stats=search_stats
+        )
+        self.display_service.display_stream(stream, max_results)
+        print(f"\n상세 정보 요청 {search_stats.get('details_requests', 0)}건 "
+              f"(사전 필터링으로 {search_stats.get('details_avoided', 0)}건 절약)")
+    
+    def rank_results(self, places: "PlaceBatch", restaurants: "PlaceBatch",
+                     location_coords: str, radius: int, max_results: int,
+                     category_weights: Dict[str, float]) -> Tuple["PlaceBatch", "PlaceBatch"]:
+        """
+        Keep the max_results most relevant places and restaurants.
+        
+        Args:
+            places: Merged place candidates
+            restaurants: Restaurant candidates
+            location_coords: Search center as "lat,lng"
+            radius: Search radius in meters
+            max_results: Number of places and restaurants to keep
+            category_weights: Weight per category for match strength
+            
+        Returns:
+            Tuple of (places, restaurants), best first
+        """
+        from src.yeodam.utils.utils import parse_location_string
+        
+        center = parse_location_string(location_coords)
+        return (
+            self.ranking_engine.rank(places, center, radius, category_weights, k=max_results),
+            self.ranking_engine.rank(restaurants, center, radius, k=max_results)
+        )
+    
+    def recommend(self, location: str, preferences: List[str],
+                  radius: Optional[int] = None, max_results: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Build ranked, translated recommendations without printing anything.
+        
+        Safe to call from several threads at once; all calls share this
+        recommender's clients and caches.
+        
+        Args:
+            location: Name of the location to search
+            preferences: List of user preferences
+            radius: Search radius in meters (default: Config.DEFAULT_RADIUS)
+            max_results: Maximum number of results (default: Config.DEFAULT_MAX_RESULTS)
+        
+        Returns:
+            Dictionary with location coordinates, expanded keywords, categories,
+            and translated places and restaurants
+        
+        Raises:
+            YeodamError: If any stage of the pipeline fails
+        """
+        radius = radius or self.config.DEFAULT_RADIUS
+        max_results = max_results or self.config.DEFAULT_MAX_RESULTS
+        
+        location_coords = self.geocoding_service.get_location_coordinates(location)
+        expanded_preferences = self.keyword_processor.expand_keywords(preferences)
+        categories, category_weights = self.keyword_processor.map_keywords_with_weights(expanded_preferences)
+        
+        places, restaurants = self.places_service.get_places_by_categories(
+            categories, location_coords, radius, max_results
+        )
+        places, restaurants = self.rank_results(
+            places, restaurants, location_coords, radius, max_results, category_weights
+        )
+        
+        return {
+            "location": location_coords,
+            "keywords": expanded_preferences,
+            "categories": categories,
+            "places": self._translate_places(places),
+            "restaurants": self._translate_places(restaurants)
+        }
+    
+    def _translate_places(self, places: "PlaceBatch") -> "PlaceBatch":
+        """Translate place names and addresses in one batch."""
+        translated = self.translation_service.translate_batch(places.names + places.formatted_addresses)
+        return places.with_text(translated[:len(places)], translated[len(places):])
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Collect counters of the services and caches created so far.
+        
+        Components that have not been used yet are left out rather than
+        created just to report on them.
+        
+        Returns:
+            Dictionary of per-component counter dictionaries
+        """
+        built = self.__dict__
+        stats: Dict[str, Any] = {}
+        if "http_client" in built:
+            stats["http"] = self.http_client.stats()
+            if self.http_client.rate_limiter is not None:
+                stats["rate_limiter"] = self.http_client.rate_limiter.stats()
+        if "places_service" in built:
+            stats["places"] = dict(self.places_service.stats)
+        if "translation_service" in built:
+            stats["translation"] = dict(self.translation_service.stats)
+        if "keyword_processor" in built:
+            if self.keyword_processor.local_expander is not None:
+                stats["local_expansion"] = dict(self.keyword_processor.local_expander.stats)
+            if self.keyword_processor.expansion_batcher is not None:
+                stats["expansion_batcher"] = self.keyword_processor.expansion_batcher.stats()
+        for name in ("details_cache", "geocoding_cache", "translation_cache", "expansion_cache", "nearby_cache"):
+            if name in built:
+                stats[name] = built[name].stats()
+        return stats
+    
+    def close(self) -> None:
+        """Close pooled HTTP connections, if any were opened."""
+        if "http_client" in self.__dict__:
+            self.http_client.close()
+    
     def run(self) -> None:
         """Run the travel recommendation system."""
         print("=== 여행 추천 시스템 ===")
@@ -121,10 +413,211 @@ class TravelRecommender:
         except Exception as e:
             print(f"프로그램 실행 중 오류가 발생했습니다: {str(e)}")
 
+class AsyncTravelRecommender:
+    """Asyncio travel recommendation pipeline.
+    
+    Wraps the services of a TravelRecommender so that independent stages
+    (geocoding and keyword expansion, per-place translation) overlap, and
+    many recommendations can be served concurrently from one event loop.
+    """
+    
+    def __init__(self, recommender: Optional[TravelRecommender] = None, 
+                 max_workers: Optional[int] = None):
+        """
+        Initialize the async recommender.
+        
+        Args:
+            recommender: Recommender whose services are reused (created if omitted)
+            max_workers: Maximum number of blocking service calls in flight
+        """
+        self._owns_recommender = recommender is None
+        self.recommender = recommender or TravelRecommender()
+        self.config = self.recommender.config
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or self.config.MAX_CONCURRENT_REQUESTS)
+        
+        # Initialize async services
+        from src.yeodam.services.async_services import (
+            AsyncGeocodingService, AsyncPlacesService, AsyncTranslationService
+        )
+        from src.yeodam.processors.async_keyword_processor import AsyncKeywordProcessor
+        self.geocoding_service = AsyncGeocodingService(self.recommender.geocoding_service, self.executor)
+        self.places_service = AsyncPlacesService(self.recommender.places_service, self.executor)
+        self.keyword_processor = AsyncKeywordProcessor(self.recommender.keyword_processor, self.executor)
+        self.translation_service = AsyncTranslationService(self.recommender.translation_service, self.executor)
+    
+    async def recommend(self, location: str, preferences: List[str], 
+                        radius: Optional[int] = None, max_results: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Build travel recommendations for a location and preferences.
+        
+        Args:
+            location: Name of the location to search
+            preferences: List of user preferences
+            radius: Search radius in meters (default: Config.DEFAULT_RADIUS)
+            max_results: Maximum number of results (default: Config.DEFAULT_MAX_RESULTS)
+            
+        Returns:
+            Dictionary with location coordinates, expanded keywords, categories,
+            and translated places and restaurants
+            
+        Raises:
+            YeodamError: If any stage of the pipeline fails
+        """
+        radius = radius or self.config.DEFAULT_RADIUS
+        max_results = max_results or self.config.DEFAULT_MAX_RESULTS
+        
+        # Geocoding and keyword expansion are independent
+        location_coords, expanded_preferences = await asyncio.gather(
+            self.geocoding_service.get_location_coordinates(location),
+            self.keyword_processor.expand_keywords(preferences)
+        )
+        categories, category_weights = await self.keyword_processor.map_keywords_with_weights(
+            expanded_preferences
+        )
+        
+        places, restaurants = await self.places_service.get_places_by_categories(
+            categories, location_coords, radius, max_results
+        )
+        places, restaurants = self.recommender.rank_results(
+            places, restaurants, location_coords, radius, max_results, category_weights
+        )
+        places, restaurants = await asyncio.gather(
+            self._translate_places(places),
+            self._translate_places(restaurants)
+        )
+        
+        return {
+            "location": location_coords,
+            "keywords": expanded_preferences,
+            "categories": categories,
+            "places": places,
+            "restaurants": restaurants
+        }
+    
+    async def _translate_places(self, places: "PlaceBatch") -> "PlaceBatch":
+        """Translate place names and addresses in one batch."""
+        translated = await self.translation_service.translate_batch(places.names + places.formatted_addresses)
+        return places.with_text(translated[:len(places)], translated[len(places):])
+    
+    def stats(self) -> Dict[str, Any]:
+        """Collect counters of the underlying services and caches."""
+        return self.recommender.stats()
+    
+    def close(self) -> None:
+        """Release the executor, and the recommender if it was created here."""
+        self.executor.shutdown(wait=False)
+        if self._owns_recommender:
+            self.recommender.close()
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser; without a subcommand the interactive mode runs."""
+    parser = argparse.ArgumentParser(description="여행 추천 시스템")
+    parser.add_argument("--stream", action="store_true",
+                        help="순위 없이 도착하는 순서대로 결과를 표시합니다 (기본값: YEODAM_STREAM)")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    batch = subparsers.add_parser("batch", help="CSV/JSONL 파일의 질의를 일괄 처리합니다")
+    batch.add_argument("input", help="질의 파일 (.csv 또는 .jsonl)")
+    batch.add_argument("output", help="결과 파일 (.jsonl) 또는 Parquet 디렉터리 (.parquet)")
+    batch.add_argument("--format", choices=["jsonl", "parquet"], help="출력 형식 (기본값: 출력 경로로 판단)")
+    batch.add_argument("--workers", type=int, help=f"동시 처리 질의 수 (기본값 {Config.BATCH_MAX_WORKERS})")
+    batch.add_argument("--rate-limit", type=float,
+                       help="초당 Google API 요청 수 상한 (기본값: YEODAM_HTTP_RATE_LIMIT, 0은 무제한)")
+    batch.add_argument("--no-resume", action="store_true", help="체크포인트를 무시하고 처음부터 다시 실행합니다")
+    
+    serve = subparsers.add_parser("serve", help="HTTP 추천 서버를 실행합니다 (uvicorn 필요)")
+    serve.add_argument("--host", default=Config.SERVER_HOST, help=f"바인드 주소 (기본값 {Config.SERVER_HOST})")
+    serve.add_argument("--port", type=int, default=Config.SERVER_PORT, help=f"포트 (기본값 {Config.SERVER_PORT})")
+    serve.add_argument("--max-concurrency", type=int,
+                       help=f"동시 처리 요청 수 (기본값 {Config.SERVER_MAX_CONCURRENCY})")
+    return parser
+
+def create_app(max_concurrency: Optional[int] = None) -> "RecommendationApp":
+    """
+    Build the ASGI application, e.g. for ``uvicorn travel_recommender:create_app --factory``.
+    
+    Every admitted recommendation holds an executor thread for its whole
+    places search, so the recommender's executor gets one worker per
+    concurrent request; a smaller pool would queue admitted requests with
+    no timeout.
+    
+    Args:
+        max_concurrency: Recommendations computed at once (default: Config.SERVER_MAX_CONCURRENCY)
+        
+    Returns:
+        ASGI application sharing one AsyncTravelRecommender per process
+    """
+    from src.yeodam.server import RecommendationApp
+    max_concurrency = max_concurrency or Config.SERVER_MAX_CONCURRENCY
+    return RecommendationApp(
+        lambda: AsyncTravelRecommender(max_workers=max(max_concurrency, Config.MAX_CONCURRENT_REQUESTS)),
+        max_concurrency=max_concurrency
+    )
+
+def run_server(args: argparse.Namespace) -> int:
+    """
+    Run the serve subcommand.
+    
+    Returns:
+        Process exit code: 1 if the server could not start
+    """
+    try:
+        import uvicorn
+    except ImportError:
+        print("서버 실행 실패: uvicorn 패키지가 필요합니다 (pip install uvicorn).")
+        return 1
+    
+    # Fail fast on missing API keys instead of at lifespan startup
+    try:
+        TravelRecommender()
+    except (ConfigurationError, ValueError) as e:
+        print(f"서버 설정 오류: {str(e)}")
+        return 1
+    
+    uvicorn.run(create_app(args.max_concurrency), host=args.host, port=args.port)
+    return 0
+
+def run_batch(args: argparse.Namespace) -> int:
+    """
+    Run the batch subcommand.
+    
+    Returns:
+        Process exit code: 1 if the batch could not run or any query failed
+    """
+    from src.yeodam.batch import BatchRunner
+    from src.yeodam.utils.rate_limiter import RateLimiter
+    
+    try:
+        recommender = TravelRecommender()
+        if args.rate_limit is not None:
+            recommender.http_client.rate_limiter = RateLimiter(args.rate_limit) if args.rate_limit > 0 else None
+        
+        runner = BatchRunner(recommender, max_workers=args.workers)
+        stats = runner.run(args.input, args.output, output_format=args.format, resume=not args.no_resume)
+    except ConfigurationError as e:
+        print(f"일괄 처리 설정 오류: {str(e)}")
+        return 1
+    except OSError as e:
+        print(f"입출력 파일 오류: {str(e)}")
+        return 1
+    except (TravelRecommendationError, ValueError) as e:
+        print(f"일괄 처리 실패: {str(e)}")
+        return 1
+    
+    print(f"\n일괄 처리 완료: 전체 {stats['total']}건, 성공 {stats['succeeded']}건, "
+          f"실패 {stats['failed']}건, 건너뜀 {stats['skipped']}건")
+    return 1 if stats["failed"] else 0
+
 def main():
     """Main entry point."""
+    args = build_parser().parse_args()
+    if args.command == "batch":
+        sys.exit(run_batch(args))
+    if args.command == "serve":
+        sys.exit(run_server(args))
+    
     try:
-        recommender = TravelRecommender()
+        recommender = TravelRecommender(stream=args.stream or None)
         recommender.run()
     except Exception as e:
         print(f"시스템 초기화 실패: {str(e)}")